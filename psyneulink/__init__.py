@@ -20,12 +20,28 @@ please contact psyneulinkhelp@princeton.edu.
 '''
 
 import logging as _logging
+import os as _os
 
 import numpy as _numpy
+import typecheck as _tc
+
+# Typechecking of the arguments of decorated constructors and methods is on by default.  It is selected once at
+# import time using the PNL_TYPECHECK environment variable:  if it is "0", the decorators install the undecorated
+# functions instead, so that construction-heavy workloads skip the runtime type introspection.
+typecheck_enabled = str(_os.environ.get("PNL_TYPECHECK", "1")) != "0"
+
+_typecheck = _tc.typecheck
+if not typecheck_enabled:
+    _tc.typecheck = lambda method, **kwargs: method
 
 # starred imports to allow user imports from top level
-from . import core
-from . import library
+try:
+    from . import core
+    from . import library
+finally:
+    # only decorators applied while importing PsyNeuLink are affected
+    _tc.typecheck = _typecheck
+    del _typecheck
 
 from ._version import get_versions
 from .core import *
@@ -39,6 +55,9 @@ __all__ = list(_pnl_global_names)
 __all__.extend(core.__all__)
 __all__.extend(library.__all__)
 
+# Names whose modules import heavy optional dependencies are imported when first accessed (see lazy_attributes)
+core.globals.utilities.lazy_attributes(__name__, library.compositions._lazy_exports)
+
 # set __version__ based on versioneer
 __version__ = get_versions()['version']
 del get_versions
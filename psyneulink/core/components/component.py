@@ -421,7 +421,7 @@ from psyneulink.core.globals.parameters import Defaults, Parameter, ParameterAli
 from psyneulink.core.globals.preferences.componentpreferenceset import ComponentPreferenceSet, kpVerbosePref
 from psyneulink.core.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel, PreferenceSet
 from psyneulink.core.globals.registry import register_category
-from psyneulink.core.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, convert_all_elements_to_np_array, convert_to_np_array, get_deepcopy_with_shared, is_instance_or_subclass, is_matrix, iscompatible, kwCompatibilityLength, prune_unused_args, unproxy_weakproxy
+from psyneulink.core.globals.utilities import ContentAddressableList, ReadOnlyOrderedDict, convert_all_elements_to_np_array, convert_to_np_array, get_deepcopy_with_shared, is_instance_or_subclass, is_matrix, is_sparse_matrix, iscompatible, kwCompatibilityLength, prune_unused_args, unproxy_weakproxy
 from psyneulink.core.scheduling.condition import Never
 
 __all__ = [
@@ -1214,7 +1214,13 @@ class Component(object, metaclass=ComponentsMeta):
             builder.debug_metadata = metadata
 
 
-            builder = self._gen_llvm_function_body(ctx, builder, params, context, arg_in, arg_out)
+            try:
+                builder = self._gen_llvm_function_body(ctx, builder, params, context, arg_in, arg_out)
+            except Exception:
+                # Don't leave the partially generated function behind,
+                # it would make the whole module fail to parse
+                del ctx.module.globals[llvm_func.name]
+                raise
 
             builder.ret_void()
 
@@ -1721,6 +1727,9 @@ class Component(object, metaclass=ComponentsMeta):
             param_value = self.user_params[param_name]
             if isinstance(param_value, (str, np.ndarray, tuple)):
                 self.user_params_for_instantiation[param_name] = param_value
+            # sparse matrices are iterable, but can't be constructed empty and filled by index
+            elif is_sparse_matrix(param_value):
+                self.user_params_for_instantiation[param_name] = param_value.copy()
             elif isinstance(param_value, Iterable):
                 self.user_params_for_instantiation[param_name] = type(self.user_params[param_name])()
                 # DICT
@@ -3144,8 +3153,10 @@ class Component(object, metaclass=ComponentsMeta):
     @property
     def prefs(self):
         # Whenever pref is accessed, use current owner as context (for level checking)
-        self._prefs.owner = self
-        return self._prefs
+        prefs = self._prefs
+        if prefs.owner is not self:
+            prefs.owner = self
+        return prefs
 
     @prefs.setter
     def prefs(self, pref_set):
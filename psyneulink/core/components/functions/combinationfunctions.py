@@ -113,6 +113,33 @@ class CombinationFunction(Function_Base):
     def additive(self, val):
         setattr(self, self.additive_param, val)
 
+    def _gen_llvm_load_param(self, ctx, builder, params, param, index, default):
+        """Return the value of **param** that applies to item **index**, or **default** if it is not specified"""
+        param_ptr = ctx.get_param_ptr(self, builder, params, param)
+        param_t = param_ptr.type.pointee
+        if isinstance(param_t, pnlvm.ir.LiteralStructType):
+            assert len(param_t) == 0
+            return ctx.float_ty(default)
+
+        # Strip single element wrappers (e.g. of a ParameterState) around arrays
+        while isinstance(param_t, pnlvm.ir.ArrayType) and len(param_t) == 1 and \
+                isinstance(param_t.element, pnlvm.ir.ArrayType):
+            param_ptr = builder.gep(param_ptr, [ctx.int32_ty(0), ctx.int32_ty(0)])
+            param_t = param_ptr.type.pointee
+
+        # Scalars and single element arrays apply to every item
+        if isinstance(param_t, pnlvm.ir.ArrayType):
+            idx = index if len(param_t) > 1 else ctx.int32_ty(0)
+            param_ptr = builder.gep(param_ptr, [ctx.int32_ty(0), idx])
+            param_t = param_ptr.type.pointee
+
+        while isinstance(param_t, pnlvm.ir.ArrayType):
+            assert len(param_t) == 1
+            param_ptr = builder.gep(param_ptr, [ctx.int32_ty(0), ctx.int32_ty(0)])
+            param_t = param_ptr.type.pointee
+
+        return builder.load(param_ptr)
+
 
 class Reduce(CombinationFunction):  # ------------------------------------------------------------------------
     # FIX: CONFIRM THAT 1D KWEIGHTS USES EACH ELEMENT TO SCALE CORRESPONDING VECTOR IN VARIABLE
@@ -166,12 +193,14 @@ class Reduce(CombinationFunction):  # ------------------------------------------
         specifies whether to sum or multiply the elements in `variable <Reduce.function.variable>` of
         `function <Reduce.function>`.
 
-    scale : float
-        specifies a value by which to multiply each element of the output of `function <Reduce.function>`
+    scale : float or list or np.ndarray
+        specifies a value by which to multiply each element of the output of `function <Reduce.function>`;
+        an array must have one element per item of `variable <Reduce.function.variable>`
         (see `scale <Reduce.scale>` for details)
 
-    offset : float
-        specifies a value to add to each element of the output of `function <Reduce.function>`
+    offset : float or list or np.ndarray
+        specifies a value to add to each element of the output of `function <Reduce.function>`;
+        an array must have one element per item of `variable <Reduce.function.variable>`
         (see `offset <Reduce.offset>` for details)
 
     params : Dict[param keyword: param value] : default None
@@ -198,14 +227,16 @@ class Reduce(CombinationFunction):  # ------------------------------------------
         determines whether elements of each array in `variable <Reduce.function.variable>` of
         `function <Reduce.function>` are summmed or multiplied.
 
-    scale : float
+    scale : float or np.ndarray
         value is applied multiplicatively to each element of the array after applying the `operation <Reduce.operation>`
         (see `scale <Reduce.scale>` for details);  this done before applying the `offset <Reduce.offset>`
-        (if it is specified).
+        (if it is specified).  If it is an array, each element is applied to the result for the corresponding item
+        of `variable <Reduce.function.variable>`.
 
-    offset : float
+    offset : float or np.ndarray
         value is added to each element of the array after applying the `operation <Reduce.operation>`
-        and `scale <Reduce.scale>` (if it is specified).
+        and `scale <Reduce.scale>` (if it is specified).  If it is an array, each element is added to the result
+        for the corresponding item of `variable <Reduce.function.variable>`.
 
     owner : Component
         `component <Component>` to which the Function has been assigned.
@@ -313,7 +344,7 @@ class Reduce(CombinationFunction):  # ------------------------------------------
         """Validate weghts, exponents, scale and offset parameters
 
         Check that WEIGHTS and EXPONENTS are lists or np.arrays of numbers with length equal to variable.
-        Check that SCALE and OFFSET are scalars.
+        Check that SCALE and OFFSET are scalars or 1d arrays with one element per item of variable.
 
         Note: the checks of compatibility with variable are only performed for validation calls during execution
               (i.e., from check_args(), since during initialization or COMMAND_LINE assignment,
@@ -340,15 +371,21 @@ class Reduce(CombinationFunction):  # ------------------------------------------
                     raise FunctionError("Number of exponents ({0}) does not equal number of elements in variable ({1})".
                                         format(len(target_set[EXPONENTS]), len(self.defaults.variable)))
 
-        if SCALE in target_set and target_set[SCALE] is not None:
-            scale = target_set[SCALE]
-            if not isinstance(scale, numbers.Number):
-                raise FunctionError("{} param of {} ({}) must be a scalar".format(SCALE, self.name, scale))
-
-        if OFFSET in target_set and target_set[OFFSET] is not None:
-            offset = target_set[OFFSET]
-            if not isinstance(offset, numbers.Number):
-                raise FunctionError("{} param of {} ({}) must be a scalar".format(OFFSET, self.name, offset))
+        for param in (SCALE, OFFSET):
+            if param in target_set and target_set[param] is not None:
+                value = target_set[param]
+                if isinstance(value, numbers.Number):
+                    continue
+                self._validate_parameter_spec(value, param, numeric_only=True)
+                value = target_set[param] = np.array(value)
+                if value.ndim != 1:
+                    raise FunctionError("{} param of {} ({}) must be a scalar or a 1d array".
+                                        format(param, self.name, value))
+                if self.context.execution_phase & (ContextFlags.PROCESSING | ContextFlags.LEARNING):
+                    if len(value) != len(np.atleast_2d(self.defaults.variable)):
+                        raise FunctionError("Length of {} param of {} ({}) does not equal number of items in "
+                                            "variable ({})".format(param, self.name, len(value),
+                                                                   len(np.atleast_2d(self.defaults.variable))))
 
     def function(self,
                  variable=None,
@@ -419,6 +456,53 @@ class Reduce(CombinationFunction):  # ------------------------------------------
 
         return self.convert_output_type(result)
 
+    def __gen_llvm_reduce(self, builder, index, ctx, vi, vo, params):
+        row_ptr = builder.gep(vi, [ctx.int32_ty(0), index])
+        exponents_ptr = ctx.get_param_ptr(self, builder, params, EXPONENTS)
+        has_exponents = not isinstance(exponents_ptr.type.pointee, pnlvm.ir.LiteralStructType)
+        pow_f = ctx.get_builtin("pow", [ctx.float_ty])
+
+        # assume operation does not change dynamically
+        operation = self.get_current_function_param(OPERATION)
+        res_ptr = builder.alloca(ctx.float_ty)
+        builder.store(ctx.float_ty(0.0 if operation == SUM else 1.0), res_ptr)
+
+        with pnlvm.helpers.array_ptr_loop(builder, row_ptr, "reduce_row") as (b, i):
+            val = b.load(b.gep(row_ptr, [ctx.int32_ty(0), i]))
+            if has_exponents:
+                exponent = self._gen_llvm_load_param(ctx, b, params, EXPONENTS, i, 1.0)
+                val = b.call(pow_f, [val, exponent])
+            weight = self._gen_llvm_load_param(ctx, b, params, WEIGHTS, i, 1.0)
+            val = b.fmul(val, weight)
+
+            res = b.load(res_ptr)
+            res = b.fadd(res, val) if operation == SUM else b.fmul(res, val)
+            b.store(res, res_ptr)
+
+        # Array scale and offset apply to the corresponding item of the variable
+        scale = self._gen_llvm_load_param(ctx, builder, params, SCALE, index, 1.0)
+        offset = self._gen_llvm_load_param(ctx, builder, params, OFFSET, index, 0.0)
+        res = builder.fmul(builder.load(res_ptr), scale)
+        res = builder.fadd(res, offset)
+        builder.store(res, builder.gep(vo, [ctx.int32_ty(0), index]))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        operation = self.get_current_function_param(OPERATION)
+        if operation not in {SUM, PRODUCT}:
+            raise FunctionError("Unrecognized operator ({0}) for Reduce function".format(operation))
+
+        # Each item of 2d variable is reduced to a single value,
+        # 1d variable is treated as a single item
+        if not isinstance(arg_in.type.pointee.element, pnlvm.ir.ArrayType):
+            arg_in = builder.bitcast(arg_in, pnlvm.ir.ArrayType(arg_in.type.pointee, 1).as_pointer())
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+        assert len(arg_in.type.pointee) == len(arg_out.type.pointee)
+
+        with pnlvm.helpers.array_ptr_loop(builder, arg_in, "reduce") as (b, i):
+            self.__gen_llvm_reduce(b, i, ctx, arg_in, arg_out, params)
+
+        return builder
+
 
 class LinearCombination(
     CombinationFunction):  # ------------------------------------------------------------------------
@@ -1459,6 +1543,59 @@ class CombineMeans(CombinationFunction):  # ------------------------------------
 
         return self.convert_output_type(result)
 
+    def _get_output_struct_type(self, ctx):
+        # FIXME: The result is a 1d object array, which Mechanisms do not
+        #        convert to 2d. Use the 2d shape the OutputStates expect.
+        default_val = np.atleast_2d(np.asfarray(self.defaults.value.tolist()))
+        return ctx.convert_python_struct_to_llvm_ir(default_val)
+
+    def __gen_llvm_mean(self, builder, ctx, item_ptr):
+        sum_ptr = builder.alloca(ctx.float_ty)
+        builder.store(ctx.float_ty(0), sum_ptr)
+        with pnlvm.helpers.array_ptr_loop(builder, item_ptr, "mean") as (b, i):
+            val = b.load(b.gep(item_ptr, [ctx.int32_ty(0), i]))
+            b.store(b.fadd(b.load(sum_ptr), val), sum_ptr)
+
+        return builder.fdiv(builder.load(sum_ptr), ctx.float_ty(len(item_ptr.type.pointee)))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        # assume operation does not change dynamically
+        operation = self.get_current_function_param(OPERATION)
+        if operation not in {SUM, PRODUCT}:
+            raise FunctionError("Unrecognized operator ({0}) for CombineMeans function".format(operation))
+
+        exponents_ptr = ctx.get_param_ptr(self, builder, params, EXPONENTS)
+        has_exponents = not isinstance(exponents_ptr.type.pointee, pnlvm.ir.LiteralStructType)
+        pow_f = ctx.get_builtin("pow", [ctx.float_ty])
+
+        res_ptr = builder.alloca(ctx.float_ty)
+        builder.store(ctx.float_ty(0.0 if operation == SUM else 1.0), res_ptr)
+
+        with pnlvm.helpers.array_ptr_loop(builder, arg_in, "combine_means") as (b, i):
+            val = self.__gen_llvm_mean(b, ctx, b.gep(arg_in, [ctx.int32_ty(0), i]))
+            if has_exponents:
+                exponent = self._gen_llvm_load_param(ctx, b, params, EXPONENTS, i, 1.0)
+                val = b.call(pow_f, [val, exponent])
+            weight = self._gen_llvm_load_param(ctx, b, params, WEIGHTS, i, 1.0)
+            val = b.fmul(val, weight)
+
+            res = b.load(res_ptr)
+            res = b.fadd(res, val) if operation == SUM else b.fmul(res, val)
+            b.store(res, res_ptr)
+
+        scale = self._gen_llvm_load_param(ctx, builder, params, SCALE, ctx.int32_ty(0), 1.0)
+        offset = self._gen_llvm_load_param(ctx, builder, params, OFFSET, ctx.int32_ty(0), 0.0)
+        res = builder.fmul(builder.load(res_ptr), scale)
+        res = builder.fadd(res, offset)
+
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+        if isinstance(arg_out.type.pointee, pnlvm.ir.ArrayType):
+            assert len(arg_out.type.pointee) == 1
+            arg_out = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        builder.store(res, arg_out)
+
+        return builder
+
     @property
     def offset(self):
         if not hasattr(self, '_offset'):
@@ -1658,3 +1795,28 @@ class PredictionErrorDeltaFunction(CombinationFunction):
             delta[t] = reward[t] + gamma * sample[t] - sample[t - 1]
 
         return self.convert_output_type(delta)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        gamma = self._gen_llvm_load_param(ctx, builder, params, GAMMA, ctx.int32_ty(0), 1.0)
+        sample_ptr = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        reward_ptr = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(1)])
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+        assert len(arg_out.type.pointee) == len(sample_ptr.type.pointee)
+
+        # There is no previous sample for the first element
+        builder.store(ctx.float_ty(0), builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)]))
+
+        start = ctx.int32_ty(1)
+        stop = ctx.int32_ty(len(arg_out.type.pointee))
+        with pnlvm.helpers.for_loop(builder, start, stop, ctx.int32_ty(1), "delta") as (b, t):
+            prev_t = b.sub(t, ctx.int32_ty(1))
+            sample = b.load(b.gep(sample_ptr, [ctx.int32_ty(0), t]))
+            prev_sample = b.load(b.gep(sample_ptr, [ctx.int32_ty(0), prev_t]))
+            reward = b.load(b.gep(reward_ptr, [ctx.int32_ty(0), t]))
+
+            delta = b.fmul(gamma, sample)
+            delta = b.fadd(reward, delta)
+            delta = b.fsub(delta, prev_sample)
+            b.store(delta, b.gep(arg_out, [ctx.int32_ty(0), t]))
+
+        return builder
@@ -28,6 +28,7 @@ from enum import IntEnum
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.function import \
     Function_Base, FunctionError, MULTIPLICATIVE_PARAM, ADDITIVE_PARAM
 from psyneulink.core.globals.keywords import \
@@ -35,7 +36,7 @@ from psyneulink.core.globals.keywords import \
     BETA, UNIFORM_DIST_FUNCTION, LOW, HIGH, GAMMA_DIST_FUNCTION, SCALE, DIST_SHAPE, WALD_DIST_FUNCTION, NOISE, \
     DRIFT_DIFFUSION_ANALYTICAL_FUNCTION
 from psyneulink.core.globals.context import ContextFlags
-from psyneulink.core.globals.utilities import parameter_spec
+from psyneulink.core.globals.utilities import parameter_spec, get_global_seed
 from psyneulink.core.globals.preferences.componentpreferenceset import is_pref_set
 
 from psyneulink.core.globals.parameters import Parameter
@@ -47,12 +48,74 @@ __all__ = ['DistributionFunction', 'NormalDist', 'UniformDist', 'UniformToNormal
 class DistributionFunction(Function_Base):
     componentType = DIST_FUNCTION_TYPE
 
+    def _get_random_state(self, seed):
+        """Return the RandomState from which the function draws its samples, and make it a stateful attribute
+
+        If **seed** is None, the global seed is used.
+        """
+        if seed is None:
+            seed = get_global_seed()
+
+        if not hasattr(self, "stateful_attributes"):
+            self.stateful_attributes = ["random_state"]
+        return np.random.RandomState(np.asarray([seed]))
+
+    def _instantiate_value(self, context=None):
+        # Don't let the sample drawn to determine the value of the function advance its random_state,
+        # so that its executions return the sequence of samples for the seed
+        try:
+            random_state = self.parameters.random_state.get()
+        except AttributeError:
+            return super()._instantiate_value(context=context)
+
+        state = random_state.get_state()
+        super()._instantiate_value(context=context)
+        random_state.set_state(state)
+
+    def _gen_llvm_load_param(self, ctx, builder, params, param):
+        param_ptr = ctx.get_param_ptr(self, builder, params, param)
+        return pnlvm.helpers.load_extract_scalar_array_one(builder, param_ptr)
+
+    def _gen_llvm_uniform(self, ctx, builder, random_state):
+        sample_ptr = builder.alloca(ctx.float_ty)
+        rand_f = ctx.get_llvm_function("__pnl_builtin_mt_rand_double")
+        builder.call(rand_f, [random_state, sample_ptr])
+        return builder.load(sample_ptr)
+
+    def _gen_llvm_normal(self, ctx, builder, random_state):
+        sample_ptr = builder.alloca(ctx.float_ty)
+        normal_f = ctx.get_llvm_function("__pnl_builtin_mt_rand_normal")
+        builder.call(normal_f, [random_state, sample_ptr])
+        return builder.load(sample_ptr)
+
+    def _gen_llvm_exponential(self, ctx, builder, random_state):
+        log_f = ctx.get_builtin("log", [ctx.float_ty])
+        sample = self._gen_llvm_uniform(ctx, builder, random_state)
+        sample = builder.fsub(ctx.float_ty(1), sample)
+        return pnlvm.helpers.fneg(builder, builder.call(log_f, [sample]))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        random_state = ctx.get_state_ptr(self, builder, state, "random_state")
+
+        # Distribution functions return a single sample; when the output is an array
+        # every element is an independent sample
+        if isinstance(arg_out.type.pointee, pnlvm.ir.ArrayType):
+            arg_out = ctx.unwrap_2d_array(builder, arg_out)
+            with pnlvm.helpers.array_ptr_loop(builder, arg_out, "sample") as (b, i):
+                sample = self._gen_llvm_sample(ctx, b, params, random_state)
+                b.store(sample, b.gep(arg_out, [ctx.int32_ty(0), i]))
+        else:
+            builder.store(self._gen_llvm_sample(ctx, builder, params, random_state), arg_out)
+
+        return builder
+
 
 class NormalDist(DistributionFunction):
     """
     NormalDist(                      \
              mean=0.0,               \
              standard_deviation=1.0, \
+             seed=None,              \
              params=None,            \
              owner=None,             \
              prefs=None              \
@@ -77,6 +140,10 @@ class NormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution. Must be > 0.0
 
+    seed : int : default None
+        specifies the seed of the random_state from which the function draws its samples;
+        if it is not specified, the global seed is used.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -100,6 +167,9 @@ class NormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution; if it is 0.0, returns `mean <NormalDist.mean>`.
 
+    random_state : numpy.RandomState instance
+        the state from which the function draws its samples, in both Python and compiled executions.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -131,6 +201,12 @@ class NormalDist(DistributionFunction):
                     :default value: 0.0
                     :type: float
 
+                random_state
+                    see `random_state <NormalDist.random_state>`
+
+                    :default value: None
+                    :type:
+
                 standard_deviation
                     see `standard_deviation <NormalDist.standard_deviation>`
 
@@ -140,18 +216,23 @@ class NormalDist(DistributionFunction):
         """
         mean = Parameter(0.0, modulable=True, aliases=[ADDITIVE_PARAM])
         standard_deviation = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
+        random_state = Parameter(None, modulable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  mean=0.0,
                  standard_deviation=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+        random_state = self._get_random_state(seed)
+
         # Assign args to params and functionParams dicts
         params = self._assign_args_to_param_dicts(mean=mean,
                                                   standard_deviation=standard_deviation,
+                                                  random_state=random_state,
                                                   params=params)
 
         super().__init__(default_variable=default_variable,
@@ -168,6 +249,14 @@ class NormalDist(DistributionFunction):
                 raise FunctionError("The standard_deviation parameter ({}) of {} must be greater than zero.".
                                     format(target_set[STANDARD_DEVIATION], self.name))
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        mean = self._gen_llvm_load_param(ctx, builder, params, DIST_MEAN)
+        standard_deviation = self._gen_llvm_load_param(ctx, builder, params, STANDARD_DEVIATION)
+
+        sample = self._gen_llvm_normal(ctx, builder, random_state)
+        sample = builder.fmul(sample, standard_deviation)
+        return builder.fadd(sample, mean)
+
     def function(self,
                  variable=None,
                  execution_id=None,
@@ -179,7 +268,8 @@ class NormalDist(DistributionFunction):
         mean = self.get_current_function_param(DIST_MEAN, execution_id)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION, execution_id)
 
-        result = np.random.normal(mean, standard_deviation)
+        random_state = self.get_current_function_param('random_state', execution_id)
+        result = random_state.normal(mean, standard_deviation)
 
         return self.convert_output_type(result)
 
@@ -189,6 +279,7 @@ class UniformToNormalDist(DistributionFunction):
     UniformToNormalDist(             \
              mean=0.0,               \
              standard_deviation=1.0, \
+             seed=None,              \
              params=None,            \
              owner=None,             \
              prefs=None              \
@@ -196,8 +287,9 @@ class UniformToNormalDist(DistributionFunction):
 
     .. _UniformToNormalDist:
 
-    Return a random sample from a normal distribution using first np.random.rand(1) to generate a sample from a uniform
-    distribution, and then converting that sample to a sample from a normal distribution with the following equation:
+    Return a random sample from a normal distribution using first random_state.rand(1) to generate a sample from a
+    uniform distribution, and then converting that sample to a sample from a normal distribution with the following
+    equation:
 
     .. math::
 
@@ -226,6 +318,10 @@ class UniformToNormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution
 
+    seed : int : default None
+        specifies the seed of the random_state from which the function draws its samples;
+        if it is not specified, the global seed is used.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -249,6 +345,9 @@ class UniformToNormalDist(DistributionFunction):
     standard_deviation : float : default 1.0
         Standard deviation of the normal distribution
 
+    random_state : numpy.RandomState instance
+        the state from which the function draws its samples, in both Python and compiled executions.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -272,6 +371,12 @@ class UniformToNormalDist(DistributionFunction):
             Attributes
             ----------
 
+                random_state
+                    see `random_state <UniformToNormalDist.random_state>`
+
+                    :default value: None
+                    :type:
+
                 variable
                     see `variable <UniformToNormalDist.variable>`
 
@@ -295,6 +400,7 @@ class UniformToNormalDist(DistributionFunction):
         variable = Parameter(np.array([0]), read_only=True)
         mean = Parameter(0.0, modulable=True, aliases=[ADDITIVE_PARAM])
         standard_deviation = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
+        random_state = Parameter(None, modulable=False)
 
     paramClassDefaults = Function_Base.paramClassDefaults.copy()
 
@@ -303,12 +409,16 @@ class UniformToNormalDist(DistributionFunction):
                  default_variable=None,
                  mean=0.0,
                  standard_deviation=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+        random_state = self._get_random_state(seed)
+
         # Assign args to params and functionParams dicts
         params = self._assign_args_to_param_dicts(mean=mean,
                                                   standard_deviation=standard_deviation,
+                                                  random_state=random_state,
                                                   params=params)
 
         super().__init__(default_variable=default_variable,
@@ -317,6 +427,58 @@ class UniformToNormalDist(DistributionFunction):
                          prefs=prefs,
                          context=ContextFlags.CONSTRUCTOR)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        mean = self._gen_llvm_load_param(ctx, builder, params, DIST_MEAN)
+        standard_deviation = self._gen_llvm_load_param(ctx, builder, params, STANDARD_DEVIATION)
+
+        uniform = self._gen_llvm_uniform(ctx, builder, random_state)
+        sample = self.__gen_llvm_inverse_normal_cdf(ctx, builder, uniform)
+        sample = builder.fmul(sample, standard_deviation)
+        return builder.fadd(sample, mean)
+
+    def __gen_llvm_inverse_normal_cdf(self, ctx, builder, p):
+        # sqrt(2) * erfinv(2 * p - 1) is the inverse of the standard normal CDF;
+        # it is computed using the rational approximations of P. J. Acklam (relative error < 1.15e-9),
+        # with the tails reflected around the center
+        central = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+                   1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00]
+        central_denom = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+                         6.680131188771972e+01, -1.328068155288572e+01, 1.0]
+        tail = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+                -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00]
+        tail_denom = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+                      3.754408661907416e+00, 1.0]
+        p_low = 0.02425
+
+        def _polynomial(builder, coefficients, x):
+            res = ctx.float_ty(coefficients[0])
+            for c in coefficients[1:]:
+                res = builder.fadd(builder.fmul(res, x), ctx.float_ty(c))
+            return res
+
+        fabs_f = ctx.get_builtin("fabs", [ctx.float_ty])
+        res_ptr = builder.alloca(ctx.float_ty)
+        q = builder.fsub(p, ctx.float_ty(0.5))
+        is_central = builder.fcmp_ordered("<", builder.call(fabs_f, [q]), ctx.float_ty(0.5 - p_low))
+        with builder.if_else(is_central) as (then, otherwise):
+            with then:
+                r = builder.fmul(q, q)
+                res = builder.fmul(_polynomial(builder, central, r), q)
+                res = builder.fdiv(res, _polynomial(builder, central_denom, r))
+                builder.store(res, res_ptr)
+            with otherwise:
+                # Use the smaller of p and 1 - p, and reflect the result for the upper tail
+                is_upper = builder.fcmp_ordered(">", q, ctx.float_ty(0))
+                tail_p = builder.select(is_upper, builder.fsub(ctx.float_ty(1), p), p)
+                log_f = ctx.get_builtin("log", [ctx.float_ty])
+                sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+                r = builder.fmul(ctx.float_ty(-2), builder.call(log_f, [tail_p]))
+                r = builder.call(sqrt_f, [r])
+                res = builder.fdiv(_polynomial(builder, tail, r), _polynomial(builder, tail_denom, r))
+                res = builder.select(is_upper, pnlvm.helpers.fneg(builder, res), res)
+                builder.store(res, res_ptr)
+
+        return builder.load(res_ptr)
 
     def function(self,
                  variable=None,
@@ -335,7 +497,8 @@ class UniformToNormalDist(DistributionFunction):
         mean = self.get_current_function_param(DIST_MEAN, execution_id)
         standard_deviation = self.get_current_function_param(STANDARD_DEVIATION, execution_id)
 
-        sample = np.random.rand(1)[0]
+        random_state = self.get_current_function_param('random_state', execution_id)
+        sample = random_state.rand(1)[0]
         result = ((np.sqrt(2) * erfinv(2 * sample - 1)) * standard_deviation) + mean
 
         return self.convert_output_type(result)
@@ -345,6 +508,7 @@ class ExponentialDist(DistributionFunction):
     """
     ExponentialDist(                \
              beta=1.0,              \
+             seed=None,             \
              params=None,           \
              owner=None,            \
              prefs=None             \
@@ -365,6 +529,10 @@ class ExponentialDist(DistributionFunction):
     beta : float : default 1.0
         The scale parameter of the exponential distribution
 
+    seed : int : default None
+        specifies the seed of the random_state from which the function draws its samples;
+        if it is not specified, the global seed is used.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -385,6 +553,9 @@ class ExponentialDist(DistributionFunction):
     beta : float : default 1.0
         The scale parameter of the exponential distribution
 
+    random_state : numpy.RandomState instance
+        the state from which the function draws its samples, in both Python and compiled executions.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -415,18 +586,29 @@ class ExponentialDist(DistributionFunction):
                     :default value: 1.0
                     :type: float
 
+                random_state
+                    see `random_state <ExponentialDist.random_state>`
+
+                    :default value: None
+                    :type:
+
         """
         beta = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
+        random_state = Parameter(None, modulable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  beta=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+        random_state = self._get_random_state(seed)
+
         # Assign args to params and functionParams dicts
         params = self._assign_args_to_param_dicts(beta=beta,
+                                                  random_state=random_state,
                                                   params=params)
 
         super().__init__(default_variable=default_variable,
@@ -435,6 +617,11 @@ class ExponentialDist(DistributionFunction):
                          prefs=prefs,
                          context=ContextFlags.CONSTRUCTOR)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        beta = self._gen_llvm_load_param(ctx, builder, params, BETA)
+
+        sample = self._gen_llvm_exponential(ctx, builder, random_state)
+        return builder.fmul(sample, beta)
 
     def function(self,
                  variable=None,
@@ -445,7 +632,8 @@ class ExponentialDist(DistributionFunction):
         variable = self._check_args(variable=variable, execution_id=execution_id, params=params, context=context)
 
         beta = self.get_current_function_param(BETA, execution_id)
-        result = np.random.exponential(beta)
+        random_state = self.get_current_function_param('random_state', execution_id)
+        result = random_state.exponential(beta)
 
         return self.convert_output_type(result)
 
@@ -455,6 +643,7 @@ class UniformDist(DistributionFunction):
     UniformDist(                      \
              low=0.0,             \
              high=1.0,             \
+             seed=None,             \
              params=None,           \
              owner=None,            \
              prefs=None             \
@@ -473,6 +662,10 @@ class UniformDist(DistributionFunction):
     high : float : default 1.0
         Upper bound of the uniform distribution
 
+    seed : int : default None
+        specifies the seed of the random_state from which the function draws its samples;
+        if it is not specified, the global seed is used.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -496,6 +689,9 @@ class UniformDist(DistributionFunction):
     high : float : default 1.0
         Upper bound of the uniform distribution
 
+    random_state : numpy.RandomState instance
+        the state from which the function draws its samples, in both Python and compiled executions.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -532,21 +728,32 @@ class UniformDist(DistributionFunction):
                     :default value: 0.0
                     :type: float
 
+                random_state
+                    see `random_state <UniformDist.random_state>`
+
+                    :default value: None
+                    :type:
+
         """
         low = Parameter(0.0, modulable=True)
         high = Parameter(1.0, modulable=True)
+        random_state = Parameter(None, modulable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  low=0.0,
                  high=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+        random_state = self._get_random_state(seed)
+
         # Assign args to params and functionParams dicts
         params = self._assign_args_to_param_dicts(low=low,
                                                   high=high,
+                                                  random_state=random_state,
                                                   params=params)
 
         super().__init__(default_variable=default_variable,
@@ -555,6 +762,13 @@ class UniformDist(DistributionFunction):
                          prefs=prefs,
                          context=ContextFlags.CONSTRUCTOR)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        low = self._gen_llvm_load_param(ctx, builder, params, LOW)
+        high = self._gen_llvm_load_param(ctx, builder, params, HIGH)
+
+        sample = self._gen_llvm_uniform(ctx, builder, random_state)
+        sample = builder.fmul(sample, builder.fsub(high, low))
+        return builder.fadd(sample, low)
 
     def function(self,
                  variable=None,
@@ -566,7 +780,8 @@ class UniformDist(DistributionFunction):
 
         low = self.get_current_function_param(LOW, execution_id)
         high = self.get_current_function_param(HIGH, execution_id)
-        result = np.random.uniform(low, high)
+        random_state = self.get_current_function_param('random_state', execution_id)
+        result = random_state.uniform(low, high)
 
         return self.convert_output_type(result)
 
@@ -576,6 +791,7 @@ class GammaDist(DistributionFunction):
     GammaDist(\
              scale=1.0,\
              dist_shape=1.0,\
+             seed=None,  \
              params=None,\
              owner=None,\
              prefs=None\
@@ -600,6 +816,10 @@ class GammaDist(DistributionFunction):
     dist_shape : float : default 1.0
         The shape of the gamma distribution. Should be greater than zero.
 
+    seed : int : default None
+        specifies the seed of the random_state from which the function draws its samples;
+        if it is not specified, the global seed is used.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -623,6 +843,9 @@ class GammaDist(DistributionFunction):
     dist_shape : float : default 1.0
         The shape of the gamma distribution. Should be greater than zero.
 
+    random_state : numpy.RandomState instance
+        the state from which the function draws its samples, in both Python and compiled executions.
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
         function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -654,6 +877,12 @@ class GammaDist(DistributionFunction):
                     :default value: 1.0
                     :type: float
 
+                random_state
+                    see `random_state <GammaDist.random_state>`
+
+                    :default value: None
+                    :type:
+
                 scale
                     see `scale <GammaDist.scale>`
 
@@ -663,18 +892,23 @@ class GammaDist(DistributionFunction):
         """
         scale = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
         dist_shape = Parameter(1.0, modulable=True, aliases=[ADDITIVE_PARAM])
+        random_state = Parameter(None, modulable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  scale=1.0,
                  dist_shape=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+        random_state = self._get_random_state(seed)
+
         # Assign args to params and functionParams dicts
         params = self._assign_args_to_param_dicts(scale=scale,
                                                   dist_shape=dist_shape,
+                                                  random_state=random_state,
                                                   params=params)
 
         super().__init__(default_variable=default_variable,
@@ -683,6 +917,98 @@ class GammaDist(DistributionFunction):
                          prefs=prefs,
                          context=ContextFlags.CONSTRUCTOR)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        scale = self._gen_llvm_load_param(ctx, builder, params, SCALE)
+        dist_shape = self._gen_llvm_load_param(ctx, builder, params, DIST_SHAPE)
+
+        # Use the same algorithms as numpy: rejection sampling for shapes below one,
+        # exponential distribution for shape one, and Marsaglia and Tsang's method otherwise
+        sample_ptr = builder.alloca(ctx.float_ty)
+        is_small = builder.fcmp_ordered("<", dist_shape, ctx.float_ty(1))
+        is_one = builder.fcmp_ordered("==", dist_shape, ctx.float_ty(1))
+        with builder.if_else(is_small) as (then, otherwise):
+            with then:
+                builder.store(self.__gen_llvm_small_shape(ctx, builder, dist_shape, random_state), sample_ptr)
+            with otherwise:
+                with builder.if_else(is_one) as (one, large):
+                    with one:
+                        builder.store(self._gen_llvm_exponential(ctx, builder, random_state), sample_ptr)
+                    with large:
+                        builder.store(self.__gen_llvm_large_shape(ctx, builder, dist_shape, random_state),
+                                      sample_ptr)
+
+        return builder.fmul(builder.load(sample_ptr), scale)
+
+    def __gen_llvm_small_shape(self, ctx, builder, dist_shape, random_state):
+        log_f = ctx.get_builtin("log", [ctx.float_ty])
+        pow_f = ctx.get_builtin("pow", [ctx.float_ty])
+        one = ctx.float_ty(1)
+        inv_shape = builder.fdiv(one, dist_shape)
+
+        loop_block = builder.append_basic_block("gamma_small_loop")
+        out_block = builder.append_basic_block("gamma_small_out")
+        builder.branch(loop_block)
+        builder.position_at_end(loop_block)
+
+        uniform = self._gen_llvm_uniform(ctx, builder, random_state)
+        exponential = self._gen_llvm_exponential(ctx, builder, random_state)
+
+        # uniform <= 1 - shape
+        x_low = builder.call(pow_f, [uniform, inv_shape])
+        accept_low = builder.fcmp_ordered("<=", x_low, exponential)
+
+        # uniform > 1 - shape
+        y = builder.fdiv(builder.fsub(one, uniform), dist_shape)
+        y = pnlvm.helpers.fneg(builder, builder.call(log_f, [y]))
+        x_high = builder.fmul(dist_shape, y)
+        x_high = builder.fadd(builder.fsub(one, dist_shape), x_high)
+        x_high = builder.call(pow_f, [x_high, inv_shape])
+        accept_high = builder.fcmp_ordered("<=", x_high, builder.fadd(exponential, y))
+
+        is_low = builder.fcmp_ordered("<=", uniform, builder.fsub(one, dist_shape))
+        x = builder.select(is_low, x_low, x_high)
+        accept = builder.select(is_low, accept_low, accept_high)
+        builder.cbranch(accept, out_block, loop_block)
+
+        builder.position_at_end(out_block)
+        return x
+
+    def __gen_llvm_large_shape(self, ctx, builder, dist_shape, random_state):
+        log_f = ctx.get_builtin("log", [ctx.float_ty])
+        sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+        one = ctx.float_ty(1)
+        b = builder.fsub(dist_shape, ctx.float_ty(1 / 3))
+        c = builder.fdiv(one, builder.call(sqrt_f, [builder.fmul(ctx.float_ty(9), b)]))
+
+        loop_block = builder.append_basic_block("gamma_large_loop")
+        out_block = builder.append_basic_block("gamma_large_out")
+        builder.branch(loop_block)
+        builder.position_at_end(loop_block)
+
+        # Draw normal samples until 1 + c * x is positive
+        x = self._gen_llvm_normal(ctx, builder, random_state)
+        v = builder.fadd(one, builder.fmul(c, x))
+        v_positive = builder.fcmp_ordered(">", v, ctx.float_ty(0))
+        with builder.if_then(builder.not_(v_positive)):
+            builder.branch(loop_block)
+
+        v = builder.fmul(v, builder.fmul(v, v))
+        uniform = self._gen_llvm_uniform(ctx, builder, random_state)
+        x2 = builder.fmul(x, x)
+
+        # Squeeze test
+        squeeze = builder.fsub(one, builder.fmul(ctx.float_ty(0.0331), builder.fmul(x2, x2)))
+        accept_squeeze = builder.fcmp_ordered("<", uniform, squeeze)
+
+        # log(uniform) < 0.5 * x^2 + b * (1 - v + log(v))
+        threshold = builder.fadd(builder.fsub(one, v), builder.call(log_f, [v]))
+        threshold = builder.fadd(builder.fmul(ctx.float_ty(0.5), x2), builder.fmul(b, threshold))
+        accept_log = builder.fcmp_ordered("<", builder.call(log_f, [uniform]), threshold)
+
+        builder.cbranch(builder.or_(accept_squeeze, accept_log), out_block, loop_block)
+
+        builder.position_at_end(out_block)
+        return builder.fmul(b, v)
 
     def function(self,
                  variable=None,
@@ -695,7 +1021,8 @@ class GammaDist(DistributionFunction):
         scale = self.get_current_function_param(SCALE, execution_id)
         dist_shape = self.get_current_function_param(DIST_SHAPE, execution_id)
 
-        result = np.random.gamma(dist_shape, scale)
+        random_state = self.get_current_function_param('random_state', execution_id)
+        result = random_state.gamma(dist_shape, scale)
 
         return self.convert_output_type(result)
 
@@ -705,6 +1032,7 @@ class WaldDist(DistributionFunction):
      WaldDist(             \
               scale=1.0,\
               mean=1.0,\
+              seed=None,  \
               params=None,\
               owner=None,\
               prefs=None\
@@ -729,6 +1057,10 @@ class WaldDist(DistributionFunction):
      mean : float : default 1.0
          Mean of the Wald distribution. Should be greater than or equal to zero.
 
+     seed : int : default None
+         specifies the seed of the random_state from which the function draws its samples;
+         if it is not specified, the global seed is used.
+
      params : Dict[param keyword: param value] : default None
          a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
          function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -751,6 +1083,9 @@ class WaldDist(DistributionFunction):
      mean : float : default 1.0
          Mean of the Wald distribution. Should be greater than or equal to zero.
 
+     random_state : numpy.RandomState instance
+         the state from which the function draws its samples, in both Python and compiled executions.
+
      params : Dict[param keyword: param value] : default None
          a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the
          function.  Values specified for parameters in the dictionary override any assigned to those parameters in
@@ -781,6 +1116,12 @@ class WaldDist(DistributionFunction):
                     :default value: 1.0
                     :type: float
 
+                random_state
+                    see `random_state <WaldDist.random_state>`
+
+                    :default value: None
+                    :type:
+
                 scale
                     see `scale <WaldDist.scale>`
 
@@ -790,18 +1131,23 @@ class WaldDist(DistributionFunction):
         """
         scale = Parameter(1.0, modulable=True, aliases=[MULTIPLICATIVE_PARAM])
         mean = Parameter(1.0, modulable=True, aliases=[ADDITIVE_PARAM])
+        random_state = Parameter(None, modulable=False)
 
     @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  scale=1.0,
                  mean=1.0,
+                 seed=None,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None):
+        random_state = self._get_random_state(seed)
+
         # Assign args to params and functionParams dicts
         params = self._assign_args_to_param_dicts(scale=scale,
                                                   mean=mean,
+                                                  random_state=random_state,
                                                   params=params)
 
         super().__init__(default_variable=default_variable,
@@ -810,6 +1156,23 @@ class WaldDist(DistributionFunction):
                          prefs=prefs,
                          context=ContextFlags.CONSTRUCTOR)
 
+    def _gen_llvm_sample(self, ctx, builder, params, random_state):
+        sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+        scale = self._gen_llvm_load_param(ctx, builder, params, SCALE)
+        mean = self._gen_llvm_load_param(ctx, builder, params, DIST_MEAN)
+
+        # Use the same algorithm as numpy
+        mu_2l = builder.fdiv(mean, builder.fmul(ctx.float_ty(2), scale))
+        y = self._gen_llvm_normal(ctx, builder, random_state)
+        y = builder.fmul(mean, builder.fmul(y, y))
+        root = builder.fmul(builder.fmul(ctx.float_ty(4), scale), y)
+        root = builder.call(sqrt_f, [builder.fadd(root, builder.fmul(y, y))])
+        x = builder.fadd(mean, builder.fmul(mu_2l, builder.fsub(y, root)))
+
+        uniform = self._gen_llvm_uniform(ctx, builder, random_state)
+        cond = builder.fcmp_ordered("<=", uniform, builder.fdiv(mean, builder.fadd(mean, x)))
+        alt = builder.fdiv(builder.fmul(mean, mean), x)
+        return builder.select(cond, x, alt)
 
     def function(self,
                  variable=None,
@@ -822,7 +1185,8 @@ class WaldDist(DistributionFunction):
         scale = self.get_current_function_param(SCALE, execution_id)
         mean = self.get_current_function_param(DIST_MEAN, execution_id)
 
-        result = np.random.wald(mean, scale)
+        random_state = self.get_current_function_param('random_state', execution_id)
+        result = random_state.wald(mean, scale)
 
         return self.convert_output_type(result)
 
@@ -1224,6 +1588,10 @@ class DriftDiffusionAnalytical(DistributionFunction):  # -----------------------
                moments['mean_rt_plus'], moments['var_rt_plus'], moments['skew_rt_plus'], \
                moments['mean_rt_minus'], moments['var_rt_minus'], moments['skew_rt_minus']
 
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        # The results are computed analytically rather than sampled, so the DistributionFunction body does not apply
+        raise FunctionError("{} can't be compiled".format(self.name))
+
     @staticmethod
     def _compute_conditional_rt_moments(drift_rate, noise, threshold, starting_point, t0):
         """
@@ -27,6 +27,7 @@ from collections.__init__ import namedtuple
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 
 from psyneulink.core.components.functions.function import Function_Base, FunctionError, is_function_type
 from psyneulink.core.components.functions.transferfunctions import Logistic
@@ -61,6 +62,7 @@ ACTIVATION_INPUT = 'activation_input'
 ACTIVATION_OUTPUT = 'activation_output'
 ERROR_SIGNAL = 'error_signal'
 ERROR_MATRIX = 'error_matrix'
+ACTIVATION_DERIVATIVE_FCT = 'activation_derivative_fct'
 
 
 ReturnVal = namedtuple('ReturnVal', 'learning_signal, error_signal')
@@ -167,6 +169,37 @@ class LearningFunction(Function_Base):
                 raise FunctionError("{} arg for {} ({}) must be a single value".
                                     format(LEARNING_RATE, self.name, learning_rate))
 
+    def _gen_llvm_learning_rate(self, ctx, builder, params, dims=(0,)):
+        """Return a pointer to learning_rate in **params** and its number of dimensions
+
+        learning_rate is None (an empty structure) if it was not specified for the instance or composition, in which
+        case a pointer to the default value is returned. Raises FunctionError if the number of dimensions is not in
+        **dims**.
+        """
+        learning_rate_ptr = ctx.get_param_ptr(self, builder, params, LEARNING_RATE)
+        learning_rate_ty = learning_rate_ptr.type.pointee
+        if isinstance(learning_rate_ty, pnlvm.ir.LiteralStructType):
+            learning_rate = np.array(self.defaults.learning_rate)
+            learning_rate_ptr = builder.alloca(ctx.convert_python_struct_to_llvm_ir(learning_rate.tolist()))
+            builder.store(learning_rate_ptr.type.pointee(learning_rate.tolist()), learning_rate_ptr)
+            learning_rate_ty = learning_rate_ptr.type.pointee
+
+        # A ParameterState wraps the value in an extra dimension
+        if isinstance(learning_rate_ty, pnlvm.ir.ArrayType) and learning_rate_ty.count == 1:
+            learning_rate_ptr = builder.gep(learning_rate_ptr, [ctx.int32_ty(0), ctx.int32_ty(0)])
+            learning_rate_ty = learning_rate_ptr.type.pointee
+
+        learning_rate_dim = 0
+        while isinstance(learning_rate_ty, pnlvm.ir.ArrayType):
+            learning_rate_ty = learning_rate_ty.element
+            learning_rate_dim += 1
+
+        if learning_rate_dim not in dims:
+            raise FunctionError("Compiled {} does not support {} with {} dimensions".
+                                format(self.name, LEARNING_RATE, learning_rate_dim))
+
+        return learning_rate_ptr, learning_rate_dim
+
 
 class BayesGLM(LearningFunction):
     """
@@ -890,6 +923,75 @@ class Kohonen(LearningFunction):  # --------------------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _get_compilation_params(self, execution_id=None):
+        # The distance function is generated from measure in compiled code
+        return (p for p in super()._get_compilation_params(execution_id) if p.name != 'distance_function')
+
+    def _get_input_struct_type(self, ctx):
+        # Items of variable have different shapes
+        return pnlvm.ir.LiteralStructType(ctx.convert_python_struct_to_llvm_ir(np.asfarray(item).tolist())
+                                          for item in self.defaults.variable)
+
+    def _gen_llvm_distance(self, builder, ctx, distance):
+        if self.measure == GAUSSIAN:
+            # Standard normal probability density
+            exp_f = ctx.get_builtin("exp", [ctx.float_ty])
+            val = builder.fmul(distance, distance)
+            val = builder.fmul(val, ctx.float_ty(-0.5))
+            val = builder.call(exp_f, [val])
+            return builder.fdiv(val, ctx.float_ty(np.sqrt(2 * np.pi)))
+        if self.measure == LINEAR:
+            return distance
+        if self.measure == EXPONENTIAL:
+            exp_f = ctx.get_builtin("exp", [ctx.float_ty])
+            return builder.call(exp_f, [distance])
+
+        raise FunctionError("Compiled {} does not support distance measure {}".format(self.name, self.measure))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        input_pattern = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        activities = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(1)])
+        matrix = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(2)])
+
+        learning_rate_ptr, _ = self._gen_llvm_learning_rate(ctx, builder, params)
+        learning_rate = builder.load(learning_rate_ptr)
+
+        # Find the (first) element with the greatest activity
+        index_of_max_ptr = builder.alloca(ctx.int32_ty)
+        builder.store(ctx.int32_ty(0), index_of_max_ptr)
+        with pnlvm.helpers.array_ptr_loop(builder, activities, "kohonen_max") as (builder, i):
+            index_of_max = builder.load(index_of_max_ptr)
+            max_activity = builder.load(builder.gep(activities, [ctx.int32_ty(0), index_of_max]))
+            activity = builder.load(builder.gep(activities, [ctx.int32_ty(0), i]))
+            greater = builder.fcmp_ordered(">", activity, max_activity)
+            builder.store(builder.select(greater, i, index_of_max), index_of_max_ptr)
+
+        # Calculate distances, scaled by learning_rate
+        index_of_max = builder.load(index_of_max_ptr)
+        scales = builder.alloca(activities.type.pointee)
+        with pnlvm.helpers.array_ptr_loop(builder, activities, "kohonen_distance") as (builder, j):
+            distance = builder.sub(j, index_of_max)
+            negative = builder.icmp_signed("<", distance, ctx.int32_ty(0))
+            distance = builder.select(negative, builder.neg(distance), distance)
+            distance = builder.sitofp(distance, ctx.float_ty)
+            distance = self._gen_llvm_distance(builder, ctx, distance)
+            scale = builder.fsub(ctx.float_ty(1), distance)
+            scale = builder.fmul(scale, learning_rate)
+            builder.store(scale, builder.gep(scales, [ctx.int32_ty(0), j]))
+
+        # Multiply distances (of each column) by differences (of each weight from the input)
+        with pnlvm.helpers.array_ptr_loop(builder, matrix, "kohonen_row") as (builder, i):
+            input_val = builder.load(builder.gep(input_pattern, [ctx.int32_ty(0), i]))
+            row = builder.gep(matrix, [ctx.int32_ty(0), i])
+            with pnlvm.helpers.array_ptr_loop(builder, row, "kohonen_col") as (builder, j):
+                weight = builder.load(builder.gep(row, [ctx.int32_ty(0), j]))
+                val = builder.fsub(weight, input_val)
+                scale = builder.load(builder.gep(scales, [ctx.int32_ty(0), j]))
+                val = builder.fmul(val, scale)
+                builder.store(val, builder.gep(arg_out, [ctx.int32_ty(0), i, j]))
+
+        return builder
+
 
 class Hebbian(LearningFunction):  # -------------------------------------------------------------------------------
     """
@@ -1125,6 +1227,41 @@ class Hebbian(LearningFunction):  # --------------------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        vec_in = ctx.unwrap_2d_array(builder, arg_in)
+
+        learning_rate_ptr, learning_rate_dim = self._gen_llvm_learning_rate(ctx, builder, params, dims=(0, 1, 2))
+        if learning_rate_dim == 0:
+            learning_rate = builder.load(learning_rate_ptr)
+
+        with pnlvm.helpers.array_ptr_loop(builder, vec_in, "hebbian_row") as (builder, i):
+            row_val = builder.load(builder.gep(vec_in, [ctx.int32_ty(0), i]))
+            # If learning_rate is a 1d array, multiply it by variable
+            if learning_rate_dim == 1:
+                row_rate = builder.load(builder.gep(learning_rate_ptr, [ctx.int32_ty(0), i]))
+                row_val = builder.fmul(row_val, row_rate)
+
+            with pnlvm.helpers.array_ptr_loop(builder, vec_in, "hebbian_col") as (builder, j):
+                col_val = builder.load(builder.gep(vec_in, [ctx.int32_ty(0), j]))
+                if learning_rate_dim == 1:
+                    col_rate = builder.load(builder.gep(learning_rate_ptr, [ctx.int32_ty(0), j]))
+                    col_val = builder.fmul(col_val, col_rate)
+
+                val = builder.fmul(row_val, col_val)
+                # If learning_rate is scalar or 2d, multiply it by the weight change
+                if learning_rate_dim == 0:
+                    val = builder.fmul(val, learning_rate)
+                elif learning_rate_dim == 2:
+                    rate = builder.load(builder.gep(learning_rate_ptr, [ctx.int32_ty(0), i, j]))
+                    val = builder.fmul(val, rate)
+
+                # Zero diagonals (i.e., don't allow correlation of a unit with itself to be included)
+                diagonal = builder.icmp_signed("==", i, j)
+                val = builder.select(diagonal, ctx.float_ty(0), val)
+                builder.store(val, builder.gep(arg_out, [ctx.int32_ty(0), i, j]))
+
+        return builder
+
 
 class ContrastiveHebbian(LearningFunction):  # -------------------------------------------------------------------------
     """
@@ -1359,6 +1496,9 @@ class ContrastiveHebbian(LearningFunction):  # ---------------------------------
 
         return self.convert_output_type(weight_change_matrix)
 
+    # IMPLEMENTATION NOTE: function currently implements the Hebbian learning rule, so the compiled version is the same
+    _gen_llvm_function_body = Hebbian._gen_llvm_function_body
+
 
 def _activation_input_getter(owning_component=None, execution_id=None):
     return owning_component.parameters.variable.get(execution_id)[LEARNING_ACTIVATION_INPUT]
@@ -1644,6 +1784,41 @@ class Reinforcement(LearningFunction):  # --------------------------------------
         weight_change_matrix = np.diag(error_array)
         return [error_array, error_array]
 
+    def _get_input_struct_type(self, ctx):
+        # Items of variable can have different lengths
+        return pnlvm.ir.LiteralStructType(ctx.convert_python_struct_to_llvm_ir(item)
+                                          for item in self.defaults.variable)
+
+    def _get_output_struct_type(self, ctx):
+        return pnlvm.ir.LiteralStructType(ctx.convert_python_struct_to_llvm_ir(item)
+                                          for item in self.defaults.value)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        output = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ACTIVATION_OUTPUT)])
+        error = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ERROR_OUTPUT)])
+        learning_signal = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        error_signal = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(1)])
+
+        learning_rate_ptr, _ = self._gen_llvm_learning_rate(ctx, builder, params)
+        learning_rate = builder.load(learning_rate_ptr)
+        # A single error term applies to all items of the output (TDLearning can have one for each item)
+        error_count = error.type.pointee.count
+
+        # Assign error term to chosen item of output array
+        with pnlvm.helpers.array_ptr_loop(builder, output, "reinforcement_loop") as (builder, i):
+            error_idx = i if error_count > 1 else ctx.int32_ty(0)
+            val = builder.load(builder.gep(error, [ctx.int32_ty(0), error_idx]))
+            val = builder.fmul(val, learning_rate)
+
+            output_val = builder.load(builder.gep(output, [ctx.int32_ty(0), i]))
+            chosen = builder.fcmp_unordered("!=", output_val, ctx.float_ty(0))
+            val = builder.select(chosen, val, ctx.float_ty(0))
+
+            builder.store(val, builder.gep(learning_signal, [ctx.int32_ty(0), i]))
+            builder.store(val, builder.gep(error_signal, [ctx.int32_ty(0), i]))
+
+        return builder
+
 
 class BackPropagation(LearningFunction):
     """
@@ -2107,6 +2282,79 @@ class BackPropagation(LearningFunction):
 
         return [weight_change_matrix, dE_dW]
 
+    def _get_activation_derivative_function(self):
+        # Compiled code can only compute the derivative of a TransferFunction that can generate it
+        derivative = self.activation_derivative_fct
+        function = getattr(derivative, '__self__', None)
+        if getattr(derivative, '__name__', None) != 'derivative' or not hasattr(function, '_gen_llvm_derivative'):
+            raise FunctionError("{} of {} ({}) can't be compiled".format(ACTIVATION_DERIVATIVE_FCT, self.name,
+                                                                         derivative))
+        return function
+
+    def _get_param_ids(self, execution_id=None):
+        return super()._get_param_ids(execution_id) + [ACTIVATION_DERIVATIVE_FCT]
+
+    def _get_param_values(self, execution_id=None):
+        # activation_derivative_fct is called in its own default context by function, so use that here too
+        derivative_params = self._get_activation_derivative_function()._get_param_values()
+        return super()._get_param_values(execution_id) + (derivative_params,)
+
+    def _get_input_struct_type(self, ctx):
+        # Items of variable can have different lengths
+        return pnlvm.ir.LiteralStructType(ctx.convert_python_struct_to_llvm_ir(item)
+                                          for item in self.defaults.variable)
+
+    def _get_output_struct_type(self, ctx):
+        # weight change matrix and error signal have different shapes
+        return pnlvm.ir.LiteralStructType(ctx.convert_python_struct_to_llvm_ir(item)
+                                          for item in self.defaults.value)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        activation_input = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ACTIVATION_INPUT)])
+        activation_output = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ACTIVATION_OUTPUT)])
+        error_signal = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(LEARNING_ERROR_OUTPUT)])
+        weight_change_matrix = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        dE_dW = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(1)])
+
+        error_matrix = ctx.get_param_ptr(self, builder, params, ERROR_MATRIX)
+
+        learning_rate_ptr, _ = self._gen_llvm_learning_rate(ctx, builder, params)
+        learning_rate = builder.load(learning_rate_ptr)
+
+        derivative_function = self._get_activation_derivative_function()
+        derivative_params = ctx.get_param_ptr(self, builder, params, ACTIVATION_DERIVATIVE_FCT)
+
+        # Chain rule to get the derivative of the error with respect to the weights, for each output unit
+        dE_dA_ptr = builder.alloca(ctx.float_ty)
+        with pnlvm.helpers.array_ptr_loop(builder, dE_dW, "bp_dE_dW") as (builder, i):
+            # Derivative of error with respect to output activity (dot product of row i of error_matrix and
+            # error_signal)
+            builder.store(ctx.float_ty(0), dE_dA_ptr)
+            with pnlvm.helpers.array_ptr_loop(builder, error_signal, "bp_dE_dA") as (builder, j):
+                weight = builder.load(builder.gep(error_matrix, [ctx.int32_ty(0), i, j]))
+                error = builder.load(builder.gep(error_signal, [ctx.int32_ty(0), j]))
+                dE_dA = builder.load(dE_dA_ptr)
+                dE_dA = builder.fadd(dE_dA, builder.fmul(weight, error))
+                builder.store(dE_dA, dE_dA_ptr)
+
+            # Derivative of the output activity
+            output = builder.load(builder.gep(activation_output, [ctx.int32_ty(0), i]))
+            dA_dW = derivative_function._gen_llvm_derivative(builder, ctx, output, derivative_params)
+
+            val = builder.fmul(builder.load(dE_dA_ptr), dA_dW)
+            builder.store(val, builder.gep(dE_dW, [ctx.int32_ty(0), i]))
+
+        # Weight changes = delta rule (learning rate * activity * error)
+        with pnlvm.helpers.array_ptr_loop(builder, activation_input, "bp_weight_change_row") as (builder, i):
+            activity = builder.load(builder.gep(activation_input, [ctx.int32_ty(0), i]))
+            activity = builder.fmul(activity, learning_rate)
+            with pnlvm.helpers.array_ptr_loop(builder, dE_dW, "bp_weight_change_col") as (builder, j):
+                error = builder.load(builder.gep(dE_dW, [ctx.int32_ty(0), j]))
+                val = builder.fmul(activity, error)
+                builder.store(val, builder.gep(weight_change_matrix, [ctx.int32_ty(0), i, j]))
+
+        return builder
+
 
 class TDLearning(Reinforcement):
     """Implement temporal difference learning using the `Reinforcement` Function
@@ -250,6 +250,22 @@ class IntegratorFunction(StatefulFunction):  # ---------------------------------
         '''Return logistic transform of variable'''
         return 1 / (1 + np.exp(-(gain * variable) + bias))
 
+    def _gen_llvm_load_param(self, ctx, builder, params, index, param, default=0.0):
+        '''Return the value of **param** that applies to element **index** of the variable
+
+        Parameters that were not specified (None, an empty structure) are replaced by **default**,
+        and scalar parameters are used for every element.
+        '''
+        param_ptr = ctx.get_param_ptr(self, builder, params, param)
+        if isinstance(param_ptr.type.pointee, pnlvm.ir.LiteralStructType):
+            assert len(param_ptr.type.pointee) == 0
+            return ctx.float_ty(default)
+        # A ParameterState wraps the value in an extra dimension
+        param_ptr = ctx.unwrap_2d_array(builder, param_ptr)
+        if isinstance(param_ptr.type.pointee, pnlvm.ir.ArrayType) and param_ptr.type.pointee.count > 1:
+            param_ptr = builder.gep(param_ptr, [ctx.int32_ty(0), index])
+        return pnlvm.helpers.load_extract_scalar_array_one(builder, param_ptr)
+
     def _euler(self, previous_value, previous_time, slope, time_step_size):
 
         if callable(slope):
@@ -535,6 +551,36 @@ class AccumulatorIntegrator(IntegratorFunction):  # ----------------------------
                     self._runtime_params_reset[execution_id][param_name] = getattr(self.parameters, param_name).get(execution_id)
                     self._set_parameter_value(param_name, runtime_params[param_name], execution_id)
 
+    def __gen_llvm_accumulate(self, builder, index, ctx, vo, params, prev_ptr):
+        rate = self._gen_llvm_load_param(ctx, builder, params, index, RATE, 1.0)
+        increment = self._gen_llvm_load_param(ctx, builder, params, index, INCREMENT)
+        noise = self._gen_llvm_load_param(ctx, builder, params, index, NOISE)
+
+        prev_ptr = builder.gep(prev_ptr, [ctx.int32_ty(0), index])
+        prev_val = builder.load(prev_ptr)
+
+        res = builder.fmul(prev_val, rate)
+        res = builder.fadd(res, noise)
+        res = builder.fadd(res, increment)
+
+        vo_ptr = builder.gep(vo, [ctx.int32_ty(0), index])
+        builder.store(res, vo_ptr)
+        builder.store(res, prev_ptr)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        # Get rid of 2d array.
+        # When part of a Mechanism, the output and the state are 2d arrays.
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+        prev_ptr = ctx.get_state_ptr(self, builder, state, "previous_value")
+        prev_ptr = ctx.unwrap_2d_array(builder, prev_ptr)
+        assert len(prev_ptr.type.pointee) == len(arg_out.type.pointee)
+
+        # The variable is not used, the accumulated value has the shape of previous_value
+        with pnlvm.helpers.array_ptr_loop(builder, prev_ptr, "accumulate") as args:
+            self.__gen_llvm_accumulate(*args, ctx, arg_out, params, prev_ptr)
+
+        return builder
+
     def function(self,
                  variable=None,
                  execution_id=None,
@@ -763,6 +809,43 @@ class SimpleIntegrator(IntegratorFunction):  # ---------------------------------
 
         self.has_initializers = True
 
+    def __gen_llvm_integrate(self, builder, index, ctx, vi, vo, params, state):
+        rate = self._gen_llvm_load_param(ctx, builder, params, index, RATE)
+        offset = self._gen_llvm_load_param(ctx, builder, params, index, OFFSET)
+        noise = self._gen_llvm_load_param(ctx, builder, params, index, NOISE)
+
+        prev_ptr = ctx.get_state_ptr(self, builder, state, "previous_value")
+        # Get rid of 2d array. When part of a Mechanism the input,
+        # (and output, and context) are 2d arrays.
+        prev_ptr = ctx.unwrap_2d_array(builder, prev_ptr)
+        assert len(prev_ptr.type.pointee) == len(vi.type.pointee)
+
+        prev_ptr = builder.gep(prev_ptr, [ctx.int32_ty(0), index])
+        prev_val = builder.load(prev_ptr)
+
+        vi_ptr = builder.gep(vi, [ctx.int32_ty(0), index])
+        vi_val = builder.load(vi_ptr)
+
+        new_val = builder.fmul(vi_val, rate)
+        ret = builder.fadd(prev_val, new_val)
+        ret = builder.fadd(ret, noise)
+        res = builder.fadd(ret, offset)
+
+        vo_ptr = builder.gep(vo, [ctx.int32_ty(0), index])
+        builder.store(res, vo_ptr)
+        builder.store(res, prev_ptr)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        # Get rid of 2d array.
+        # When part of a Mechanism, the input and output are 2d arrays.
+        arg_in = ctx.unwrap_2d_array(builder, arg_in)
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+
+        with pnlvm.helpers.array_ptr_loop(builder, arg_in, "integrate") as args:
+            self.__gen_llvm_integrate(*args, ctx, arg_in, arg_out, params, state)
+
+        return builder
+
     def function(self,
                  variable=None,
                  execution_id=None,
@@ -1640,6 +1723,75 @@ class DualAdaptiveIntegrator(IntegratorFunction):  # ---------------------------
                 raise FunctionError("\'{}\' arg for {} must be one of the following: {}".
                                     format(OPERATION, self.name, OPERATIONS))
 
+    def __gen_llvm_logistic(self, builder, ctx, x, gain, bias):
+        exp_f = ctx.get_builtin("exp", [ctx.float_ty])
+        val = builder.fmul(x, gain)
+        val = builder.fsub(bias, val)
+        val = builder.call(exp_f, [val])
+        val = builder.fadd(ctx.float_ty(1), val)
+        return builder.fdiv(ctx.float_ty(1), val)
+
+    def __gen_llvm_integrate(self, builder, index, ctx, vi, vo, params, prev_short_ptr, prev_long_ptr, operation):
+        param_vals = {p: self._gen_llvm_load_param(ctx, builder, params, index, p)
+                      for p in ("short_term_rate", "long_term_rate", "short_term_gain", "long_term_gain",
+                                "short_term_bias", "long_term_bias", OFFSET)}
+
+        vi_val = builder.load(builder.gep(vi, [ctx.int32_ty(0), index]))
+        prev_short_ptr = builder.gep(prev_short_ptr, [ctx.int32_ty(0), index])
+        prev_long_ptr = builder.gep(prev_long_ptr, [ctx.int32_ty(0), index])
+
+        # Mirror the argument order used by function: the rate takes the place of the previous value
+        # in the EWMA filter, and the previous average the place of the rate
+        avgs = []
+        for prev_ptr, rate in ((prev_short_ptr, param_vals["short_term_rate"]),
+                               (prev_long_ptr, param_vals["long_term_rate"])):
+            prev_val = builder.load(prev_ptr)
+            rev_prev = builder.fsub(ctx.float_ty(1), prev_val)
+            old_val = builder.fmul(rev_prev, rate)
+            new_val = builder.fmul(prev_val, vi_val)
+            avg = builder.fadd(old_val, new_val)
+            builder.store(avg, prev_ptr)
+            avgs.append(avg)
+
+        short_logistic = self.__gen_llvm_logistic(builder, ctx, avgs[0], param_vals["short_term_gain"],
+                                                  param_vals["short_term_bias"])
+        long_logistic = self.__gen_llvm_logistic(builder, ctx, avgs[1], param_vals["long_term_gain"],
+                                                 param_vals["long_term_bias"])
+        rev_short = builder.fsub(ctx.float_ty(1), short_logistic)
+
+        if operation == PRODUCT:
+            res = builder.fmul(rev_short, long_logistic)
+        elif operation == SUM:
+            res = builder.fadd(rev_short, long_logistic)
+        elif operation == S_MINUS_L:
+            res = builder.fsub(rev_short, long_logistic)
+        elif operation == L_MINUS_S:
+            res = builder.fsub(long_logistic, rev_short)
+        else:
+            raise FunctionError("Invalid operation ({}) selected for {}".format(operation, self.name))
+
+        res = builder.fadd(res, param_vals[OFFSET])
+        builder.store(res, builder.gep(vo, [ctx.int32_ty(0), index]))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        # Get rid of 2d array.
+        # When part of a Mechanism, the input, output and state are 2d arrays.
+        arg_in = ctx.unwrap_2d_array(builder, arg_in)
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+        prev_short_ptr = ctx.get_state_ptr(self, builder, state, "previous_short_term_avg")
+        prev_short_ptr = ctx.unwrap_2d_array(builder, prev_short_ptr)
+        prev_long_ptr = ctx.get_state_ptr(self, builder, state, "previous_long_term_avg")
+        prev_long_ptr = ctx.unwrap_2d_array(builder, prev_long_ptr)
+        assert len(prev_short_ptr.type.pointee) == len(arg_in.type.pointee)
+        assert len(prev_long_ptr.type.pointee) == len(arg_in.type.pointee)
+
+        operation = self.get_current_function_param(OPERATION)
+        with pnlvm.helpers.array_ptr_loop(builder, arg_in, "integrate") as args:
+            self.__gen_llvm_integrate(*args, ctx, arg_in, arg_out, params, prev_short_ptr, prev_long_ptr,
+                                      operation)
+
+        return builder
+
     def function(self,
                  variable=None,
                  execution_id=None,
@@ -2053,6 +2205,48 @@ class InteractiveActivationIntegrator(IntegratorFunction):  # ------------------
                 raise FunctionError("Value(s) specified for {} argument of {} ({}) must be in interval [0,1]".
                                     format(repr(DECAY), self.__class__.__name__, decay))
 
+    def __gen_llvm_integrate(self, builder, index, ctx, vi, vo, params, prev_ptr):
+        param_vals = {p: self._gen_llvm_load_param(ctx, builder, params, index, p)
+                      for p in (RATE, DECAY, REST, "max_val", "min_val", NOISE)}
+
+        vi_val = builder.load(builder.gep(vi, [ctx.int32_ty(0), index]))
+        prev_ptr = builder.gep(prev_ptr, [ctx.int32_ty(0), index])
+        prev_val = builder.load(prev_ptr)
+
+        # Distance from the asymptote the input drives the activation towards
+        dist_up = builder.fsub(param_vals["max_val"], prev_val)
+        dist_down = builder.fsub(prev_val, param_vals["min_val"])
+        is_pos = builder.fcmp_ordered(">", vi_val, ctx.float_ty(0))
+        is_neg = builder.fcmp_ordered("<", vi_val, ctx.float_ty(0))
+        dist = builder.select(is_neg, dist_down, ctx.float_ty(0))
+        dist = builder.select(is_pos, dist_up, dist)
+
+        dist_from_rest = builder.fsub(prev_val, param_vals[REST])
+
+        val = builder.fadd(vi_val, param_vals[NOISE])
+        val = builder.fmul(val, param_vals[RATE])
+        val = builder.fmul(val, dist)
+        decay = builder.fmul(param_vals[DECAY], dist_from_rest)
+        res = builder.fadd(prev_val, val)
+        res = builder.fsub(res, decay)
+
+        builder.store(res, builder.gep(vo, [ctx.int32_ty(0), index]))
+        builder.store(res, prev_ptr)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        # Get rid of 2d array.
+        # When part of a Mechanism, the input, output and state are 2d arrays.
+        arg_in = ctx.unwrap_2d_array(builder, arg_in)
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+        prev_ptr = ctx.get_state_ptr(self, builder, state, "previous_value")
+        prev_ptr = ctx.unwrap_2d_array(builder, prev_ptr)
+        assert len(prev_ptr.type.pointee) == len(arg_in.type.pointee)
+
+        with pnlvm.helpers.array_ptr_loop(builder, arg_in, "integrate") as args:
+            self.__gen_llvm_integrate(*args, ctx, arg_in, arg_out, params, prev_ptr)
+
+        return builder
+
     def function(self, variable=None, execution_id=None, params=None, context=None):
         """
 
@@ -3085,6 +3279,51 @@ class LeakyCompetingIntegrator(IntegratorFunction):  # -------------------------
 
         return self.convert_output_type(adjusted_value)
 
+    def __gen_llvm_integrate(self, builder, index, ctx, vi, vo, params, state):
+        rate = self._gen_llvm_load_param(ctx, builder, params, index, RATE)
+        offset = self._gen_llvm_load_param(ctx, builder, params, index, OFFSET)
+        noise = self._gen_llvm_load_param(ctx, builder, params, index, NOISE)
+        time_step_size = self._gen_llvm_load_param(ctx, builder, params, index, TIME_STEP_SIZE)
+
+        prev_ptr = ctx.get_state_ptr(self, builder, state, "previous_value")
+        # Get rid of 2d array. When part of a Mechanism the input,
+        # (and output, and context) are 2d arrays.
+        prev_ptr = ctx.unwrap_2d_array(builder, prev_ptr)
+        assert len(prev_ptr.type.pointee) == len(vi.type.pointee)
+
+        prev_ptr = builder.gep(prev_ptr, [ctx.int32_ty(0), index])
+        prev_val = builder.load(prev_ptr)
+
+        vi_ptr = builder.gep(vi, [ctx.int32_ty(0), index])
+        vi_val = builder.load(vi_ptr)
+
+        # previous_value + (rate * previous_value + variable) * time_step_size
+        #     + noise * sqrt(time_step_size) + offset
+        ret = builder.fmul(prev_val, rate)
+        ret = builder.fadd(ret, vi_val)
+        ret = builder.fmul(ret, time_step_size)
+        ret = builder.fadd(prev_val, ret)
+
+        sqrt_f = ctx.get_builtin("sqrt", [ctx.float_ty])
+        noise = builder.fmul(noise, builder.call(sqrt_f, [time_step_size]))
+        ret = builder.fadd(ret, noise)
+        res = builder.fadd(ret, offset)
+
+        vo_ptr = builder.gep(vo, [ctx.int32_ty(0), index])
+        builder.store(res, vo_ptr)
+        builder.store(res, prev_ptr)
+
+    def _gen_llvm_function_body(self, ctx, builder, params, state, arg_in, arg_out):
+        # Get rid of 2d array.
+        # When part of a Mechanism, the input and output are 2d arrays.
+        arg_in = ctx.unwrap_2d_array(builder, arg_in)
+        arg_out = ctx.unwrap_2d_array(builder, arg_out)
+
+        with pnlvm.helpers.array_ptr_loop(builder, arg_in, "integrate") as args:
+            self.__gen_llvm_integrate(*args, ctx, arg_in, arg_out, params, state)
+
+        return builder
+
 
 class FitzHughNagumoIntegrator(IntegratorFunction):  # ----------------------------------------------------------------------------
     """
@@ -61,7 +61,7 @@ from psyneulink.core.globals.keywords import \
     GAUSSIAN_FUNCTION, STANDARD_DEVIATION, GAUSSIAN_DISTORT_FUNCTION
 
 from psyneulink.core.globals.parameters import Parameter
-from psyneulink.core.globals.utilities import parameter_spec, get_global_seed
+from psyneulink.core.globals.utilities import parameter_spec, get_global_seed, is_sparse_matrix
 from psyneulink.core.globals.context import ContextFlags
 from psyneulink.core.globals.preferences.componentpreferenceset import \
     kpReportOutputPref, PreferenceEntry, PreferenceLevel, is_pref_set
@@ -154,6 +154,9 @@ class TransferFunction(Function_Base):
             length = arg_in.type.pointee.count * arg_in.type.pointee.element.count
             arg_in = builder.bitcast(arg_in, pnlvm.ir.ArrayType(ctx.float_ty, length).as_pointer())
             arg_out = builder.bitcast(arg_out, pnlvm.ir.ArrayType(ctx.float_ty, length).as_pointer())
+        else:
+            # 1d variable can produce 2d value (e.g. in ContrastiveHebbianMechanism)
+            arg_out = ctx.unwrap_2d_array(builder, arg_out)
 
         kwargs = {"ctx": ctx, "vi": arg_in, "vo": arg_out, "params": params, "state":state}
 
@@ -538,6 +541,10 @@ class Linear(TransferFunction):  # ---------------------------------------------
 
         return self.get_current_function_param(SLOPE, execution_id)
 
+    def _gen_llvm_derivative(self, builder, ctx, output, params):
+        slope_ptr = ctx.get_param_ptr(self, builder, params, SLOPE)
+        return pnlvm.helpers.load_extract_scalar_array_one(builder, slope_ptr)
+
 
 class Exponential(TransferFunction):  # --------------------------------------------------------------------------------
     """
@@ -1085,6 +1092,20 @@ class Logistic(TransferFunction):  # -------------------------------------------
 
         return gain * scale * output * (1 - output)
 
+    def _gen_llvm_derivative(self, builder, ctx, output, params):
+        # Derivative at the point that generated output (see derivative)
+        gain_ptr = ctx.get_param_ptr(self, builder, params, GAIN)
+        scale_ptr = ctx.get_param_ptr(self, builder, params, SCALE)
+
+        gain = pnlvm.helpers.load_extract_scalar_array_one(builder, gain_ptr)
+        scale = pnlvm.helpers.load_extract_scalar_array_one(builder, scale_ptr)
+
+        val = builder.fsub(ctx.float_ty(1), output)
+        val = builder.fmul(val, output)
+        val = builder.fmul(val, scale)
+        val = builder.fmul(val, gain)
+        return val
+
 
 class Tanh(TransferFunction):  # ------------------------------------------------------------------------------------
     """
@@ -2378,7 +2399,7 @@ class SoftMax(TransferFunction):
         builder.store(exp_sum_ptr.type.pointee(0), exp_sum_ptr)
 
         max_ptr = builder.alloca(ctx.float_ty)
-        builder.store(max_ptr.type.pointee('-inf'), max_ptr)
+        builder.store(max_ptr.type.pointee(float('-inf')), max_ptr)
 
         max_ind_ptr = builder.alloca(ctx.int32_ty)
         builder.store(max_ind_ptr.type.pointee(-1), max_ind_ptr)
@@ -2610,6 +2631,10 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
 
             - matrix keywords are not valid matrix specifications
 
+            - a `scipy.sparse <https://docs.scipy.org/doc/scipy/reference/sparse.html>`_ matrix is stored in CSR
+              format and is multiplied without being converted to a dense array, both in Python and in compiled
+              execution
+
     bounds : None
 
     params : Dict[param keyword: param value] : default None
@@ -2637,6 +2662,8 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         Can be specified as any of the following:
             * number - used as the filler value for all elements of the :keyword:`matrix` (call to np.fill);
             * list of arrays, 2d array or np.matrix - assigned as the value of :keyword:`matrix`;
+            * scipy.sparse matrix - converted to CSR format and assigned as the value of :keyword:`matrix`
+              (only when LinearMatrix is not the function of a Projection);
             * matrix keyword - see `MatrixKeywords` for list of options.
         Rows correspond to elements of the input array (outer index), and
         columns correspond to elements of the output array (inner index).
@@ -2917,7 +2944,17 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
                 param_value = param_set[MATRIX]
 
                 # numeric value specified; verify that it is compatible with variable
-                if isinstance(param_value, (float, list, np.ndarray, np.matrix)):
+                if is_sparse_matrix(param_value):
+                    param_size = param_value.shape[0]
+                    param_shape = param_value.shape
+                    variable_size = np.size(np.atleast_2d(self.defaults.variable),1)
+                    variable_shape = np.shape(np.atleast_2d(self.defaults.variable))
+                    if param_size != variable_size:
+                        raise FunctionError("Specification of matrix and/or default_variable for {} is not valid. The "
+                                            "shapes of variable {} and matrix {} are not compatible for multiplication".
+                                            format(self.name, variable_shape, param_shape))
+
+                elif isinstance(param_value, (float, list, np.ndarray, np.matrix)):
                     param_size = np.size(np.atleast_2d(param_value), 0)
                     param_shape = np.shape(np.atleast_2d(param_value))
                     variable_size = np.size(np.atleast_2d(self.defaults.variable),1)
@@ -2961,6 +2998,7 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
             + single number (used to fill self.matrix)
             + matrix keyword (see get_matrix)
             + 2D list or np.ndarray of numbers
+            + scipy.sparse matrix (not for Projections; converted to CSR format)
 
         :return matrix: (2D list)
         """
@@ -2990,6 +3028,8 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
                                     format(specification, self.name, self.owner_name, MATRIX_KEYWORD_NAMES))
             else:
                 return matrix
+        elif is_sparse_matrix(specification):
+            return specification.tocsr()
         else:
             return np.array(specification)
 
@@ -2998,6 +3038,33 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         default_val = np.atleast_1d(self.defaults.value)
         return ctx.convert_python_struct_to_llvm_ir(default_val)
 
+    def _get_param_values(self, execution_id=None):
+        matrix = self.parameters.matrix.get(execution_id)
+        if not is_sparse_matrix(matrix):
+            return super()._get_param_values(execution_id)
+
+        # Sparse matrix is passed in CSR format:
+        # (nonzero values, their column indices, offsets of the first nonzero value of every row)
+        # Values and indices are never read for an all zero matrix, but the arrays can't be empty
+        matrix = matrix.tocsr()
+        csr = (matrix.data.tolist() or [0.0], matrix.indices.tolist() or [0], matrix.indptr.tolist())
+        return tuple(csr if p.name == MATRIX else p.get(execution_id)
+                     for p in self._get_compilation_params(execution_id))
+
+    def _get_param_struct_type(self, ctx):
+        param_type = ctx.convert_python_struct_to_llvm_ir(self._get_param_values())
+        if not is_sparse_matrix(self.matrix):
+            return param_type
+
+        # Column indices and row offsets of a sparse matrix are integers
+        elements = list(param_type.elements)
+        matrix_idx = self._get_param_ids().index(MATRIX)
+        data_ty, indices_ty, indptr_ty = elements[matrix_idx].elements
+        elements[matrix_idx] = pnlvm.ir.LiteralStructType([data_ty,
+                                                           pnlvm.ir.ArrayType(ctx.int32_ty, indices_ty.count),
+                                                           pnlvm.ir.ArrayType(ctx.int32_ty, indptr_ty.count)])
+        return pnlvm.ir.LiteralStructType(elements)
+
     def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
         # Restrict to 1d arrays
         assert self.defaults.variable.ndim == 1
@@ -3005,14 +3072,20 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         matrix = ctx.get_param_ptr(self, builder, params, MATRIX)
 
         # Convert array pointer to pointer to the fist element
-        matrix = builder.gep(matrix, [ctx.int32_ty(0), ctx.int32_ty(0)])
         vec_in = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(0)])
         vec_out = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
 
         input_length = ctx.int32_ty(arg_in.type.pointee.count)
         output_length = ctx.int32_ty(arg_out.type.pointee.count)
-        builtin = ctx.get_llvm_function('__pnl_builtin_vxm')
-        builder.call(builtin, [vec_in, matrix, input_length, output_length, vec_out])
+        if is_sparse_matrix(self.matrix):
+            data, indices, indptr = (builder.gep(matrix, [ctx.int32_ty(0), ctx.int32_ty(i), ctx.int32_ty(0)])
+                                     for i in range(3))
+            builtin = ctx.get_llvm_function('__pnl_builtin_csr_vxm')
+            builder.call(builtin, [vec_in, data, indices, indptr, input_length, output_length, vec_out])
+        else:
+            matrix = builder.gep(matrix, [ctx.int32_ty(0), ctx.int32_ty(0)])
+            builtin = ctx.get_llvm_function('__pnl_builtin_vxm')
+            builder.call(builtin, [vec_in, matrix, input_length, output_length, vec_out])
         return builder
 
     def function(self,
@@ -3043,7 +3116,11 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
         # Note: this calls _validate_variable and _validate_params which are overridden above;
         variable = self._check_args(variable=variable, execution_id=execution_id, params=params, context=context)
         matrix = self.get_current_function_param(MATRIX, execution_id)
-        result = np.dot(variable, matrix)
+        if is_sparse_matrix(matrix):
+            # Multiply by the transposed matrix from the left, ndarray @ sparse would densify the matrix
+            result = matrix.T.dot(np.transpose(variable)).T
+        else:
+            result = np.dot(variable, matrix)
         return self.convert_output_type(result)
 
     @staticmethod
@@ -3100,6 +3177,7 @@ def get_matrix(specification, rows=1, cols=1, context=None):
             + FULL_CONNECTIVITY_MATRIX: all 1's
             + RANDOM_CONNECTIVITY_MATRIX (random floats uniformly distributed between 0 and 1)
         + 2D list or np.ndarray of numbers
+        + scipy.sparse matrix (returned in CSR format)
 
      Returns 2D array with length=rows in dim 0 and length=cols in dim 1, or none if specification is not recognized
     """
@@ -3108,6 +3186,9 @@ def get_matrix(specification, rows=1, cols=1, context=None):
     if isinstance(specification, (list, np.matrix)):
         specification = np.array(specification)
 
+    if is_sparse_matrix(specification):
+        return specification.tocsr()
+
     if isinstance(specification, np.ndarray):
         if specification.ndim == 2:
             return specification
@@ -11,6 +11,7 @@
 
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.function import ADDITIVE_PARAM, FunctionError, Function_Base, MULTIPLICATIVE_PARAM
 from psyneulink.core.globals.context import ContextFlags
 from psyneulink.core.globals.keywords import CONTEXT, CUSTOM_FUNCTION, PARAMETER_STATE_PARAMS, PARAMS, SELF, \
@@ -25,6 +26,7 @@ class UserDefinedFunction(Function_Base):
     """UserDefinedFunction(  \
     custom_function=None,    \
     default_variable=None,   \
+    compile_function=False,  \
     params=None,             \
     owner=None,              \
     name=None,               \
@@ -225,6 +227,32 @@ class UserDefinedFunction(Function_Base):
         array([[2.88079708, 2.98201379, 2.99752738]])
 
 
+    .. _UDF_Compilation:
+
+    **Compiling a custom function**
+
+    By default, a UDF always calls the Python function it wraps, which prevents a `Composition` that uses it from
+    being run in compiled mode.  If **compile_function** is True in the constructor for the UDF, its source is parsed
+    and translated to native code when the Composition is compiled.  This is supported only for a restricted subset of
+    Python:  arithmetic and comparisons of scalars and fixed-size arrays (following numpy broadcasting), numpy
+    elementwise functions (e.g., ``np.exp``, ``np.log``, ``np.sqrt``, ``np.tanh``, ``np.maximum``), ``np.dot``,
+    ``np.sum``, ``np.max`` and ``np.min``, ``if`` statements, and ``for`` loops over ``range`` or over the items of an
+    array.  For example::
+
+        >>> def my_leaky_fct(variable, leak=0.5):
+        ...     result = variable * 0
+        ...     for i in range(len(variable[0])):
+        ...         result[0][i] = np.tanh(variable[0][i]) - leak * variable[0][i]
+        ...     return result
+        >>> my_mech = pnl.ProcessingMechanism(default_variable=[[0, 0]],
+        ...                                   function=pnl.UserDefinedFunction(custom_function=my_leaky_fct,
+        ...                                                                    default_variable=[[0, 0]],
+        ...                                                                    compile_function=True))
+
+    If the function uses anything outside of this subset (for example, another PsyNeuLink `Function`, slicing, or a
+    ``while`` loop), compilation fails with an error that identifies the unsupported construct and its line, and a
+    Composition run with **bin_execute** = True falls back to executing in Python.
+
     .. _UDF_Assign_to_State_Examples:
 
     **Assigning of a custom function to a State**
@@ -293,6 +321,10 @@ class UserDefinedFunction(Function_Base):
         specifies the function to "wrap." It can be any function or method, including a lambda function;
         see `above <UDF_Description>` for additional details.
 
+    compile_function : bool : default False
+        specifies whether the source of `custom_function <UserDefinedFunction.custom_function>` is translated
+        when the UDF is compiled (see `above <UDF_Compilation>` for details).
+
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that specifies the parameters for the function.
         This can be used to define an `additive_param <UserDefinedFunction.additive_param>` and/or
@@ -321,6 +353,10 @@ class UserDefinedFunction(Function_Base):
     custom_function : function
         the user-specified function: called by the Function's `owner <Function_Base.owner>` when it is executed.
 
+    compile_function : bool
+        determines whether `custom_function <UserDefinedFunction.custom_function>` is translated when the UDF is
+        compiled (see `above <UDF_Compilation>` for details).
+
     additive_param : str
         this contains the name of the additive_param, if one has been specified for the UDF
         (see `above <UDF_Modulatory_Params>` for details).
@@ -367,6 +403,7 @@ class UserDefinedFunction(Function_Base):
     def __init__(self,
                  custom_function=None,
                  default_variable=None,
+                 compile_function: bool = False,
                  params=None,
                  owner=None,
                  prefs: is_pref_set = None,
@@ -429,6 +466,7 @@ class UserDefinedFunction(Function_Base):
         self.self_arg = False
         self.owner_arg = False
         self.execution_id_arg = False
+        self.compile_function = compile_function
 
         # Get variable and names of other any other args for custom_function and assign to cust_fct_params
         if params is not None and CUSTOM_FUNCTION in params:
@@ -526,3 +564,18 @@ class UserDefinedFunction(Function_Base):
 
         return self.convert_output_type(value)
 
+    def _gen_llvm_function_body(self, ctx, builder, params, _, arg_in, arg_out):
+        if not self.compile_function:
+            raise FunctionError("{} is not compiled unless it is created with compile_function=True".
+                                format(self.name))
+
+        param_ids = self._get_param_ids()
+        func_params = {param: ctx.get_param_ptr(self, builder, params, param)
+                       for param in self.cust_fct_params if param in param_ids}
+        try:
+            visitor = pnlvm.codegen.UserDefinedFunctionVisitor(ctx, builder, self.custom_function,
+                                                                func_params, arg_in, arg_out)
+            return visitor.gen_function_body()
+        except pnlvm.codegen.UnsupportedConstructError as e:
+            raise FunctionError("Unable to compile custom_function ({}) of {}: {}".
+                                format(self.custom_function.__name__, self.name, e))
@@ -1143,7 +1143,7 @@ class OptimizationControlMechanism(ControlMechanism):
 
         return fun_out, builder
 
-    def _gen_llvm_output_states(self, ctx, builder, params, context, value, so):
+    def _gen_llvm_output_states(self, ctx, builder, params, context, value, so, variable=None):
         for i, state in enumerate(self.output_states):
 
             # LLVM equivalent of parse value; extract array element
@@ -541,9 +541,10 @@ import typecheck as tc
 
 from enum import Enum
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.component import parameter_keywords
 from psyneulink.core.components.functions.function import ModulationParam, _is_modulation_param, is_function_type
-from psyneulink.core.components.functions.learningfunctions import BackPropagation
+from psyneulink.core.components.functions.learningfunctions import BackPropagation, ERROR_MATRIX
 from psyneulink.core.components.mechanisms.adaptive.adaptivemechanism import AdaptiveMechanism_Base
 from psyneulink.core.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.core.components.mechanisms.processing.objectivemechanism import ObjectiveMechanism
@@ -671,7 +672,8 @@ def _error_signal_getter(owning_component=None, execution_id=None):
         return None
 
 def _learning_mechanism_learning_rate_setter(value, owning_component=None, execution_id=None):
-    if hasattr(owning_component, "function") and owning_component.function:
+    # None means the function uses its own learning_rate, so don't overwrite it
+    if value is not None and hasattr(owning_component, "function") and owning_component.function:
         if hasattr(owning_component.function.parameters, "learning_rate"):
             owning_component.function.parameters.learning_rate.set(value, execution_id)
     return value
@@ -1171,10 +1173,13 @@ class LearningMechanism(AdaptiveMechanism_Base):
         super()._instantiate_attributes_before_function(function=function, context=context)
 
         self.error_matrices = None
-        if self.error_sources and not self.in_composition:
+        if self.error_sources:
             self.error_matrices = [None] * len(self.error_sources)
             for i, error_source in enumerate(self.error_sources):
-                self.error_signal_projection = _instantiate_error_signal_projection(sender=error_source, receiver=self)
+                # A Composition creates the Projections from the error_sources itself
+                if not self.in_composition:
+                    self.error_signal_projection = _instantiate_error_signal_projection(sender=error_source,
+                                                                                        receiver=self)
                 if isinstance(error_source, ObjectiveMechanism):
                     self.error_matrices[i] = np.identity(len(error_source.input_states[SAMPLE].value))
                 else:
@@ -1320,6 +1325,94 @@ class LearningMechanism(AdaptiveMechanism_Base):
 
         return [summed_learning_signal, summed_error_signal]
 
+    def _get_context_matrices(self, execution_id=None):
+        """Return the (MappingProjection, matrix) pairs for the error_matrices kept in the compiled context
+
+        The error_matrices that are matrices of MappingProjections are not accessible from the Mechanism's compiled
+        code, so copies of them are kept in the context, and are updated by a compiled Composition before the
+        Mechanism executes;  the MappingProjection is None for an error_matrix that is specified as an array.
+        """
+        if ERROR_MATRIX not in self.function._get_param_ids() or not self.error_matrices:
+            return []
+
+        context_matrices = []
+        for error_matrix in self.error_matrices:
+            if isinstance(error_matrix, ParameterState):
+                matrix = error_matrix.parameters.value.get(execution_id)
+                if matrix is None:
+                    matrix = error_matrix.defaults.value
+                context_matrices.append((error_matrix.owner, np.asfarray(np.atleast_2d(matrix))))
+            else:
+                context_matrices.append((None, np.asfarray(np.atleast_2d(error_matrix))))
+        return context_matrices
+
+    def _get_context_struct_type(self, ctx):
+        mech_t = ctx.get_context_struct_type(super())
+        # Matrices can have different shapes
+        matrices_t = ctx.convert_python_struct_to_llvm_ir(tuple(m for _, m in self._get_context_matrices()))
+        return pnlvm.ir.LiteralStructType([mech_t, matrices_t])
+
+    def _get_context_initializer(self, execution_id):
+        mech_init = super()._get_context_initializer(execution_id)
+        matrices_init = pnlvm._tupleize([m for _, m in self._get_context_matrices(execution_id)])
+        return tuple((mech_init, matrices_init))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, context, arg_in, arg_out):
+        zero = ctx.int32_ty(0)
+        mech_context = builder.gep(context, [zero, zero])
+
+        is_output, builder = self._gen_llvm_input_states(ctx, builder, params, mech_context, arg_in)
+
+        mf_params_ptr = builder.gep(params, [zero, ctx.int32_ty(1)])
+        mf_params, builder = self._gen_llvm_param_states(self.function, mf_params_ptr, ctx, builder,
+                                                         params, mech_context, arg_in)
+        mf_ctx = builder.gep(mech_context, [zero, ctx.int32_ty(1)])
+
+        function = ctx.get_llvm_function(self.function)
+        f_in = builder.alloca(function.args[2].type.pointee)
+        f_out = builder.alloca(function.args[3].type.pointee)
+        value = builder.alloca(function.args[3].type.pointee)
+        builder.store(value.type.pointee(None), value)
+
+        for idx in (ACTIVATION_INPUT_INDEX, ACTIVATION_OUTPUT_INDEX):
+            is_out = builder.gep(is_output, [zero, ctx.int32_ty(idx)])
+            builder.store(builder.load(is_out), builder.gep(f_in, [zero, ctx.int32_ty(idx)]))
+
+        # Execute function for each error_signal, error_matrix pair, and sum the results (see _execute)
+        has_context_matrices = len(self._get_context_matrices()) > 0
+        for state in self.error_signal_input_states:
+            is_idx = self.input_states.index(state)
+            is_out = builder.gep(is_output, [zero, ctx.int32_ty(is_idx)])
+            builder.store(builder.load(is_out), builder.gep(f_in, [zero, ctx.int32_ty(ERROR_OUTPUT_INDEX)]))
+
+            if has_context_matrices:
+                matrix = builder.gep(context, [zero, ctx.int32_ty(1), ctx.int32_ty(is_idx - ERROR_OUTPUT_INDEX)])
+                error_matrix = ctx.get_param_ptr(self.function, builder, mf_params, ERROR_MATRIX)
+                matrix = builder.bitcast(matrix, error_matrix.type)
+                builder.store(builder.load(matrix), error_matrix)
+
+            builder.call(function, [mf_params, mf_ctx, f_in, f_out])
+            builder = self._gen_llvm_sum(ctx, builder, f_out, value)
+
+        builder = self._gen_llvm_output_states(ctx, builder, params, mech_context, value, arg_out, variable=is_output)
+
+        return builder
+
+    def _gen_llvm_sum(self, ctx, builder, src, dst):
+        # Add src to dst, element-wise
+        dst_ty = dst.type.pointee
+        if isinstance(dst_ty, pnlvm.ir.LiteralStructType):
+            for i in range(len(dst_ty.elements)):
+                idx = [ctx.int32_ty(0), ctx.int32_ty(i)]
+                builder = self._gen_llvm_sum(ctx, builder, builder.gep(src, idx), builder.gep(dst, idx))
+        elif isinstance(dst_ty, pnlvm.ir.ArrayType):
+            with pnlvm.helpers.array_ptr_loop(builder, dst, "sum") as (b, i):
+                idx = [ctx.int32_ty(0), i]
+                self._gen_llvm_sum(ctx, b, b.gep(src, idx), b.gep(dst, idx))
+        else:
+            builder.store(builder.fadd(builder.load(dst), builder.load(src)), dst)
+        return builder
+
     @property
     def learning_enabled(self):
         try:
@@ -957,7 +957,7 @@ from psyneulink.core.globals.keywords import \
     CURRENT_EXECUTION_COUNT, CURRENT_EXECUTION_TIME, EXECUTION_PHASE, FUNCTION, FUNCTION_PARAMS, \
     INITIALIZING, INIT_EXECUTE_METHOD_ONLY, INIT_FUNCTION_METHOD_ONLY, \
     INPUT_LABELS_DICT, INPUT_STATES, INPUT_STATE_VARIABLES, MONITOR_FOR_CONTROL, MONITOR_FOR_LEARNING, \
-    OUTPUT_LABELS_DICT, OUTPUT_STATES, OWNER_VALUE, PARAMETER_STATES, PREVIOUS_VALUE, REFERENCE_VALUE, \
+    OUTPUT_LABELS_DICT, OUTPUT_STATES, OWNER_VALUE, OWNER_VARIABLE, PARAMETER_STATES, PREVIOUS_VALUE, REFERENCE_VALUE, \
     TARGET_LABELS_DICT, VALUE, VARIABLE, kwMechanismComponentCategory
 from psyneulink.core.globals.parameters import Parameter, parse_execution_context
 from psyneulink.core.globals.preferences.preferenceset import PreferenceLevel
@@ -2621,13 +2621,13 @@ class Mechanism_Base(Mechanism):
         param_init_list = [input_param_init, function_param_init,
                            output_param_init, param_param_init]
 
-        mech_params_init = self._get_mech_params_init()
+        mech_params_init = self._get_mech_params_init(execution_id)
         if mech_params_init is not None:
             param_init_list.append(mech_params_init)
 
         return tuple(param_init_list)
 
-    def _get_mech_params_init(self):
+    def _get_mech_params_init(self, execution_id=None):
         pass
 
     def _get_input_context_initializer(self, execution_id):
@@ -2681,12 +2681,15 @@ class Mechanism_Base(Mechanism):
 
         return is_output, builder
 
-    def _gen_llvm_param_states(self, func, f_params_ptr, ctx, builder, params, context, si):
+    def _gen_llvm_param_states(self, func, f_params_ptr, ctx, builder, params, context, si, param_ids=None):
         # Allocate a shadow structure to overload user supplied parameters
         f_params = builder.alloca(f_params_ptr.type.pointee, 1)
 
         # Call parameter states for function
-        for idx, f_param in enumerate(func._get_param_ids()):
+        # (or for the params listed in param_ids, e.g. parameters of the Mechanism itself)
+        if param_ids is None:
+            param_ids = func._get_param_ids()
+        for idx, f_param in enumerate(param_ids):
             param_in_ptr = builder.gep(f_params_ptr, [ctx.int32_ty(0), ctx.int32_ty(idx)])
             raw_param_val = builder.load(param_in_ptr)
             param_out_ptr = builder.gep(f_params, [ctx.int32_ty(0), ctx.int32_ty(idx)])
@@ -2728,14 +2731,18 @@ class Mechanism_Base(Mechanism):
             builder.call(ps_function, [ps_params, ps_context, ps_input, ps_output])
         return f_params, builder
 
-    def _gen_llvm_output_states(self, ctx, builder, params, context, value, so):
+    def _gen_llvm_output_states(self, ctx, builder, params, context, value, so, variable=None):
         for i, state in enumerate(self.output_states):
             #FIXME: can we rely on this?
             os_in_spec = state._variable_spec
             if os_in_spec == OWNER_VALUE:
                 os_input = value
+            elif os_in_spec == OWNER_VARIABLE and variable is not None:
+                os_input = variable
             elif isinstance(os_in_spec, tuple) and os_in_spec[0] == OWNER_VALUE:
                 os_input = builder.gep(value, [ctx.int32_ty(0), ctx.int32_ty(os_in_spec[1])])
+            elif isinstance(os_in_spec, tuple) and os_in_spec[0] == OWNER_VARIABLE and variable is not None:
+                os_input = builder.gep(variable, [ctx.int32_ty(0), ctx.int32_ty(os_in_spec[1])])
             #FIXME: For some reason this can be wrapped in a list
             elif isinstance(os_in_spec, list) and len(os_in_spec) == 1 and isinstance(os_in_spec[0], tuple) and os_in_spec[0][0] == OWNER_VALUE:
                 os_input = builder.gep(value, [ctx.int32_ty(0), ctx.int32_ty(os_in_spec[0][1])])
@@ -2746,8 +2753,13 @@ class Mechanism_Base(Mechanism):
             os_params = builder.gep(params, [ctx.int32_ty(0), ctx.int32_ty(2), ctx.int32_ty(i)])
             os_context = builder.gep(context, [ctx.int32_ty(0), ctx.int32_ty(2), ctx.int32_ty(i)])
             os_output = builder.gep(so, [ctx.int32_ty(0), ctx.int32_ty(i)])
-            os_function = ctx.get_llvm_function(state)
-            builder.call(os_function, [os_params, os_context, os_input, os_output])
+            builder = self._gen_llvm_output_state(ctx, builder, state, os_params, os_context, os_input, os_output)
+
+        return builder
+
+    def _gen_llvm_output_state(self, ctx, builder, state, params, context, os_input, os_output):
+        os_function = ctx.get_llvm_function(state)
+        builder.call(os_function, [params, context, os_input, os_output])
 
         return builder
 
@@ -2772,7 +2784,7 @@ class Mechanism_Base(Mechanism):
 
         ppval, builder = self._gen_llvm_function_postprocess(builder, ctx, value)
 
-        builder = self._gen_llvm_output_states(ctx, builder, params, context, ppval, arg_out)
+        builder = self._gen_llvm_output_states(ctx, builder, params, context, ppval, arg_out, variable=is_output)
         return builder
 
     def _gen_llvm_function_input_parse(self, builder, ctx, func, func_in):
@@ -508,6 +508,7 @@ class TransferMechanism(ProcessingMechanism_Base):
     convergence_function=Distance(metric=DIFFERENCE),                             \
     convergence_criterion=None,                                                   \
     max_passes=None,                                                              \
+    execute_until_converged=False,                                                \
     output_states=RESULTS                                                         \
     params=None,                                                                  \
     name=None,                                                                    \
@@ -628,6 +629,12 @@ class TransferMechanism(ProcessingMechanism_Base):
         the `convergence_criterion <RecurrentTransferMechanism.convergence_criterion>`, after which an error occurs;
         if `None` is specified, execution may continue indefinitely or until an interpreter exception is generated.
 
+    execute_until_converged : bool : default False
+        specifies whether, in compiled execution, the Mechanism executes repeatedly within a single call until its
+        `convergence_criterion <TransferMechanism.convergence_criterion>` or `max_passes
+        <TransferMechanism.max_passes>` is reached (see `execute_until_converged
+        <TransferMechanism.execute_until_converged>`).
+
     output_states : str, list or np.ndarray : default RESULTS
         specifies the OutputStates for the TransferMechanism; by default, one is created for each InputState
         specified in **input_states**;  see `note <TransferMechanism_OutputStates_Note>`, and `output_states
@@ -785,6 +792,14 @@ class TransferMechanism(ProcessingMechanism_Base):
         the `convergence_criterion <TransferMechanism.convergence_criterion>`, after which an error occurs;
         if `None` is specified, execution may continue indefinitely or until an interpreter exception is generated.
 
+    execute_until_converged : bool
+        determines whether, in compiled execution, the Mechanism is executed repeatedly within a single call (i.e.,
+        without returning to the `Scheduler`) until `delta <TransferMechanism.delta>` is less than or equal to
+        `convergence_criterion <TransferMechanism.convergence_criterion>`.  Since compiled code cannot generate an
+        error, execution stops once the number of executions reaches `max_passes <TransferMechanism.max_passes>`
+        (if it is specified).  This has no effect if `convergence_criterion <TransferMechanism.convergence_criterion>`
+        is `None`, or on execution in Python, in which each execution is a single `pass <TimeScale.PASS>`.
+
     output_states : *ContentAddressableList[OutputState]*
         list of Mechanism's `OutputStates <OutputStates>`; by default there is one OutputState for each InputState,
         with the base name `RESULT` (see `TransferMechanism_OutputStates` for additional details).
@@ -850,6 +865,12 @@ class TransferMechanism(ProcessingMechanism_Base):
                     :default value: `Distance`
                     :type: `Function`
 
+                execute_until_converged
+                    see `execute_until_converged <TransferMechanism.execute_until_converged>`
+
+                    :default value: False
+                    :type: bool
+
                 initial_value
                     see `initial_value <TransferMechanism.initial_value>`
 
@@ -913,6 +934,7 @@ class TransferMechanism(ProcessingMechanism_Base):
         convergence_criterion = Parameter(0.01, modulable=True)
         convergence_function = Parameter(Distance(metric=DIFFERENCE), stateful=False, loggable=False)
         max_passes = Parameter(1000, stateful=False)
+        execute_until_converged = Parameter(False, stateful=False, loggable=False)
 
         def _validate_integrator_mode(self, integrator_mode):
             if not isinstance(integrator_mode, bool):
@@ -934,6 +956,7 @@ class TransferMechanism(ProcessingMechanism_Base):
                  convergence_function:tc.any(is_function_type)=Distance(metric=DIFFERENCE),
                  convergence_criterion:float=0.01,
                  max_passes:tc.optional(int)=1000,
+                 execute_until_converged:bool=False,
                  output_states:tc.optional(tc.any(str, Iterable))=RESULTS,
                  params=None,
                  name=None,
@@ -963,6 +986,7 @@ class TransferMechanism(ProcessingMechanism_Base):
                                                   max_passes=max_passes,
                                                   params=params)
         self.on_resume_integrator_mode = on_resume_integrator_mode
+        self.execute_until_converged = execute_until_converged
         # self.integrator_function = None
         self.has_integrated = False
         self._current_variable_index = 0
@@ -1327,11 +1351,19 @@ class TransferMechanism(ProcessingMechanism_Base):
             current_input[maxCapIndices] = np.max(clip)
         return current_input
 
+    @property
+    def _compiled_convergence_loop(self):
+        return self.execute_until_converged and self.convergence_criterion is not None
+
     def _get_function_param_struct_type(self, ctx):
         param_type_list = [ctx.get_param_struct_type(self.function)]
         if self.integrator_mode:
             assert self.integrator_function is not None
             param_type_list.append(ctx.get_param_struct_type(self.integrator_function))
+        if self._compiled_convergence_loop:
+            param_type_list.append(ctx.get_param_struct_type(self.convergence_function))
+            # convergence_criterion and max_passes
+            param_type_list.append(pnlvm.ir.LiteralStructType([ctx.float_ty, ctx.float_ty]))
         return pnlvm.ir.LiteralStructType(param_type_list)
 
     def _get_function_context_struct_type(self, ctx):
@@ -1339,6 +1371,10 @@ class TransferMechanism(ProcessingMechanism_Base):
         if self.integrator_mode:
            assert self.integrator_function is not None
            context_type_list.append(ctx.get_context_struct_type(self.integrator_function))
+        if self._compiled_convergence_loop:
+            context_type_list.append(ctx.get_context_struct_type(self.convergence_function))
+            # value of the previous execution
+            context_type_list.append(ctx.get_output_struct_type(self.function))
 
         return pnlvm.ir.LiteralStructType(context_type_list)
 
@@ -1347,6 +1383,11 @@ class TransferMechanism(ProcessingMechanism_Base):
         if self.integrator_mode:
             assert self.integrator_function is not None
             function_param_list.append(self.integrator_function._get_param_initializer(execution_id))
+        if self._compiled_convergence_loop:
+            # convergence_function is not a dependent component, and is executed in the default context
+            function_param_list.append(self.convergence_function._get_param_initializer(None))
+            max_passes = self.max_passes if self.max_passes is not None else 0
+            function_param_list.append((self.convergence_criterion, max_passes))
         return tuple(function_param_list)
 
     def _get_function_context_initializer(self, execution_id):
@@ -1354,9 +1395,104 @@ class TransferMechanism(ProcessingMechanism_Base):
         if self.integrator_mode:
             assert self.integrator_function is not None
             context_list.append(self.integrator_function._get_context_initializer(execution_id))
+        if self._compiled_convergence_loop:
+            context_list.append(self.convergence_function._get_context_initializer(None))
+            # Same as _update_previous_value
+            previous_value = self.parameters.value.get(execution_id)
+            if previous_value is None:
+                previous_value = self.defaults.value
+            context_list.append(pnlvm._tupleize(np.atleast_2d(previous_value)))
         return tuple(context_list)
 
+    def _gen_llvm_transfer_structs(self, ctx, builder, params, context):
+        # Subclasses that extend the param and context structures keep those of TransferMechanism in the first element
+        return params, context
+
+    def _gen_llvm_delta_function(self, ctx):
+        # The variable of convergence_function is not shaped after the Mechanism,
+        # generate a version that compares the first items of two values
+        item_t = ctx.get_output_struct_type(self.function).element
+        args = [ctx.get_param_struct_type(self.convergence_function).as_pointer(),
+                ctx.get_context_struct_type(self.convergence_function).as_pointer(),
+                pnlvm.ir.ArrayType(item_t, 2).as_pointer(),
+                ctx.float_ty.as_pointer()]
+        func_ty = pnlvm.ir.FunctionType(pnlvm.ir.VoidType(), args)
+        llvm_func = pnlvm.ir.Function(ctx.module, func_ty, name=ctx.get_unique_name(str(self) + "_delta"))
+        llvm_func.attributes.add('argmemonly')
+        llvm_func.attributes.add('alwaysinline')
+
+        builder = pnlvm.ir.IRBuilder(llvm_func.append_basic_block(name="entry"))
+        builder = self.convergence_function._gen_llvm_function_body(ctx, builder, *llvm_func.args)
+        builder.ret_void()
+
+        return llvm_func
+
+    def _gen_llvm_execute_pass_function(self, ctx, params, context, arg_in, arg_out):
+        # Each pass is a separate function, its temporaries are allocated
+        # in the entry block when it is inlined in the convergence loop
+        args = [params.type, context.type, arg_in.type, arg_out.type]
+        func_ty = pnlvm.ir.FunctionType(pnlvm.ir.VoidType(), args)
+        llvm_func = pnlvm.ir.Function(ctx.module, func_ty, name=ctx.get_unique_name(str(self) + "_pass"))
+        llvm_func.attributes.add('argmemonly')
+        llvm_func.attributes.add('alwaysinline')
+
+        builder = pnlvm.ir.IRBuilder(llvm_func.append_basic_block(name="entry"))
+        builder = self._gen_llvm_execute_pass(ctx, builder, *llvm_func.args)
+        builder.ret_void()
+
+        return llvm_func
+
     def _gen_llvm_function_body(self, ctx, builder, params, context, arg_in, arg_out):
+        if not self._compiled_convergence_loop:
+            return self._gen_llvm_execute_pass(ctx, builder, params, context, arg_in, arg_out)
+
+        zero = ctx.int32_ty(0)
+        transfer_params, transfer_context = self._gen_llvm_transfer_structs(ctx, builder, params, context)
+        f_params = builder.gep(transfer_params, [zero, ctx.int32_ty(1)])
+        f_context = builder.gep(transfer_context, [zero, ctx.int32_ty(1)])
+
+        # Convergence function and its parameters follow the main and integrator functions
+        idx = 2 if self.integrator_mode else 1
+        convergence_params = builder.gep(f_params, [zero, ctx.int32_ty(idx)])
+        convergence_context = builder.gep(f_context, [zero, ctx.int32_ty(idx)])
+        loop_params = builder.gep(f_params, [zero, ctx.int32_ty(idx + 1)])
+        criterion, max_passes = (builder.load(builder.gep(loop_params, [zero, ctx.int32_ty(i)])) for i in range(2))
+        value = builder.gep(f_context, [zero, ctx.int32_ty(idx + 1)])
+
+        pass_function = self._gen_llvm_execute_pass_function(ctx, params, context, arg_in, arg_out)
+        delta_function = self._gen_llvm_delta_function(ctx)
+        delta_in = builder.alloca(delta_function.args[2].type.pointee)
+        delta_out = builder.alloca(ctx.float_ty)
+
+        passes_ptr = builder.alloca(ctx.int32_ty)
+        builder.store(ctx.int32_ty(0), passes_ptr)
+
+        converge_block = builder.append_basic_block(name="converge")
+        converged_block = builder.append_basic_block(name="converged")
+        builder.branch(converge_block)
+        builder.position_at_end(converge_block)
+
+        # Same as delta: compare first items of the current and previous value
+        builder.store(builder.load(builder.gep(value, [zero, zero])), builder.gep(delta_in, [zero, ctx.int32_ty(1)]))
+        builder.call(pass_function, [params, context, arg_in, arg_out])
+        builder.store(builder.load(builder.gep(value, [zero, zero])), builder.gep(delta_in, [zero, zero]))
+        builder.call(delta_function, [convergence_params, convergence_context, delta_in, delta_out])
+        converged = builder.fcmp_ordered("<=", builder.load(delta_out), criterion)
+
+        passes = builder.add(builder.load(passes_ptr), ctx.int32_ty(1))
+        builder.store(passes, passes_ptr)
+
+        # Compiled execution can't report exceeding max_passes, stop executing instead
+        if self.max_passes is not None:
+            max_passes_reached = builder.fcmp_ordered(">=", builder.uitofp(passes, ctx.float_ty), max_passes)
+            converged = builder.or_(converged, max_passes_reached)
+
+        builder.cbranch(converged, converged_block, converge_block)
+        builder.position_at_end(converged_block)
+
+        return builder
+
+    def _gen_llvm_execute_pass(self, ctx, builder, params, context, arg_in, arg_out):
         is_out, builder = self._gen_llvm_input_states(ctx, builder, params, context, arg_in)
 
         # Parameters and context for both integrator and main function
@@ -1396,7 +1532,12 @@ class TransferMechanism(ProcessingMechanism_Base):
                     val = pnlvm.helpers.fclamp(builder, val, clip[0], clip[1])
                     builder.store(val, ptro)
 
-        builder = self._gen_llvm_output_states(ctx, builder, params, context, mf_out, arg_out)
+        if self._compiled_convergence_loop:
+            # Keep the value for convergence check of the next execution
+            value = builder.gep(f_context, [ctx.int32_ty(0), ctx.int32_ty(3 if self.integrator_mode else 2)])
+            builder.store(builder.load(mf_out), value)
+
+        builder = self._gen_llvm_output_states(ctx, builder, params, context, mf_out, arg_out, variable=is_out)
 
         return builder
 
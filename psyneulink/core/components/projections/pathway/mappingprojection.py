@@ -290,6 +290,7 @@ from psyneulink.core.globals.log import ContextFlags
 from psyneulink.core.globals.parameters import Parameter
 from psyneulink.core.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.core.globals.preferences.preferenceset import PreferenceEntry, PreferenceLevel
+from psyneulink.core.globals.utilities import is_sparse_matrix
 
 __all__ = [
     'MappingError', 'MappingProjection',
@@ -465,7 +466,7 @@ class MappingProjection(PathwayProjection_Base):
     matrix : list, np.ndarray, np.matrix, function or keyword : default DEFAULT_MATRIX
         the matrix used by `function <MappingProjection.function>` (default: `LinearCombination`) to transform the
         value of the `sender <MappingProjection.sender>` into a form suitable for the `variable <InputState.variable>`
-        of its `receiver <MappingProjection.receiver>`.
+        of its `receiver <MappingProjection.receiver>`.  Sparse matrices are not supported (see `LinearMatrix`).
 
     params : Dict[param keyword: param value] : default None
         a `parameter dictionary <ParameterState_Specification>` that can be used to specify the parameters for
@@ -630,6 +631,11 @@ class MappingProjection(PathwayProjection_Base):
         # it wasn't working.
         if isinstance(matrix, (np.matrix, list)):
             matrix = np.array(matrix)
+        # The matrix ParameterState (and learning) operate on dense matrices
+        if is_sparse_matrix(matrix):
+            raise MappingError("A sparse matrix was specified for {}; sparse matrices are only supported for a {} "
+                               "that is not the function of a Projection".
+                               format(name or self.__class__.__name__, LinearMatrix.__name__))
 
         params = self._assign_args_to_param_dicts(function_params={MATRIX: matrix},
                                                   suppress_identity_function=suppress_identity_function,
@@ -842,9 +842,9 @@ class ParameterState(State_Base):
         f_params = builder.alloca(state_f.args[0].type.pointee, 1)
         builder.store(builder.load(params), f_params)
 
-        # FIXME: is this always true, by design?
-        assert len(self.mod_afferents) <= 1
-
+        # Values of ModulatoryProjections that modulate the same param are combined
+        # as in uncompiled execution (see reduce of ModulationParam.MULTIPLICATIVE and ADDITIVE)
+        modulated_params = set()
         for idx, afferent in enumerate(self.mod_afferents):
             # The first input is function input (the old parameter value)
             # Modulatory projections are ordered after that
@@ -856,10 +856,12 @@ class ParameterState(State_Base):
 
             if afferent.sender.modulation is ModulationParam.MULTIPLICATIVE:
                 name = self.function.multiplicative_param
+                combine = builder.fmul
             elif afferent.sender.modulation is ModulationParam.ADDITIVE:
                 name = self.function.additive_param
+                combine = builder.fadd
             elif afferent.sender.modulation is ModulationParam.DISABLE:
-                name = None
+                continue
             elif afferent.sender.modulation is ModulationParam.OVERRIDE:
                 # Directly store the value in the output array
                 output_ptr = builder.gep(arg_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
@@ -868,10 +870,11 @@ class ParameterState(State_Base):
             else:
                 assert False, "Unsupported modulation parameter: {}".format(afferent.sender.modulation)
 
-            if name is not None:
-                f_mod_param_ptr = ctx.get_param_ptr(self.function, builder, f_params, name)
-                builder.store(f_mod, f_mod_param_ptr)
-
+            f_mod_param_ptr = ctx.get_param_ptr(self.function, builder, f_params, name)
+            if name in modulated_params:
+                f_mod = combine(builder.load(f_mod_param_ptr), f_mod)
+            modulated_params.add(name)
+            builder.store(f_mod, f_mod_param_ptr)
 
         builder.call(state_f, [f_params, context, f_input, arg_out])
         return builder
@@ -432,7 +432,6 @@ import numbers
 import re
 import warnings
 
-from PIL import Image
 from collections import Iterable, OrderedDict, namedtuple
 from os import path, remove
 from shutil import rmtree
@@ -3323,6 +3322,7 @@ class System(System_Base):
                                     loop=0)
             print('\nSaved movie for {}: {}'.format(self.name, self._movie_filename))
             if self._show_animation:
+                from PIL import Image
                 movie = Image.open(movie_path)
                 movie.show()
 
@@ -4987,6 +4987,7 @@ class System(System_Base):
                          # view=True
                          )
                 # Append gif to self._animation
+                from PIL import Image
                 image = Image.open(image_file)
                 if not self._save_images:
                     remove(image_file)
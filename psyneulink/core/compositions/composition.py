@@ -676,14 +676,13 @@ import numpy as np
 import typecheck as tc
 import uuid
 
-from PIL import Image
-
 from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.component import Component, ComponentsMeta, function_type
 from psyneulink.core.components.functions.interfacefunctions import InterfaceStateMap
 from psyneulink.core.components.functions.learningfunctions import Reinforcement, BackPropagation, TDLearning
 from psyneulink.core.components.functions.combinationfunctions import LinearCombination, PredictionErrorDeltaFunction
-from psyneulink.core.components.mechanisms.adaptive.learning.learningmechanism import LearningMechanism, ERROR_SIGNAL
+from psyneulink.core.components.mechanisms.adaptive.learning.learningmechanism import \
+    ERROR_SIGNAL, LearningMechanism, LearningTiming
 from psyneulink.core.components.mechanisms.processing.compositioninterfacemechanism import CompositionInterfaceMechanism
 from psyneulink.core.components.mechanisms.processing.objectivemechanism import ObjectiveMechanism
 from psyneulink.core.components.projections.modulatory.learningprojection import LearningProjection
@@ -698,7 +697,7 @@ from psyneulink.core.components.mechanisms.processing.processingmechanism import
 from psyneulink.core.globals.context import ContextFlags
 from psyneulink.core.globals.keywords import \
     AFTER, ALL, BEFORE, BOLD, COMPARATOR_MECHANISM, CONTROL, FUNCTIONS, HARD_CLAMP, IDENTITY_MATRIX, INPUT, LABELS, \
-    LEARNED_PROJECTION, LEARNING_MECHANISM, MATRIX_KEYWORD_VALUES, MECHANISMS, NO_CLAMP, OUTPUT, OWNER_VALUE, \
+    LEARNED_PROJECTION, LEARNING_MECHANISM, MATRIX, MATRIX_KEYWORD_VALUES, MECHANISMS, NO_CLAMP, OUTPUT, OWNER_VALUE, \
     PROJECTIONS, PULSE_CLAMP, ROLES, SOFT_CLAMP, VALUES, NAME, SAMPLE, TARGET, TARGET_MECHANISM, VARIABLE, PROJECTIONS, \
     WEIGHT, OUTCOME
 from psyneulink.core.globals.log import CompositionLog, LogCondition
@@ -766,18 +765,17 @@ class Vertex(object):
 
         children : list[Vertex]
             the `Vertices <Vertex>` corresponding to the outgoing edges of this `Vertex`
+
+        .. note::
+           edges are stored in insertion-ordered dicts, so that they can be added, removed and tested in constant
+           time;  `parents <Vertex.parents>` and `children <Vertex.children>` return them as lists, in the order in
+           which they were added.
     '''
 
     def __init__(self, component, parents=None, children=None, feedback=None):
         self.component = component
-        if parents is not None:
-            self.parents = parents
-        else:
-            self.parents = []
-        if children is not None:
-            self.children = children
-        else:
-            self.children = []
+        self.parents = parents if parents is not None else []
+        self.children = children if children is not None else []
 
         self.feedback = feedback
         self.backward_sources = set()
@@ -785,6 +783,22 @@ class Vertex(object):
     def __repr__(self):
         return '(Vertex {0} {1})'.format(id(self), self.component)
 
+    @property
+    def parents(self):
+        return list(self._parents)
+
+    @parents.setter
+    def parents(self, parents):
+        self._parents = collections.OrderedDict.fromkeys(parents)
+
+    @property
+    def children(self):
+        return list(self._children)
+
+    @children.setter
+    def children(self, children):
+        self._children = collections.OrderedDict.fromkeys(children)
+
 
 class Graph(object):
     '''
@@ -815,27 +829,27 @@ class Graph(object):
         '''
         g = Graph()
 
+        # Map each original Vertex to its copy directly, rather than through the components
+        vertex_copies = {}
         for vertex in self.vertices:
-            g.add_vertex(Vertex(vertex.component, feedback=vertex.feedback))
+            vertex_copies[vertex] = Vertex(vertex.component, feedback=vertex.feedback)
+            g.add_vertex(vertex_copies[vertex])
 
-        for i in range(len(self.vertices)):
-            g.vertices[i].parents = [g.comp_to_vertex[parent_vertex.component] for parent_vertex in
-                                     self.vertices[i].parents]
-            g.vertices[i].children = [g.comp_to_vertex[parent_vertex.component] for parent_vertex in
-                                      self.vertices[i].children]
+        for vertex, vertex_copy in vertex_copies.items():
+            vertex_copy._parents = collections.OrderedDict.fromkeys(vertex_copies[parent] for parent in vertex._parents)
+            vertex_copy._children = collections.OrderedDict.fromkeys(vertex_copies[child] for child in vertex._children)
 
         return g
 
     def add_component(self, component, feedback=False):
-        if component in [vertex.component for vertex in self.vertices]:
+        if component in self.comp_to_vertex:
             logger.info('Component {1} is already in graph {0}'.format(component, self))
         else:
             vertex = Vertex(component, feedback=feedback)
-            self.comp_to_vertex[component] = vertex
             self.add_vertex(vertex)
 
     def add_vertex(self, vertex):
-        if vertex in self.vertices:
+        if self.comp_to_vertex.get(vertex.component) is vertex:
             logger.info('Vertex {1} is already in graph {0}'.format(vertex, self))
         else:
             self.vertices.append(vertex)
@@ -856,6 +870,17 @@ class Graph(object):
         except ValueError as e:
             raise CompositionError('Vertex {1} not found in graph {2}: {0}'.format(e, vertex, self))
 
+    def remove_vertices(self, vertices):
+        '''
+            Removes all of **vertices** from the Graph with a single pass over its `vertices <Graph.vertices>`
+        '''
+        vertices = set(vertices)
+        for vertex in vertices:
+            if self.comp_to_vertex.get(vertex.component) is not vertex:
+                raise CompositionError('Vertex {0} not found in graph {1}'.format(vertex, self))
+            del self.comp_to_vertex[vertex.component]
+        self.vertices = [vertex for vertex in self.vertices if vertex not in vertices]
+
     def connect_components(self, parent, child):
         try:
             self.connect_vertices(self.comp_to_vertex[parent], self.comp_to_vertex[child])
@@ -870,10 +895,12 @@ class Graph(object):
                 raise KeyError(e)
 
     def connect_vertices(self, parent, child):
-        if child not in parent.children:
-            parent.children.append(child)
-        if parent not in child.parents:
-            child.parents.append(parent)
+        parent._children[child] = None
+        child._parents[parent] = None
+
+    def disconnect_vertices(self, parent, child):
+        parent._children.pop(child, None)
+        child._parents.pop(parent, None)
 
     def get_parents_from_component(self, component):
         '''
@@ -1158,7 +1185,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         self._scheduler_processing = None
 
-        self.learning_enabled = False
+        self._learning_enabled = False
 
         # status attributes
         self.graph_consistent = True  # Tracks if the Composition is in a state that can be run (i.e. no dangling projections, (what else?))
@@ -1228,6 +1255,27 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         return self._scheduler_processing
 
+    @property
+    def learning_enabled(self):
+        '''
+            Determines whether the learning-related nodes are executed, and the matrices of learned
+            `MappingProjections <MappingProjection>` are updated, when the Composition is executed.
+
+            :setter: Assigns learning_enabled, and discards any compiled code, which executes the learning phase only
+                if learning was enabled when it was generated.
+        '''
+        return self._learning_enabled
+
+    @learning_enabled.setter
+    def learning_enabled(self, value):
+        if value != getattr(self, '_learning_enabled', value):
+            self.__generated_node_wrappers = {}
+            self.__compiled_node_wrappers = {}
+            self.__generated_execution = None
+            self.__compiled_execution = None
+            self.__compiled_run = None
+        self._learning_enabled = value
+
     @property
     def termination_processing(self):
         return self.scheduler_processing.termination_conds
@@ -1267,15 +1315,17 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         self._update_shadows_dict(node)
 
-        if node not in [vertex.component for vertex in
-                        self.graph.vertices]:  # Only add if it doesn't already exist in graph
+        if node not in self.graph.comp_to_vertex:  # Only add if it doesn't already exist in graph
             node.is_processing = True
             self.graph.add_component(node)  # Set incoming edge list of node to empty
             self.nodes.append(node)
             self.nodes_to_roles[node] = set()
 
+            # A new node has no edges yet, so it can be added to a current processing graph as is
+            if not self.needs_update_graph_processing:
+                self._graph_processing.add_component(node)
+
             self.needs_update_graph = True
-            self.needs_update_graph_processing = True
             self.needs_update_scheduler_processing = True
 
             try:
@@ -1432,7 +1482,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         if (not isinstance(sender_mechanism, CompositionInterfaceMechanism)
                 and not isinstance(sender, Composition)
-                and sender_mechanism not in self.nodes):
+                and sender_mechanism not in self.nodes_to_roles):
             # Check if sender is in a nested Composition and, if so, if it is an OUTPUT Mechanism
             #    - if so, then use self.output_CIM_states[output_state] for that OUTPUT Mechanism as sender
             #    - otherwise, raise error
@@ -1545,7 +1595,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         if (not isinstance(receiver_mechanism, CompositionInterfaceMechanism)
                 and not isinstance(receiver, Composition)
-                and receiver_mechanism not in self.nodes
+                and receiver_mechanism not in self.nodes_to_roles
                 and not learning_projection):
             # Check if receiver is in a nested Composition and, if so, if it is an INPUT Mechanism
             #    - if so, then use self.input_CIM_states[input_state] for that INPUT Mechanism as sender
@@ -1561,7 +1611,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         # KAM HACK 2/13/19 to get hebbian learning working for PSY/NEU 330
         # Add autoassociative learning mechanism + related projections to composition as processing components
         if sender_mechanism != self.input_CIM and receiver != self.output_CIM \
-                and projection not in [vertex.component for vertex in self.graph.vertices] and not learning_projection:
+                and projection not in self.graph.comp_to_vertex and not learning_projection:
 
 
             projection.is_processing = False
@@ -1575,12 +1625,14 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             except CompositionError as c:
                 raise CompositionError("{} to {}".format(c.args[0], self.name))
 
+            if not self.needs_update_graph_processing:
+                self._add_projection_to_processing_graph(projection, graph_sender, graph_receiver)
+
         # KAM HACK 2/13/19 to get hebbian learning working for PSY/NEU 330
         # Add autoassociative learning mechanism + related projections to composition as processing components
         self._validate_projection(projection, sender, receiver, sender_mechanism, receiver_mechanism, learning_projection)
 
         self.needs_update_graph = True
-        self.needs_update_graph_processing = True
         self.needs_update_scheduler_processing = True
 
         projection._activate_for_compositions(self)
@@ -1605,6 +1657,22 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
     def _add_projection(self, projection):
         self.projections.append(projection)
 
+    def _add_projection_to_processing_graph(self, projection, graph_sender, graph_receiver):
+        '''
+        Adds the edge introduced by **projection** to a processing graph that is current with the full graph, in the
+        same way that `_update_processing_graph <Composition._update_processing_graph>` collapses Projection vertices;
+        marks the processing graph for a rebuild if the edge can't be resolved locally.
+        '''
+        sender_vertex = self._graph_processing.comp_to_vertex.get(graph_sender)
+        receiver_vertex = self._graph_processing.comp_to_vertex.get(graph_receiver)
+        if sender_vertex is None or receiver_vertex is None:
+            self.needs_update_graph_processing = True
+            return
+
+        self._graph_processing.connect_vertices(sender_vertex, receiver_vertex)
+        if self.graph.comp_to_vertex[projection].feedback:
+            receiver_vertex.backward_sources.add(graph_sender)
+
     def add_projections(self, projections=None):
         '''
             Calls `add_projection <Composition.add_projection>` for each Projection in the *projections* list. Each
@@ -1636,7 +1704,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
     def remove_projection(self, projection):
         # step 1 - remove Vertex from Graph
-        if projection in [vertex.component for vertex in self.graph.vertices]:
+        if projection in self.graph.comp_to_vertex:
             vert = self.graph.comp_to_vertex[projection]
             self.graph.remove_vertex(vert)
         # step 2 - remove Projection from Composition's list
@@ -2154,45 +2222,51 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         self._graph_processing = self.graph.copy()
 
         visited_vertices = set()
-        next_vertices = []  # a queue
+        removed_vertices = []
+        next_vertices = collections.deque()  # a queue
 
-        unvisited_vertices = True
+        logger.debug('processing graph vertices: {0}'.format(self._graph_processing.vertices))
 
-        while unvisited_vertices:
-            for vertex in self._graph_processing.vertices:
-                if vertex not in visited_vertices:
-                    next_vertices.append(vertex)
-                    break
-            else:
-                unvisited_vertices = False
+        # Start a search from each vertex not reached by the previous ones
+        for start_vertex in self._graph_processing.vertices:
+            if start_vertex in visited_vertices:
+                continue
+            next_vertices.append(start_vertex)
 
-            logger.debug('processing graph vertices: {0}'.format(self._graph_processing.vertices))
             while len(next_vertices) > 0:
-                cur_vertex = next_vertices.pop(0)
+                cur_vertex = next_vertices.popleft()
                 logger.debug('Examining vertex {0}'.format(cur_vertex))
 
                 # must check that cur_vertex is not already visited because in cycles, some nodes may be added to next_vertices twice
                 if cur_vertex not in visited_vertices and not cur_vertex.component.is_processing:
+                    # cur_vertex keeps its own edges, which determine the frontier below;
+                    # its neighbors are detached from it even if it has no parents or no children
+                    for parent in cur_vertex.parents:
+                        parent._children.pop(cur_vertex, None)
+                    for child in cur_vertex.children:
+                        child._parents.pop(cur_vertex, None)
+
                     for parent in cur_vertex.parents:
-                        parent.children.remove(cur_vertex)
                         for child in cur_vertex.children:
-                            child.parents.remove(cur_vertex)
                             if cur_vertex.feedback:
                                 child.backward_sources.add(parent.component)
                             self._graph_processing.connect_vertices(parent, child)
 
-                    for node in cur_vertex.parents + cur_vertex.children:
-                        logger.debug('New parents for vertex {0}: \n\t{1}\nchildren: \n\t{2}'.format(node, node.parents,
-                                                                                                     node.children))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for node in cur_vertex.parents + cur_vertex.children:
+                            logger.debug('New parents for vertex {0}: \n\t{1}\nchildren: \n\t{2}'.format(
+                                node, node.parents, node.children))
                     logger.debug('Removing vertex {0}'.format(cur_vertex))
 
-                    self._graph_processing.remove_vertex(cur_vertex)
+                    # Removed from the vertex list all at once below
+                    removed_vertices.append(cur_vertex)
 
                 visited_vertices.add(cur_vertex)
                 # add to next_vertices (frontier) any parents and children of cur_vertex that have not been visited yet
                 next_vertices.extend(
                     [vertex for vertex in cur_vertex.parents + cur_vertex.children if vertex not in visited_vertices])
 
+        self._graph_processing.remove_vertices(removed_vertices)
         self.needs_update_graph_processing = False
 
     def get_nodes_by_role(self, role):
@@ -3527,6 +3601,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                          # view=True
                          )
                 # Append gif to self._animation
+                from PIL import Image
                 image = Image.open(image_file)
                 # TBI?
                 # if not self._save_images:
@@ -3677,6 +3752,8 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                     if bin_execute is True or bin_execute.startswith('LLVM'):
                         _comp_ex = pnlvm.CompExecution(self, [execution_id])
                         _comp_ex.execute(inputs)
+                        _comp_ex.update_learned_projections()
+                        _comp_ex.update_node_states()
                         return _comp_ex.extract_node_output(self.output_CIM)
                     elif bin_execute.startswith('PTX'):
                         self.__ptx_initialize(execution_id)
@@ -3808,6 +3885,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
                     if bin_execute:
                         _comp_ex.execute_node(node)
+                        _comp_ex.update_node_state(node)
                     else:
                         if node is not self.controller:
                             node.execute(
@@ -3921,6 +3999,7 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
         if bin_execute:
             _comp_ex.freeze_values()
             _comp_ex.execute_node(self.output_CIM)
+            _comp_ex.update_learned_projections()
             return _comp_ex.extract_node_output(self.output_CIM)
 
         self.output_CIM.parameters.context.get(execution_id).execution_phase = ContextFlags.PROCESSING
@@ -4146,6 +4225,9 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 if bin_execute is True or bin_execute.startswith('LLVM'):
                     _comp_ex = pnlvm.CompExecution(self, [execution_id])
                     results += _comp_ex.run(inputs, num_trials, num_inputs_sets)
+                    # Matrices modified by learning are kept in the parameter structure during the run
+                    _comp_ex.update_learned_projections()
+                    _comp_ex.update_node_states()
                 elif bin_execute.startswith('PTX'):
                     self.__ptx_initialize(execution_id)
                     EX = self._compilation_data.ptx_execution.get(execution_id)
@@ -4587,6 +4669,11 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
                 if proj_in.type != proj_function.args[2].type:
                     assert node is self.output_CIM
                     proj_in = builder.bitcast(proj_in, proj_function.args[2].type)
+
+                if self.learning_enabled:
+                    self.__gen_learned_matrix_update(ctx, builder, par_proj, self._get_learning_projections(par_proj),
+                                                     proj_params, params, context, data_in)
+
                 builder.call(proj_function, [proj_params, proj_context, proj_in, proj_out])
 
             idx = ctx.int32_ty(self._get_node_index(node))
@@ -4595,10 +4682,31 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             m_context = builder.gep(context, [zero, zero, idx])
             m_out = builder.gep(data_out, [zero, zero, idx])
             if is_mech:
+                # Mechanisms that use the matrices of other Projections keep copies of them in their context
+                if hasattr(node, '_get_context_matrices'):
+                    self.__gen_context_matrices_update(ctx, builder, node, m_context, params)
+
                 call_args = [m_params, m_context, m_in, m_out]
                 if node is self.controller:
                     call_args += [params, context, data_in]
                 builder.call(m_function, call_args)
+
+                # LearningMechanisms that learn during the execution phase
+                # modify their learned projections as soon as they execute
+                if (self.learning_enabled and isinstance(node, LearningMechanism)
+                        and node.learning_timing is LearningTiming.EXECUTION_PHASE):
+                    for learning_projection in node.efferents:
+                        learned_projection = learning_projection.receiver.owner
+                        if (not isinstance(learning_projection, LearningProjection)
+                                or learning_projection not in self.projections
+                                or learned_projection not in self.projections
+                                or isinstance(learned_projection, AutoAssociativeProjection)):
+                            continue
+                        lp_params = builder.gep(params, [zero, ctx.int32_ty(1),
+                                                         ctx.int32_ty(self.projections.index(learned_projection))])
+                        # The new LearningSignal is in the output data
+                        self.__gen_learned_matrix_update(ctx, builder, learned_projection, [learning_projection],
+                                                         lp_params, params, context, data_out)
             else:
                 # Condition and data structures includes parent first
                 nested_idx = ctx.int32_ty(self._get_node_index(node) + 1)
@@ -4614,6 +4722,88 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
 
         return llvm_func
 
+    def _get_learning_projections(self, projection):
+        if MATRIX not in projection.parameter_states:
+            return []
+        return [p for p in projection.parameter_states[MATRIX].mod_afferents
+                if isinstance(p, LearningProjection) and p in self.projections]
+
+    def _get_learned_projections(self):
+        return [p for p in self.projections if len(self._get_learning_projections(p)) > 0]
+
+    def __gen_context_matrices_update(self, ctx, builder, node, node_context, params):
+        # Copy the current matrices of the Projections listed by node._get_context_matrices into the node's context
+        zero = ctx.int32_ty(0)
+        for i, (projection, _) in enumerate(node._get_context_matrices()):
+            if projection is None or projection not in self.projections:
+                continue
+            proj_params = builder.gep(params, [zero, ctx.int32_ty(1),
+                                               ctx.int32_ty(self.projections.index(projection))])
+            matrix_ptr = ctx.get_param_ptr(projection.function, builder, proj_params, MATRIX)
+            matrix_copy = builder.gep(node_context, [zero, ctx.int32_ty(1), ctx.int32_ty(i)])
+            matrix_ptr = builder.bitcast(matrix_ptr, matrix_copy.type)
+            builder.store(builder.load(matrix_ptr), matrix_copy)
+
+    def __gen_learned_matrix_update(self, ctx, builder, projection, learning_projections,
+                                    proj_params, params, context, data_in):
+        # Add the weight changes delivered by LearningProjections to the matrix in the parameter structure.
+        # This is done before the projection executes, using the most recent LearningSignal values, which is when
+        # the matrix ParameterState accumulates them in uncompiled execution; LearningMechanisms that learn
+        # during the execution phase also do it right after they execute (see their _update_output_states)
+        if len(learning_projections) == 0:
+            return
+
+        matrix = np.atleast_2d(projection.function.defaults.matrix)
+        rows, cols = matrix.shape
+        matrix_ptr = ctx.get_param_ptr(projection.function, builder, proj_params, MATRIX)
+        zero = ctx.int32_ty(0)
+
+        for learning_projection in learning_projections:
+            learning_signal = learning_projection.sender
+            learning_mechanism = learning_signal.owner
+            signal_ptr = builder.gep(data_in, [zero, zero,
+                                               ctx.int32_ty(self._get_node_index(learning_mechanism)),
+                                               ctx.int32_ty(learning_mechanism.output_states.index(learning_signal))])
+
+            lp_idx = ctx.int32_ty(self.projections.index(learning_projection))
+            lp_params = builder.gep(params, [zero, ctx.int32_ty(1), lp_idx])
+            lp_context = builder.gep(context, [zero, ctx.int32_ty(1), lp_idx])
+            lp_function = ctx.get_llvm_function(learning_projection)
+            if signal_ptr.type != lp_function.args[2].type:
+                signal_ptr = builder.bitcast(signal_ptr, lp_function.args[2].type)
+            weight_change = builder.alloca(lp_function.args[3].type.pointee)
+            builder.call(lp_function, [lp_params, lp_context, signal_ptr, weight_change])
+
+            learning_rate = learning_projection.defaults.learning_rate
+
+            def _add_weight_change(b, change_ptr, row, col):
+                change = b.load(change_ptr)
+                if learning_rate is not None:
+                    change = b.fmul(change, ctx.float_ty(learning_rate))
+                idx = b.add(b.mul(row, ctx.int32_ty(cols)), col)
+                element_ptr = b.gep(matrix_ptr, [zero, idx])
+                b.store(b.fadd(b.load(element_ptr), change), element_ptr)
+
+            # Match the reshaping of the learning signal done by LearningProjection._execute
+            weight_change_ty = weight_change.type.pointee
+            if isinstance(weight_change_ty.element, pnlvm.ir.ArrayType):
+                if (weight_change_ty.count, weight_change_ty.element.count) != (rows, cols):
+                    raise CompositionError("Shape of the weight changes from {} does not match the matrix of {}".
+                                           format(learning_projection.name, projection.name))
+                with pnlvm.helpers.array_ptr_loop(builder, weight_change, "learning_row") as (b1, i):
+                    row_ptr = b1.gep(weight_change, [zero, i])
+                    with pnlvm.helpers.array_ptr_loop(b1, row_ptr, "learning_col") as (b2, j):
+                        _add_weight_change(b2, b2.gep(row_ptr, [zero, j]), i, j)
+            elif weight_change_ty.count == rows == cols and np.allclose(matrix, np.diag(np.diag(matrix))):
+                with pnlvm.helpers.array_ptr_loop(builder, weight_change, "learning_diag") as (b1, i):
+                    _add_weight_change(b1, b1.gep(weight_change, [zero, i]), i, i)
+            elif weight_change_ty.count == rows and cols == 1:
+                with pnlvm.helpers.array_ptr_loop(builder, weight_change, "learning_col") as (b1, i):
+                    _add_weight_change(b1, b1.gep(weight_change, [zero, i]), i, zero)
+            else:
+                raise CompositionError("Shape of the weight changes from {} does not match the matrix of {}".
+                                       format(learning_projection.name, projection.name))
+
     def _get_processing_condition_set(self, node):
         dep_group = []
         for group in self.scheduler_processing.consideration_queue:
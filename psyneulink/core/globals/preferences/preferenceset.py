@@ -129,6 +129,8 @@ class PreferenceSet(object):
         - get_pref_setting_for_level(pref_ivar_name=<str>, level=<PreferenceLevel>):
             return setting for specified preference at level specified
             if level is omitted, return setting for level specified in instance's PreferenceEntry
+            settings are cached, and the cache is invalidated whenever a preference attribute of any PreferenceSet
+                (at any level of the hierarchy) is assigned
         - show():
             generate table showing all preference attributes for the PreferenceSet, their base and current and values,
                 and their PreferenceLevel assignment
@@ -149,6 +151,9 @@ class PreferenceSet(object):
         None
     """
 
+    # Incremented whenever a preference attribute is assigned in any PreferenceSet;  invalidates cached settings
+    _settings_generation = 0
+
     def __init__(self,
                  owner,
                  level=PreferenceLevel.SYSTEM,
@@ -183,6 +188,8 @@ class PreferenceSet(object):
         :param context:
         """
 
+        self._settings_cache = {}
+
         # VALIDATE ATTRIBUTES AND ARGS
         # PreferenceSet is an abstract class, and so should only be initialized from the constructor of a subclass
         if context != ContextFlags.CONSTRUCTOR:
@@ -390,6 +397,12 @@ class PreferenceSet(object):
         if PreferenceSetVerbosity:
             print ("Preference assignment condition {0}".format(condition))
 
+    def __setattr__(self, name, value):
+        # Assignment of a preference at any level can change the setting resolved for any owner below it
+        if name.endswith('_pref'):
+            PreferenceSet._settings_generation += 1
+        super().__setattr__(name, value)
+
 # FIX: ARE THESE NEEDED?? @@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@
     @property
     def level(self):
@@ -659,6 +672,9 @@ class PreferenceSet(object):
     def get_pref_setting_for_level(self, pref_ivar_name, requested_level=None):
         """Return the setting of a preference for a specified preference level, and any error messages generated
 
+        Settings are cached by preference, level and owner class, until a preference is next assigned in any
+            PreferenceSet
+
         Arguments:
         - pref_ivar_name (str): name of ivar for preference attribute for which to return the setting;
         - requested_level (PreferenceLevel): preference level for which the setting should be returned
@@ -666,10 +682,29 @@ class PreferenceSet(object):
         Returns:
         - PreferenceEntry.setting, str:
         """
-        pref_entry = getattr(self, pref_ivar_name)
-
         if requested_level is None:
-            requested_level = pref_entry.level
+            requested_level = getattr(self, pref_ivar_name).level
+
+        # The owner may be reassigned (see PreferenceSet docstring), but only its class affects the setting
+        owner_class = self.owner if inspect.isclass(self.owner) else self.owner.__class__
+        key = (pref_ivar_name, requested_level, owner_class)
+        generation = PreferenceSet._settings_generation
+        try:
+            cache_generation, setting = self._settings_cache[key]
+        except KeyError:
+            pass
+        else:
+            if cache_generation == generation:
+                return setting
+
+        setting = self._get_pref_setting_for_level(pref_ivar_name, requested_level)
+        # If preferences were assigned during the lookup (e.g., classPreferences instantiated for a level),
+        #    the stale generation causes the setting to be recomputed on the next call
+        self._settings_cache[key] = (generation, setting)
+        return setting
+
+    def _get_pref_setting_for_level(self, pref_ivar_name, requested_level):
+        pref_entry = getattr(self, pref_ivar_name)
 
         # Preference is owned by an object
         if isinstance(self.owner, self.baseClass):
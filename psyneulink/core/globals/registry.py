@@ -18,7 +18,8 @@ from psyneulink.core.globals.keywords import CONTROL_PROJECTION, DDM_MECHANISM,
 __all__ = [
     'RegistryError',
     'clear_registry',
-    'process_registry_object_instances'
+    'process_registry_object_instances',
+    'register_anonymous_instances',
 ]
 
 # IMPLEMENTATION NOTE:
@@ -48,6 +49,9 @@ RegistryEntry = namedtuple('RegistryTuple', 'subclass, instanceDict, instanceCou
 
 numeric_suffix_pat = re.compile(r'(.*)-\d+$')
 
+# Whether instances created without a name are entered in their Registry (see register_anonymous_instances)
+_register_anonymous_instances = True
+
 
 class RegistryError(Exception):
     def __init__(self, error_value):
@@ -116,7 +120,9 @@ def register_category(entry,
 
     # IMPLEMENTATION NOTE:  Move to State when that is implemented as ABC
     import inspect
-    from psyneulink.core.components.states.state import State, State_Base
+    if inspect.isclass(entry):
+        # Only categories need to be checked, so skip the import when registering an instance
+        from psyneulink.core.components.states.state import State, State_Base
     if inspect.isclass(entry) and issubclass(entry, State) and not entry == State_Base:
         try:
            entry.stateAttributes
@@ -214,64 +220,66 @@ def register_category(entry,
 def register_instance(entry, name, base_class, registry, sub_dict):
 
     renamed_instance_counts = registry[sub_dict].renamed_instance_counts
-    renamed = False
+    instance_dict = registry[sub_dict].instanceDict
+
     # If entry (instance) name is None, set entry's name to sub_dict-n where n is the next available numeric suffix
     # (starting at 0) based on the number of unnamed/renamed sub_dict objects that have already been assigned names
     if name is None:
         entry.name = '{0}-{1}'.format(sub_dict, renamed_instance_counts[sub_dict])
-        renamed = True
+        if entry.name in instance_dict:
+            entry.name = _next_unused_name(sub_dict, renamed_instance_counts, instance_dict)
+        # increment the base (non-suffixed) name count
+        renamed_instance_counts[sub_dict] += 1
     else:
         entry.name = name
-
-    while entry.name in registry[sub_dict].instanceDict:
-        # if the decided name (provided or determined) is already assigned to an object, get the non-suffixed name,
-        # and append the proper new suffix according to the number of objects that have been assigned that name
-        # NOTE: the while is to handle a scenario in which a user specifies a name that uses our convention but
-        #   does not follow our pattern. In this case, we will produce a unique name, but the "count" will be off
-        #   e.g. user gives a mechanism the name TransferMechanism-5, then the fifth unnamed TransferMechanism
-        #   will be named TransferMechanism-6
-        # TODO: an ambiguation problem - is the name "MappingProjection x to y-1"
-        # the second projection from x to y, or the first projection from x to y-1?
-        match = numeric_suffix_pat.match(entry.name)
-
-        if match is None:
-            renamed_instance_counts[entry.name] += 1
-            entry.name += '-{0}'.format(renamed_instance_counts[entry.name])
-        else:
-            name_stripped_of_suffix = match.groups()[0]
-
-            if name_stripped_of_suffix in renamed_instance_counts:
+        if entry.name in instance_dict:
+            # if the name is already assigned to an object, get the non-suffixed name, and append the proper new
+            # suffix according to the number of objects that have been assigned that name
+            # TODO: an ambiguation problem - is the name "MappingProjection x to y-1"
+            # the second projection from x to y, or the first projection from x to y-1?
+            base_name = entry.name
+            match = numeric_suffix_pat.match(entry.name)
+            if match is not None and match.groups()[0] in renamed_instance_counts:
                 # try to detect unsuffixed version first as base name
-                renamed_instance_counts[name_stripped_of_suffix] += 1
-                entry.name = numeric_suffix_pat.sub(
-                    r'\1-{0}'.format(
-                        renamed_instance_counts[name_stripped_of_suffix]
-                    ),
-                    entry.name
-                )
-            else:
-                # the second time a -\d suffixed name (not renamed though) appears
-                renamed_instance_counts[entry.name] += 1
-                entry.name += '-{0}'.format(renamed_instance_counts[entry.name])
+                base_name = match.groups()[0]
+            entry.name = _next_unused_name(base_name, renamed_instance_counts, instance_dict)
 
-    # Add instance to instanceDict:
-    registry[sub_dict].instanceDict.update({entry.name: entry})
+    # Add instance to instanceDict, unless it is anonymous and anonymous instances are not registered
+    if name is not None or _register_anonymous_instances:
+        instance_dict[entry.name] = entry
 
     # Update instanceCount in registry:
     registry[sub_dict] = registry[sub_dict]._replace(instanceCount=registry[sub_dict].instanceCount + 1)
 
-    # increment the base (non-suffixed) name count
-    if renamed:
-        match = numeric_suffix_pat.match(entry.name)
-        if match is None:
-            renamed_instance_counts[entry.name] += 1
-        else:
-            renamed_instance_counts[match.groups()[0]] += 1
+
+def _next_unused_name(base_name, renamed_instance_counts, instance_dict):
+    # Counts only ever increase, so each suffix of a base name is tried at most once;  more than one is tried only if
+    #   a user specifies a name that uses our convention (e.g. TransferMechanism-5), in which case the "count" will be
+    #   off and the fifth unnamed TransferMechanism will be named TransferMechanism-6
+    while True:
+        renamed_instance_counts[base_name] += 1
+        name = '{0}-{1}'.format(base_name, renamed_instance_counts[base_name])
+        if name not in instance_dict:
+            return name
+
+
+def register_anonymous_instances(register=True):
+    """Determine whether instances created without a name are entered in their Registry.
+
+    Instances created without a name are always assigned a unique default name (e.g., TransferMechanism-3), but if
+    **register** is False they are not entered in the instance dict of their Registry category.  This saves the
+    bookkeeping for models built programmatically from very large numbers of Components, at the cost that a name
+    subsequently specified by the user is not checked against the default names of those instances.
+    """
+    global _register_anonymous_instances
+    _register_anonymous_instances = register
+
 
 def remove_instance_from_registry(registry, category, name=None, component=None):
     """Remove instance from registry category entry
 
     Instance to be removed can be specified by a reference to the component or its name.
+    A component that was not entered in the instance dict (see `register_anonymous_instances`) is only uncounted.
     Instance count for the category is decremented
     If the name of the instance was a default name, and it was the last in the sequence,
         decrement renamed_instance_counts and if it was the only one, remove that name from the renamed_instance list
@@ -285,18 +293,24 @@ def remove_instance_from_registry(registry, category, name=None, component=None)
     if (name and component) and name != component.name:
         raise RegistryError("Conflicting  name ({}) and component ({}) specified for entry to remove from {}".
                             format(name, component.name, registry.__class__.__name__))
+    instance = component
     if component and not name:
         for n, c in registry_entry.instanceDict.items():
             if component == c:
                 name = n
+    # If the component was not found, it is an anonymous instance that was not entered in the instanceDict
+    #    (see register_anonymous_instances), so there is no entry to delete, but it is still counted
+    if name is not None:
+        instance = registry_entry.instanceDict[name]
 
     try:
-        clear_registry(registry_entry.instanceDict[name]._stateRegistry)
+        clear_registry(instance._stateRegistry)
     except AttributeError:
         pass
 
     # Delete instance
-    del registry_entry.instanceDict[name]
+    if name is not None:
+        del registry_entry.instanceDict[name]
 
     # Decrement count for instances in entry
     instance_count = registry_entry.instanceCount - 1
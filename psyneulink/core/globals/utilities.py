@@ -31,6 +31,7 @@ CONTENTS
 * `all_within_range`
 * `is_matrix
 * `is_matrix_spec`
+* `is_sparse_matrix`
 * `is_numeric`
 * `is_numeric_or_none`
 * `is_iterable`
@@ -88,14 +89,19 @@ CONTENTS
 * `convert_to_list`
 * `get_global_seed`
 * `set_global_seed`
+* `lazy_import`
+* `lazy_attributes`
 
 """
 
 import copy
+import importlib.util
 import inspect
 import logging
 import numbers
+import sys
 import time
+import types
 import warnings
 import weakref
 
@@ -111,9 +117,9 @@ __all__ = [
     'convert_all_elements_to_np_array', 'NodeRole', 'get_class_attributes', 'flatten_list',
     'get_modulationOperation_name', 'get_value_from_array', 'is_component', 'is_distance_metric', 'is_matrix',
     'insert_list', 'is_matrix_spec', 'all_within_range', 'is_iterable',
-    'is_modulation_operation', 'is_numeric', 'is_numeric_or_none', 'is_same_function_spec', 'is_unit_interval',
+    'is_modulation_operation', 'is_numeric', 'is_numeric_or_none', 'is_same_function_spec', 'is_sparse_matrix', 'is_unit_interval',
     'is_value_spec', 'iscompatible', 'kwCompatibilityLength', 'kwCompatibilityNumeric', 'kwCompatibilityType',
-    'make_readonly_property', 'merge_param_dicts', 'Modulation', 'MODULATION_ADD', 'MODULATION_MULTIPLY',
+    'lazy_attributes', 'lazy_import', 'make_readonly_property', 'merge_param_dicts', 'Modulation', 'MODULATION_ADD', 'MODULATION_MULTIPLY',
     'MODULATION_OVERRIDE', 'multi_getattr', 'np_array_less_than_2d',
     'object_has_single_value', 'optional_parameter_spec',
     'normpdf',
@@ -291,7 +297,7 @@ def is_matrix(m):
 
     if is_matrix_spec(m):
         return True
-    if isinstance(m, (list, np.ndarray, np.matrix)):
+    if isinstance(m, (list, np.ndarray, np.matrix)) or is_sparse_matrix(m):
         return True
     if m is None or isinstance(m, (Component, dict, set)) or (inspect.isclass(m) and issubclass(m, Component)):
         return False
@@ -308,6 +314,16 @@ def is_matrix(m):
     return False
 
 
+def is_sparse_matrix(m):
+    """Return True if **m** is a `scipy.sparse <https://docs.scipy.org/doc/scipy/reference/sparse.html>`_ matrix
+
+    SciPy is an optional dependency and is not imported here;  if it has not already been imported, **m** cannot be a
+    sparse matrix.
+    """
+    sparse = sys.modules.get('scipy.sparse')
+    return sparse is not None and sparse.issparse(m)
+
+
 def is_distance_metric(s):
     if s in DISTANCE_METRICS:
         return True
@@ -1601,3 +1617,55 @@ def unproxy_weakproxy(proxy):
     """
     return proxy.__repr__.__self__
 
+
+def lazy_import(name):
+    """
+        Returns the module **name**, deferring its execution until one of its attributes is first accessed, or
+        None if the module is not installed.  A module that has already been imported is returned as is.
+
+        Used for heavy optional dependencies (e.g., torch), so that importing PsyNeuLink does not import them.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def lazy_attributes(module_name, attributes):
+    """
+        Makes each item of **attributes** (a dict mapping attribute names to the names of the modules that define them)
+        an attribute of the module **module_name** that is imported from its module when it is first accessed.
+
+        Used to export names from modules that execute heavy optional dependencies when imported (e.g.,
+        PytorchModelCreator, which subclasses torch.nn.Module), without importing them with PsyNeuLink.
+    """
+    module = sys.modules[module_name]
+    lazy = dict(getattr(module, '_lazy_attributes', {}))
+    lazy.update(attributes)
+
+    class _LazyAttributesModule(types.ModuleType):
+        def __getattr__(self, name):
+            # only called if name is not (yet) an attribute of the module
+            try:
+                source = self._lazy_attributes[name]
+            except KeyError:
+                raise AttributeError("module '{0}' has no attribute '{1}'".format(self.__name__, name))
+            value = getattr(importlib.import_module(source), name)
+            setattr(self, name, value)
+            return value
+
+        def __dir__(self):
+            return sorted(set(super().__dir__()) | set(self._lazy_attributes))
+
+    module._lazy_attributes = lazy
+    module.__class__ = _LazyAttributesModule
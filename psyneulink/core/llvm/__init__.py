@@ -14,6 +14,7 @@ import numpy as np
 from llvmlite import ir
 
 from . import builtins
+from . import codegen
 from .builder_context import *
 from .builder_context import _type_cache, _all_modules
 from .debug import debug_env
@@ -116,6 +117,7 @@ class LLVMBinaryFunction:
 
     @staticmethod
     def get(name):
+        _ensure_builtins()
         if LLVMBuilderContext._llvm_generation > _binary_generation:
             _llvm_build()
         if name not in _binaries.keys():
@@ -153,13 +155,23 @@ _cpu_engine = cpu_jit_engine(_updateNativeBinaries)
 if ptx_enabled:
     _ptx_engine = ptx_jit_engine()
 
-# Initialize builtins
+# Builtins are generated on first use, rather than when the package is imported
+_builtins_initialized = False
+
 def init_builtins():
+    global _builtins_initialized
+    # Set before entering the context below, which would otherwise initialize them again
+    _builtins_initialized = True
     with LLVMBuilderContext() as ctx:
         builtins.setup_pnl_intrinsics(ctx)
         builtins.setup_vxm(ctx)
+        builtins.setup_csr_vxm(ctx)
         builtins.setup_mersenne_twister(ctx)
 
+def _ensure_builtins():
+    if not _builtins_initialized:
+        init_builtins()
+
 def cleanup():
     _cpu_engine.clean_module()
     if ptx_enabled:
@@ -169,6 +181,6 @@ def cleanup():
     _compiled_modules.clear()
     _all_modules.clear()
     _type_cache.clear()
-    init_builtins()
 
-init_builtins()
+    global _builtins_initialized
+    _builtins_initialized = False
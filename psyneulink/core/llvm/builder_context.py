@@ -13,16 +13,18 @@ import ctypes
 import inspect
 import numpy as np
 import os, re
+import warnings
 
 from psyneulink.core.scheduling.time import TimeScale
 from psyneulink.core.globals.keywords import AFTER, BEFORE
+from psyneulink.core.globals.utilities import NodeRole
 
 from psyneulink.core import llvm as pnlvm
 from .debug import debug_env
 from .helpers import ConditionGenerator
 from llvmlite import ir
 
-__all__ = ['LLVMBuilderContext', '_modules', '_find_llvm_function', '_convert_llvm_ir_to_ctype']
+__all__ = ['LLVMBuilderContext', '_modules', '_find_llvm_function', '_convert_llvm_ir_to_ctype', 'float_precision']
 
 _modules = set()
 _all_modules = set()
@@ -34,9 +36,19 @@ def module_count():
         print("Total LLVM modules: ", len(_all_modules))
         print("Total structures generated: ", _struct_count)
 
-# TODO: Should this be selectable?
+# Floating point precision of all generated code, structures and builtins.
+# Selected once at import time using the PNL_LLVM_PRECISION environment
+# variable; recognized values are "float64" (the default) and "float32".
+_float_types = {'float64': ir.DoubleType(), 'float32': ir.FloatType()}
+
+float_precision = str(os.environ.get("PNL_LLVM_PRECISION", 'float64'))
+if float_precision not in _float_types:
+    warnings.warn("Unknown LLVM precision '{}', using 'float64'".format(float_precision))
+    float_precision = 'float64'
+
 _int32_ty = ir.IntType(32)
-_float_ty = ir.DoubleType()
+_float_ty = _float_types[float_precision]
+_float_dtype = np.dtype(float_precision)
 
 class LLVMBuilderContext:
     uniq_counter = 0
@@ -49,6 +61,8 @@ class LLVMBuilderContext:
 
     def __enter__(self):
         assert self.module is None
+        # Generated code may call the builtins, make sure they exist
+        pnlvm._ensure_builtins()
         self.module = ir.Module(name="PsyNeuLinkModule-" + str(LLVMBuilderContext._llvm_generation))
         LLVMBuilderContext._llvm_generation += 1
         return self
@@ -270,10 +284,19 @@ class LLVMBuilderContext:
             any_cond = builder.or_(any_cond, mech_cond, name="any_ran_cond")
             builder.store(mech_cond, run_set_mech_ptr)
 
+        # Learning nodes are scheduled as usual, but not executed if learning is disabled
+        if composition.learning_enabled:
+            skipped_nodes = set()
+        else:
+            skipped_nodes = set(composition.get_nodes_by_role(NodeRole.LEARNING))
+
         for idx, mech in enumerate(composition.nodes):
             run_set_mech_ptr = builder.gep(run_set_ptr, [zero, self.int32_ty(idx)])
             mech_cond = builder.load(run_set_mech_ptr, name="mech_" + mech.name + "_should_run")
             with builder.if_then(mech_cond):
+                if mech in skipped_nodes:
+                    cond_gen.generate_update_after_run(builder, cond, mech)
+                    continue
                 mech_w = composition._get_node_wrapper(mech, simulation);
                 mech_f = self.get_llvm_function(mech_w)
                 # Wrappers do proper indexing of all strctures
@@ -286,6 +309,8 @@ class LLVMBuilderContext:
 
         # Writeback results
         for idx, mech in enumerate(composition.nodes):
+            if mech in skipped_nodes:
+                continue
             run_set_mech_ptr = builder.gep(run_set_ptr, [zero, self.int32_ty(idx)])
             mech_cond = builder.load(run_set_mech_ptr, name="mech_" + mech.name + "_ran")
             with builder.if_then(mech_cond):
@@ -8,6 +8,8 @@
 
 # ********************************************* PNL LLVM builtins **************************************************************
 
+import numpy as np
+
 from llvmlite import ir
 from psyneulink.core.llvm import helpers
 from psyneulink.core.llvm.builder_context import LLVMBuilderContext
@@ -111,6 +113,56 @@ def setup_vxm(ctx):
     with builder.goto_block(outer_out_block):
         builder.ret_void()
 
+def setup_csr_vxm(ctx):
+    module = ctx.module
+    # Setup types
+    double_ptr_ty = ctx.float_ty.as_pointer()
+    int32_ptr_ty = ctx.int32_ty.as_pointer()
+    func_ty = ir.FunctionType(ir.VoidType(), (double_ptr_ty, double_ptr_ty, int32_ptr_ty, int32_ptr_ty,
+                                              ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
+
+    # Create function
+    function = ir.Function(module, func_ty, name="__pnl_builtin_csr_vxm")
+    function.attributes.add('argmemonly')
+    function.attributes.add('alwaysinline')
+
+    block = function.append_basic_block(name="entry")
+    builder = ir.IRBuilder(block)
+    builder.debug_metadata = LLVMBuilderContext.get_debug_location(function, None)
+    # Matrix is stored in CSR format: nonzero values, their column indices,
+    # and offsets of the first nonzero value of every row (x + 1 elements)
+    v, data, indices, indptr, x, y, o = function.args
+
+    # Add function arg attributes
+    for a in v, data, indices, indptr, o:
+        a.attributes.add('nonnull')
+        a.attributes.add('noalias')
+
+    # zero the output array
+    with helpers.for_loop_zero_inc(builder, y, "zero") as (b1, index):
+        ptr = b1.gep(o, [index])
+        b1.store(ctx.float_ty(0), ptr)
+
+    # Multiplication; scatter every input element over the nonzero values of its row
+    with helpers.for_loop_zero_inc(builder, x, "row") as (b1, index_i):
+        vector_el = b1.load(b1.gep(v, [index_i]))
+
+        next_index_i = b1.add(index_i, ctx.int32_ty(1))
+        start = b1.load(b1.gep(indptr, [index_i]))
+        stop = b1.load(b1.gep(indptr, [next_index_i]))
+        with helpers.for_loop(b1, start, stop, ctx.int32_ty(1), "nonzero") as (b2, index_k):
+            index_j = b2.load(b2.gep(indices, [index_k]))
+            matrix_el = b2.load(b2.gep(data, [index_k]))
+            out_ptr = b2.gep(o, [index_j])
+            out_el = b2.load(out_ptr)
+
+            new_el = b2.fmul(vector_el, matrix_el)
+            new_el = b2.fadd(new_el, out_el)
+
+            b2.store(new_el, out_ptr)
+
+    builder.ret_void()
+
 def setup_pnl_intrinsics(ctx):
     module = ctx.module
     # Setup types
@@ -439,12 +491,23 @@ def _setup_mt_rand_float(ctx, state_ty, gen_int):
     a = builder.lshr(a, a.type(5))
     b = builder.lshr(b, b.type(6))
 
-    af = builder.uitofp(a, ctx.float_ty)
-    bf = builder.uitofp(b, ctx.float_ty)
+    # The 53bit sample is constructed in double precision at every precision,
+    # so that the same sequence of samples is generated
+    double_ty = ir.DoubleType()
+    af = builder.uitofp(a, double_ty)
+    bf = builder.uitofp(b, double_ty)
 
-    val = builder.fmul(af, ctx.float_ty(67108864.0))
+    val = builder.fmul(af, double_ty(67108864.0))
     val = builder.fadd(val, bf)
-    val = builder.fdiv(val, ctx.float_ty(9007199254740992.0))
+    val = builder.fdiv(val, double_ty(9007199254740992.0))
+
+    if not isinstance(ctx.float_ty, ir.DoubleType):
+        # Rounding to lower precision can round up to 1.0,
+        # use the largest representable value below 1.0 instead
+        val = builder.fptrunc(val, ctx.float_ty)
+        below_one = ctx.float_ty(float(np.nextafter(np.float32(1.0), np.float32(0.0))))
+        is_one = builder.fcmp_ordered(">=", val, ctx.float_ty(1.0))
+        val = builder.select(is_one, below_one, val)
 
     builder.store(val, out)
     builder.ret_void()
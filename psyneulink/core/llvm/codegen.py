@@ -0,0 +1,754 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+
+
+# ********************************************* PNL LLVM codegen **************************************************************
+
+import ast
+import builtins
+import inspect
+import numbers
+import textwrap
+
+import numpy as np
+from llvmlite import ir
+
+from psyneulink.core.llvm import helpers
+
+__all__ = ['UnsupportedConstructError', 'UserDefinedFunctionVisitor']
+
+
+class UnsupportedConstructError(Exception):
+    pass
+
+
+# Python callables that are lowered elementwise, mapped to the name of the scalar operation
+_UNARY_UFUNCS = {
+    np.exp: 'exp', np.log: 'log', np.sqrt: 'sqrt', np.abs: 'fabs', np.fabs: 'fabs', builtins.abs: 'fabs',
+    np.sin: 'sin', np.cos: 'cos', np.floor: 'floor', np.ceil: 'ceil', np.tanh: 'tanh',
+    np.negative: 'negative', np.square: 'square',
+}
+
+_BINARY_UFUNCS = {
+    np.add: ast.Add, np.subtract: ast.Sub, np.multiply: ast.Mult, np.divide: ast.Div, np.power: ast.Pow,
+    np.maximum: 'maximum', np.minimum: 'minimum',
+}
+
+_REDUCTIONS = {np.sum: 'sum', np.max: 'max', np.min: 'min'}
+
+_COMPARISONS = {ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=', ast.Gt: '>', ast.GtE: '>='}
+
+
+class UserDefinedFunctionVisitor(ast.NodeVisitor):
+    """Lower the body of a Python function to LLVM IR.
+
+    Only a restricted subset of Python is supported: arithmetic and comparisons on scalars and fixed-size arrays
+    (with numpy broadcasting), numpy elementwise ufuncs, dot products and reductions, `if` statements and `for`
+    loops over `range` or over the items of an array.  Anything else raises `UnsupportedConstructError`
+    naming the construct and its line.
+    """
+
+    def __init__(self, ctx, builder, func, func_params, arg_in, arg_out):
+        self.ctx = ctx
+        self.builder = builder
+        self.func = func
+        self.func_params = func_params
+        self.arg_in = arg_in
+        self.arg_out = arg_out
+
+        # Allocas are placed at the start of the entry block so that the ones
+        # created inside loops do not grow the stack on every iteration
+        entry_block = builder.block
+        entry_branch = builder.branch(builder.append_basic_block(name="udf_body"))
+        builder.position_at_end(entry_branch.operands[0])
+        self.alloca_builder = ir.IRBuilder(entry_block)
+        self.alloca_builder.position_before(entry_branch)
+
+        try:
+            closure = inspect.getclosurevars(func)
+            self.py_names = {**closure.builtins, **closure.globals, **closure.nonlocals}
+        except TypeError:
+            self.py_names = {}
+
+        self.args = {}
+        self.locals = {}
+        self.ret_block = None
+
+    def gen_function_body(self):
+        node = self._get_function_node()
+        args = node.args
+        if args.vararg is not None or args.kwarg is not None:
+            raise self._unsupported(node, "variable arguments")
+
+        arg_names = [a.arg for a in args.args + args.kwonlyargs]
+        self.args[arg_names[0]] = self.arg_in
+        for name in arg_names[1:]:
+            if name in self.func_params:
+                self.args[name] = self._bind_param(self.func_params[name])
+
+        if isinstance(node, ast.Lambda):
+            body = [ast.Return(value=node.body, lineno=node.lineno, col_offset=node.col_offset)]
+        else:
+            body = node.body
+        if len(body) == 0 or not isinstance(body[-1], ast.Return) or body[-1].value is None:
+            raise self._unsupported(body[-1] if body else node, "function not ending with a return of a value")
+
+        # Arguments that are reassigned in the body get a local copy,
+        # so that loops see the updated value on every iteration
+        for n in ast.walk(node):
+            if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store) and n.id in self.args:
+                self._assign_name(n, n.id, self.args[n.id])
+
+        self.ret_block = self.builder.append_basic_block(name="udf_return")
+        for stmt in body:
+            self.visit(stmt)
+
+        if not self.builder.block.is_terminated:
+            self.builder.branch(self.ret_block)
+        self.builder.position_at_end(self.ret_block)
+
+        return self.builder
+
+    def _get_function_node(self):
+        try:
+            lines, first_line = inspect.getsourcelines(self.func)
+        except (OSError, TypeError) as e:
+            raise UnsupportedConstructError("source of {} is not available ({})".format(self.func, e))
+
+        try:
+            tree = ast.parse(textwrap.dedent(''.join(lines)))
+        except SyntaxError:
+            raise UnsupportedConstructError("source of {} could not be parsed on its own "
+                                            "(line {})".format(self.func.__name__, first_line))
+        ast.increment_lineno(tree, first_line - 1)
+
+        code = self.func.__code__
+        arg_names = list(code.co_varnames[:code.co_argcount + code.co_kwonlyargcount])
+        if self.func.__name__ == '<lambda>':
+            candidates = [n for n in ast.walk(tree) if isinstance(n, ast.Lambda)]
+        else:
+            candidates = [n for n in ast.walk(tree)
+                          if isinstance(n, ast.FunctionDef) and n.name == self.func.__name__]
+        candidates = [n for n in candidates if [a.arg for a in n.args.args + n.args.kwonlyargs] == arg_names]
+        if len(candidates) != 1:
+            raise UnsupportedConstructError("definition of {} could not be identified in its source "
+                                            "(line {})".format(self.func.__name__, first_line))
+        return candidates[0]
+
+    def _unsupported(self, node, what=None):
+        if what is None:
+            what = "'{}'".format(type(node).__name__)
+        return UnsupportedConstructError("unsupported {} at line {}".format(what, getattr(node, 'lineno', '?')))
+
+    def generic_visit(self, node):
+        raise self._unsupported(node)
+
+    # Values are either LLVM scalars (float, i32 for indices, i1 for conditions)
+    # or pointers to (nested) arrays of floats.
+    def _bind_param(self, ptr):
+        ty = ptr.type.pointee
+        if isinstance(ty, ir.LiteralStructType):
+            return ptr
+        while isinstance(ty, ir.ArrayType) and ty.count == 1:
+            ptr = self.builder.gep(ptr, [self.ctx.int32_ty(0), self.ctx.int32_ty(0)])
+            ty = ty.element
+        if isinstance(ty, ir.ArrayType):
+            return ptr
+        return self.builder.load(ptr)
+
+    @staticmethod
+    def _is_ptr(val):
+        return isinstance(val.type, ir.PointerType)
+
+    @staticmethod
+    def _is_array(val):
+        return isinstance(val.type, ir.PointerType) and isinstance(val.type.pointee, ir.ArrayType)
+
+    @staticmethod
+    def _shape(val):
+        ty = val.type.pointee if isinstance(val.type, ir.PointerType) else val.type
+        shape = []
+        while isinstance(ty, ir.ArrayType):
+            shape.append(ty.count)
+            ty = ty.element
+        return tuple(shape)
+
+    def _array_type(self, shape):
+        ty = self.ctx.float_ty
+        for dim in reversed(shape):
+            ty = ir.ArrayType(ty, dim)
+        return ty
+
+    def _alloca(self, ty):
+        return self.alloca_builder.alloca(ty)
+
+    def _load(self, val):
+        if self._is_ptr(val) and not isinstance(val.type.pointee, (ir.ArrayType, ir.LiteralStructType)):
+            return self.builder.load(val)
+        return val
+
+    def _as_float(self, node, val):
+        if self._is_ptr(val):
+            raise self._unsupported(node, "use of an array where a scalar is required")
+        if val.type == self.ctx.float_ty:
+            return val
+        if val.type == ir.IntType(1):
+            return self.builder.uitofp(val, self.ctx.float_ty)
+        if isinstance(val.type, ir.IntType):
+            return self.builder.sitofp(val, self.ctx.float_ty)
+        raise self._unsupported(node, "value of type {}".format(val.type))
+
+    def _as_bool(self, node, val):
+        if self._is_ptr(val):
+            raise self._unsupported(node, "truth value of an array")
+        if val.type == ir.IntType(1):
+            return val
+        if isinstance(val.type, ir.IntType):
+            return self.builder.icmp_signed('!=', val, val.type(0))
+        return self.builder.fcmp_unordered('!=', val, val.type(0))
+
+    def _as_index(self, node, val):
+        if self._is_ptr(val):
+            raise self._unsupported(node, "array used as an index")
+        if val.type == self.ctx.int32_ty:
+            return val
+        if isinstance(val.type, ir.IntType):
+            return self.builder.zext(val, self.ctx.int32_ty)
+        return self.builder.fptosi(val, self.ctx.int32_ty)
+
+    def _constant(self, node, value):
+        if isinstance(value, (bool, np.bool_)):
+            return ir.IntType(1)(int(value))
+        if isinstance(value, numbers.Integral) and -2**31 <= value < 2**31:
+            return self.ctx.int32_ty(int(value))
+        if isinstance(value, numbers.Real):
+            return self.ctx.float_ty(float(value))
+        if isinstance(value, (list, tuple, np.ndarray)):
+            try:
+                array = np.asfarray(value)
+            except (TypeError, ValueError):
+                raise self._unsupported(node, "constant {}".format(value))
+            if array.ndim == 0:
+                return self.ctx.float_ty(float(array))
+            ptr = self._alloca(self._array_type(array.shape))
+            self.builder.store(ptr.type.pointee(array.tolist()), ptr)
+            return ptr
+        raise self._unsupported(node, "constant {!r}".format(value))
+
+    # Elementwise operations with numpy broadcasting
+    def _broadcast_shape(self, node, *vals):
+        shapes = [self._shape(v) for v in vals]
+        try:
+            return np.broadcast(*(np.empty(s) for s in shapes)).shape
+        except ValueError:
+            raise self._unsupported(node, "operands with shapes {} that cannot be broadcast together".format(
+                                    ' '.join(str(s) for s in shapes)))
+
+    def _elementwise(self, node, op, *vals):
+        for v in vals:
+            if self._is_ptr(v) and not self._is_array(v):
+                raise self._unsupported(node, "arithmetic on a ragged array")
+        shape = self._broadcast_shape(node, *vals)
+        if len(shape) == 0:
+            return op(self.builder, *(self._as_float(node, v) for v in vals))
+        res = self._alloca(self._array_type(shape))
+        self._gen_elementwise(node, res, vals, op)
+        return res
+
+    def _gen_elementwise(self, node, res, vals, op):
+        if not isinstance(res.type.pointee, ir.ArrayType):
+            args = (self._as_float(node, self._load(v)) for v in vals)
+            self.builder.store(op(self.builder, *args), res)
+            return
+
+        ndim = len(self._shape(res))
+        with helpers.array_ptr_loop(self.builder, res, "udf_elementwise") as (b, i):
+            sub_vals = []
+            for v in vals:
+                if self._is_array(v) and len(self._shape(v)) == ndim:
+                    idx = i if v.type.pointee.count > 1 else self.ctx.int32_ty(0)
+                    v = b.gep(v, [self.ctx.int32_ty(0), idx])
+                sub_vals.append(v)
+            self._gen_elementwise(node, b.gep(res, [self.ctx.int32_ty(0), i]), sub_vals, op)
+
+    def _store(self, node, dst, val):
+        if isinstance(dst.type.pointee, ir.LiteralStructType):
+            raise self._unsupported(node, "assignment to a ragged array")
+        if self._is_ptr(val) and not self._is_array(val):
+            raise self._unsupported(node, "assignment of a ragged array")
+        val_shape = self._shape(val)
+        dst_shape = self._shape(dst)
+        # Drop leading dimensions of size one (e.g. returning a 2d variable to a 1d output)
+        while len(val_shape) > len(dst_shape) and val_shape[0] == 1:
+            val = self.builder.gep(val, [self.ctx.int32_ty(0), self.ctx.int32_ty(0)])
+            val_shape = val_shape[1:]
+        try:
+            np.broadcast_to(np.empty(val_shape), dst_shape)
+        except ValueError:
+            raise self._unsupported(node, "assignment of shape {} to shape {}".format(val_shape, dst_shape))
+        self._gen_elementwise(node, dst, [val], lambda b, x: x)
+
+    def _binop(self, node, op, left, right):
+        if not self._is_ptr(left) and not self._is_ptr(right) and \
+           left.type == right.type == self.ctx.int32_ty and op in (ast.Add, ast.Sub, ast.Mult):
+            int_ops = {ast.Add: self.builder.add, ast.Sub: self.builder.sub, ast.Mult: self.builder.mul}
+            return int_ops[op](left, right)
+
+        if op is ast.Add:
+            f = lambda b, x, y: b.fadd(x, y)
+        elif op is ast.Sub:
+            f = lambda b, x, y: b.fsub(x, y)
+        elif op is ast.Mult:
+            f = lambda b, x, y: b.fmul(x, y)
+        elif op is ast.Div:
+            f = lambda b, x, y: b.fdiv(x, y)
+        elif op is ast.Pow:
+            pow_f = self.ctx.get_builtin("pow", [self.ctx.float_ty])
+            f = lambda b, x, y: b.call(pow_f, [x, y])
+        elif op is ast.FloorDiv:
+            floor_f = self.ctx.get_builtin("floor", [self.ctx.float_ty])
+            f = lambda b, x, y: b.call(floor_f, [b.fdiv(x, y)])
+        elif op is ast.Mod:
+            floor_f = self.ctx.get_builtin("floor", [self.ctx.float_ty])
+            # Python's modulo takes the sign of the divisor
+            f = lambda b, x, y: b.fsub(x, b.fmul(y, b.call(floor_f, [b.fdiv(x, y)])))
+        elif op == 'maximum':
+            f = lambda b, x, y: b.select(b.fcmp_ordered('>=', x, y), x, y)
+        elif op == 'minimum':
+            f = lambda b, x, y: b.select(b.fcmp_ordered('<=', x, y), x, y)
+        else:
+            raise self._unsupported(node, "operator '{}'".format(op.__name__))
+        return self._elementwise(node, f, left, right)
+
+    def _unary(self, node, name, val):
+        if name in ('exp', 'log', 'sqrt', 'fabs', 'sin', 'cos', 'floor', 'ceil'):
+            fn = self.ctx.get_builtin(name, [self.ctx.float_ty])
+            f = lambda b, x: b.call(fn, [x])
+        elif name == 'tanh':
+            exp_f = self.ctx.get_builtin("exp", [self.ctx.float_ty])
+            def f(b, x):
+                e = b.call(exp_f, [b.fmul(x.type(2.0), x)])
+                return b.fdiv(b.fsub(e, x.type(1.0)), b.fadd(e, x.type(1.0)))
+        elif name == 'negative':
+            if not self._is_ptr(val) and val.type == self.ctx.int32_ty:
+                return self.builder.neg(val)
+            f = lambda b, x: helpers.fneg(b, x)
+        elif name == 'square':
+            f = lambda b, x: b.fmul(x, x)
+        else:
+            raise self._unsupported(node, "function '{}'".format(name))
+        return self._elementwise(node, f, val)
+
+    # Statements
+    def _assign_name(self, node, name, val, index=False):
+        slot = self.locals.get(name)
+        if slot is None:
+            if self._is_ptr(val):
+                if not self._is_array(val):
+                    raise self._unsupported(node, "assignment of a ragged array")
+                slot = self._alloca(val.type.pointee)
+            else:
+                slot = self._alloca(self.ctx.int32_ty if index else self.ctx.float_ty)
+            self.locals[name] = slot
+
+        if isinstance(slot.type.pointee, ir.ArrayType):
+            if not self._is_ptr(val) or self._shape(val) != self._shape(slot):
+                raise self._unsupported(node, "change of the shape of '{}'".format(name))
+            self._gen_elementwise(node, slot, [val], lambda b, x: x)
+        elif self._is_ptr(val):
+            raise self._unsupported(node, "change of '{}' from a scalar to an array".format(name))
+        elif slot.type.pointee == self.ctx.int32_ty:
+            self.builder.store(self._as_index(node, val), slot)
+        else:
+            self.builder.store(self._as_float(node, val), slot)
+
+    def _assign(self, node, target, val):
+        if isinstance(target, ast.Name):
+            self._assign_name(node, target.id, val)
+        elif isinstance(target, ast.Subscript):
+            self._store(node, self._subscript_ptr(target), val)
+        else:
+            raise self._unsupported(target, "assignment target '{}'".format(type(target).__name__))
+
+    def visit_Assign(self, node):
+        val = self.visit(node.value)
+        for target in node.targets:
+            self._assign(node, target, val)
+
+    def visit_AugAssign(self, node):
+        if isinstance(node.target, ast.Name):
+            current = self.visit_Name(ast.Name(id=node.target.id, ctx=ast.Load(), lineno=node.lineno))
+        elif isinstance(node.target, ast.Subscript):
+            current = self._load(self._subscript_ptr(node.target))
+        else:
+            raise self._unsupported(node.target, "assignment target '{}'".format(type(node.target).__name__))
+        val = self._binop(node, type(node.op), current, self.visit(node.value))
+        self._assign(node, node.target, val)
+
+    def visit_Return(self, node):
+        if node.value is None:
+            raise self._unsupported(node, "return without a value")
+        self._store(node, self.arg_out, self.visit(node.value))
+        self.builder.branch(self.ret_block)
+        self.builder.position_at_end(self.builder.append_basic_block(name="udf_post_return"))
+
+    def visit_Expr(self, node):
+        # Allow docstrings, everything else would be evaluated only for its side effects
+        value = node.value
+        if isinstance(value, ast.Str) or (isinstance(value, getattr(ast, 'Constant', ())) and
+                                          isinstance(getattr(value, 'value', None), str)):
+            return
+        raise self._unsupported(node, "expression statement")
+
+    def visit_Pass(self, node):
+        pass
+
+    def visit_If(self, node):
+        cond = self._as_bool(node.test, self.visit(node.test))
+        with self.builder.if_else(cond) as (then_branch, else_branch):
+            with then_branch:
+                for stmt in node.body:
+                    self.visit(stmt)
+            with else_branch:
+                for stmt in node.orelse:
+                    self.visit(stmt)
+
+    def visit_For(self, node):
+        if node.orelse:
+            raise self._unsupported(node, "'else' clause of a 'for' loop")
+        if not isinstance(node.target, ast.Name):
+            raise self._unsupported(node.target, "loop target '{}'".format(type(node.target).__name__))
+
+        iterator = node.iter
+        is_range = isinstance(iterator, ast.Call) and self._resolve_callable(iterator.func) is builtins.range
+        if is_range:
+            if iterator.keywords or not 1 <= len(iterator.args) <= 3:
+                raise self._unsupported(iterator, "call to 'range'")
+            bounds = [self._as_index(iterator, self.visit(a)) for a in iterator.args]
+            if len(bounds) == 1:
+                start, stop, step = self.ctx.int32_ty(0), bounds[0], self.ctx.int32_ty(1)
+            elif len(bounds) == 2:
+                start, stop, step = bounds[0], bounds[1], self.ctx.int32_ty(1)
+            else:
+                start, stop, step = bounds
+            if not isinstance(step, ir.Constant) or step.constant <= 0:
+                raise self._unsupported(iterator, "'range' with a non-constant or non-positive step")
+        else:
+            array = self.visit(iterator)
+            if not self._is_array(array):
+                raise self._unsupported(iterator, "iteration over a non-array value")
+            start = self.ctx.int32_ty(0)
+            stop = self.ctx.int32_ty(array.type.pointee.count)
+            step = self.ctx.int32_ty(1)
+
+        with helpers.for_loop(self.builder, start, stop, step, "udf_for") as (b, i):
+            if is_range:
+                self._assign_name(node, node.target.id, i, index=True)
+            else:
+                self._assign_name(node, node.target.id, self._load(b.gep(array, [self.ctx.int32_ty(0), i])))
+            for stmt in node.body:
+                self.visit(stmt)
+
+    # Expressions
+    def visit_Num(self, node):
+        return self._constant(node, node.n)
+
+    def visit_NameConstant(self, node):
+        return self._constant(node, node.value)
+
+    def visit_Constant(self, node):
+        return self._constant(node, node.value)
+
+    def visit_List(self, node):
+        vals = [self.visit(e) for e in node.elts]
+        if len(vals) == 0:
+            raise self._unsupported(node, "empty list")
+        shapes = {self._shape(v) for v in vals}
+        if len(shapes) != 1 or any(self._is_ptr(v) and not self._is_array(v) for v in vals):
+            raise self._unsupported(node, "ragged list")
+        res = self._alloca(self._array_type((len(vals),) + shapes.pop()))
+        for i, v in enumerate(vals):
+            dst = self.builder.gep(res, [self.ctx.int32_ty(0), self.ctx.int32_ty(i)])
+            self._gen_elementwise(node, dst, [v], lambda b, x: x)
+        return res
+
+    visit_Tuple = visit_List
+
+    def visit_Name(self, node):
+        name = node.id
+        if name in self.locals:
+            slot = self.locals[name]
+            return slot if isinstance(slot.type.pointee, ir.ArrayType) else self.builder.load(slot)
+        if name in self.args:
+            return self.args[name]
+        try:
+            value = self.py_names[name]
+        except KeyError:
+            raise self._unsupported(node, "name '{}'".format(name))
+        return self._constant(node, value)
+
+    def visit_Attribute(self, node):
+        return self._constant(node, self._resolve_python(node))
+
+    def _resolve_python(self, node):
+        if isinstance(node, ast.Name):
+            if node.id in self.locals or node.id in self.args or node.id not in self.py_names:
+                raise self._unsupported(node, "reference to '{}'".format(node.id))
+            return self.py_names[node.id]
+        if isinstance(node, ast.Attribute):
+            base = self._resolve_python(node.value)
+            try:
+                return getattr(base, node.attr)
+            except AttributeError:
+                raise self._unsupported(node, "attribute '{}'".format(node.attr))
+        raise self._unsupported(node)
+
+    def _resolve_callable(self, node):
+        try:
+            return self._resolve_python(node)
+        except UnsupportedConstructError:
+            return None
+
+    def _subscript_ptr(self, node):
+        base = self.visit(node.value)
+        if not self._is_ptr(base):
+            raise self._unsupported(node, "subscript of a scalar")
+
+        index = node.slice
+        if isinstance(index, ast.Index):
+            index = index.value
+        indices = index.elts if isinstance(index, ast.Tuple) else [index]
+
+        ptr = base
+        for idx in indices:
+            if isinstance(idx, (ast.Slice, ast.ExtSlice)):
+                raise self._unsupported(node, "slice")
+            ty = ptr.type.pointee
+            if not isinstance(ty, (ir.ArrayType, ir.LiteralStructType)):
+                raise self._unsupported(node, "too many indices")
+            count = ty.count if isinstance(ty, ir.ArrayType) else len(ty.elements)
+            val = self.visit(idx)
+            if isinstance(val, ir.Constant):
+                const = int(val.constant)
+                if const < 0:
+                    const += count
+                if not 0 <= const < count:
+                    raise self._unsupported(node, "index {} out of bounds for size {}".format(val.constant, count))
+                val = self.ctx.int32_ty(const)
+            elif isinstance(ty, ir.LiteralStructType):
+                raise self._unsupported(node, "non-constant index of a ragged array")
+            else:
+                # Negative indices count from the end, as in Python
+                val = self._as_index(idx, val)
+                is_negative = self.builder.icmp_signed('<', val, val.type(0))
+                val = self.builder.select(is_negative, self.builder.add(val, val.type(count)), val)
+            ptr = self.builder.gep(ptr, [self.ctx.int32_ty(0), val])
+        return ptr
+
+    def visit_Subscript(self, node):
+        return self._load(self._subscript_ptr(node))
+
+    def visit_BinOp(self, node):
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        return self._binop(node, type(node.op), left, right)
+
+    def visit_UnaryOp(self, node):
+        val = self.visit(node.operand)
+        if isinstance(node.op, ast.UAdd):
+            return val
+        if isinstance(node.op, ast.USub):
+            if isinstance(val, ir.Constant):
+                return val.type(-val.constant)
+            return self._unary(node, 'negative', val)
+        if isinstance(node.op, ast.Not):
+            return self.builder.not_(self._as_bool(node, val))
+        raise self._unsupported(node, "operator '{}'".format(type(node.op).__name__))
+
+    def visit_BoolOp(self, node):
+        vals = [self._as_bool(v, self.visit(v)) for v in node.values]
+        combine = self.builder.and_ if isinstance(node.op, ast.And) else self.builder.or_
+        res = vals[0]
+        for v in vals[1:]:
+            res = combine(res, v)
+        return res
+
+    def visit_Compare(self, node):
+        if len(node.ops) != 1:
+            raise self._unsupported(node, "chained comparison")
+        op = _COMPARISONS.get(type(node.ops[0]))
+        if op is None:
+            raise self._unsupported(node, "comparison '{}'".format(type(node.ops[0]).__name__))
+        left = self.visit(node.left)
+        right = self.visit(node.comparators[0])
+
+        if not self._is_ptr(left) and not self._is_ptr(right):
+            if left.type == right.type == self.ctx.int32_ty:
+                return self.builder.icmp_signed(op, left, right)
+            left = self._as_float(node, left)
+            right = self._as_float(node, right)
+            if op == '!=':
+                return self.builder.fcmp_unordered(op, left, right)
+            return self.builder.fcmp_ordered(op, left, right)
+
+        # Elementwise comparison of arrays produces an array of 0.0/1.0
+        def f(b, x, y):
+            cmp = b.fcmp_unordered(op, x, y) if op == '!=' else b.fcmp_ordered(op, x, y)
+            return b.uitofp(cmp, x.type)
+        return self._elementwise(node, f, left, right)
+
+    def visit_IfExp(self, node):
+        cond = self._as_bool(node.test, self.visit(node.test))
+        body = self.visit(node.body)
+        orelse = self.visit(node.orelse)
+        return self.builder.select(cond, self._as_float(node.body, body), self._as_float(node.orelse, orelse))
+
+    def visit_Call(self, node):
+        fn = self._resolve_callable(node.func)
+        if node.keywords:
+            raise self._unsupported(node, "keyword arguments")
+        args = [self.visit(a) for a in node.args]
+
+        def check_args(count):
+            if len(args) != count:
+                raise self._unsupported(node, "call to '{}' with {} arguments".format(fn.__name__, len(args)))
+
+        try:
+            unary = _UNARY_UFUNCS.get(fn)
+            binary = _BINARY_UFUNCS.get(fn)
+            reduction = _REDUCTIONS.get(fn)
+        except TypeError:
+            unary = binary = reduction = None
+
+        if unary is not None:
+            check_args(1)
+            return self._unary(node, unary, args[0])
+        if binary is not None:
+            check_args(2)
+            return self._binop(node, binary, args[0], args[1])
+        if reduction is not None:
+            check_args(1)
+            return self._reduce(node, reduction, args[0])
+        if fn is np.dot:
+            check_args(2)
+            return self._dot(node, args[0], args[1])
+        if fn is builtins.len:
+            check_args(1)
+            if not self._is_ptr(args[0]):
+                raise self._unsupported(node, "len() of a scalar")
+            ty = args[0].type.pointee
+            return self.ctx.int32_ty(ty.count if isinstance(ty, ir.ArrayType) else len(ty.elements))
+        if fn is builtins.sum:
+            check_args(1)
+            return self._sum_first_axis(node, args[0])
+        if fn in (builtins.max, builtins.min):
+            name = 'max' if fn is builtins.max else 'min'
+            if len(args) == 1:
+                if len(self._shape(args[0])) != 1:
+                    raise self._unsupported(node, "{}() of a value that is not a 1d array".format(name))
+                return self._reduce(node, name, args[0])
+            res = args[0]
+            for a in args[1:]:
+                res = self._binop(node, 'maximum' if name == 'max' else 'minimum', res, a)
+            return res
+        if fn is builtins.float:
+            check_args(1)
+            return self._as_float(node, args[0])
+        if fn is builtins.int:
+            check_args(1)
+            return self._as_index(node, args[0])
+
+        callee = getattr(node.func, 'id', getattr(node.func, 'attr', type(node.func).__name__))
+        raise self._unsupported(node, "call to '{}'".format(callee))
+
+    def _reduce(self, node, name, val):
+        if not self._is_ptr(val):
+            return self._as_float(node, val)
+        if not self._is_array(val):
+            raise self._unsupported(node, "reduction of a ragged array")
+
+        init = {'sum': 0.0, 'max': float('-inf'), 'min': float('inf')}[name]
+        acc = self._alloca(self.ctx.float_ty)
+        self.builder.store(self.ctx.float_ty(init), acc)
+
+        def reduce_ptr(ptr):
+            if isinstance(ptr.type.pointee, ir.ArrayType):
+                with helpers.array_ptr_loop(self.builder, ptr, "udf_reduce") as (b, i):
+                    reduce_ptr(b.gep(ptr, [self.ctx.int32_ty(0), i]))
+                return
+            b = self.builder
+            x = b.load(ptr)
+            current = b.load(acc)
+            if name == 'sum':
+                res = b.fadd(current, x)
+            elif name == 'max':
+                res = b.select(b.fcmp_ordered('>', x, current), x, current)
+            else:
+                res = b.select(b.fcmp_ordered('<', x, current), x, current)
+            b.store(res, acc)
+
+        reduce_ptr(val)
+        return self.builder.load(acc)
+
+    def _sum_first_axis(self, node, val):
+        shape = self._shape(val)
+        if len(shape) <= 1:
+            return self._reduce(node, 'sum', val)
+
+        res = self._alloca(self._array_type(shape[1:]))
+        self._gen_elementwise(node, res, [self.ctx.float_ty(0)], lambda b, x: x)
+        with helpers.array_ptr_loop(self.builder, val, "udf_sum") as (b, i):
+            row = b.gep(val, [self.ctx.int32_ty(0), i])
+            self._gen_elementwise(node, res, [res, row], lambda b, x, y: b.fadd(x, y))
+        return res
+
+    def _gen_sum_of_products(self, count, term):
+        acc = self._alloca(self.ctx.float_ty)
+        self.builder.store(self.ctx.float_ty(0), acc)
+        with helpers.for_loop_zero_inc(self.builder, self.ctx.int32_ty(count), "udf_dot") as (b, k):
+            b.store(b.fadd(b.load(acc), term(b, k)), acc)
+        return self.builder.load(acc)
+
+    def _dot(self, node, a, b):
+        if not self._is_ptr(a) or not self._is_ptr(b):
+            return self._binop(node, ast.Mult, a, b)
+        if not self._is_array(a) or not self._is_array(b):
+            raise self._unsupported(node, "dot product of a ragged array")
+
+        zero = self.ctx.int32_ty(0)
+        shape_a = self._shape(a)
+        shape_b = self._shape(b)
+        if len(shape_a) > 2 or len(shape_b) > 2 or shape_a[-1] != shape_b[0]:
+            raise self._unsupported(node, "dot product of shapes {} and {}".format(shape_a, shape_b))
+
+        def element(builder, ptr, *indices):
+            return builder.load(builder.gep(ptr, [zero] + list(indices)))
+
+        count = shape_b[0]
+        if len(shape_a) == 1 and len(shape_b) == 1:
+            return self._gen_sum_of_products(count, lambda bld, k: bld.fmul(element(bld, a, k),
+                                                                            element(bld, b, k)))
+
+        res = self._alloca(self._array_type(shape_a[:-1] + shape_b[1:]))
+        if len(shape_a) == 1:
+            with helpers.array_ptr_loop(self.builder, res, "udf_dot_col") as (bld, j):
+                val = self._gen_sum_of_products(count, lambda bl, k: bl.fmul(element(bl, a, k),
+                                                                             element(bl, b, k, j)))
+                bld.store(val, bld.gep(res, [zero, j]))
+        elif len(shape_b) == 1:
+            with helpers.array_ptr_loop(self.builder, res, "udf_dot_row") as (bld, i):
+                val = self._gen_sum_of_products(count, lambda bl, k: bl.fmul(element(bl, a, i, k),
+                                                                             element(bl, b, k)))
+                bld.store(val, bld.gep(res, [zero, i]))
+        else:
+            with helpers.array_ptr_loop(self.builder, res, "udf_dot_row") as (bld, i):
+                row = bld.gep(res, [zero, i])
+                with helpers.array_ptr_loop(bld, row, "udf_dot_col") as (bld, j):
+                    val = self._gen_sum_of_products(count, lambda bl, k: bl.fmul(element(bl, a, i, k),
+                                                                                 element(bl, b, k, j)))
+                    bld.store(val, bld.gep(row, [zero, j]))
+        return res
@@ -8,6 +8,7 @@
 
 # ********************************************* Binary Execution Wrappers **************************************************************
 
+from psyneulink.core.globals.keywords import MATRIX
 from psyneulink.core.globals.utilities import NodeRole
 
 import copy, ctypes
@@ -15,6 +16,7 @@ from collections import defaultdict
 import numpy as np
 
 from .builder_context import *
+from .builder_context import _float_dtype
 from . import helpers, jit_engine
 from .debug import debug_env
 
@@ -25,7 +27,7 @@ def _convert_ctype_to_python(x):
         return [_convert_ctype_to_python(getattr(x, field_name)) for field_name, _ in x._fields_]
     if isinstance(x, ctypes.Array):
         return [_convert_ctype_to_python(num) for num in x]
-    if isinstance(x, ctypes.c_double):
+    if isinstance(x, (ctypes.c_double, ctypes.c_float)):
         return x.value
     if isinstance(x, (float, int)):
         return x
@@ -102,7 +104,7 @@ class CUDAExecution:
 
     def cuda_execute(self, variable):
         # Create input parameter
-        new_var = np.asfarray(variable)
+        new_var = np.asfarray(variable, dtype=_float_dtype)
         data_in = jit_engine.pycuda.driver.In(new_var)
         self._uploaded_bytes += new_var.nbytes
 
@@ -168,7 +170,16 @@ class FuncExecution(CUDAExecution):
         return self._get_compilation_param('context_struct', '_get_context_initializer', 1, self._execution_ids[0])
 
     def execute(self, variable):
-        new_variable = np.asfarray(variable)
+        try:
+            new_variable = np.asfarray(variable, dtype=_float_dtype)
+        except ValueError:
+            # Items of variable have different shapes, so pass them in a structure
+            assert len(self._execution_ids) == 1
+            ct_vi = self._vi_ty(*_tupleize(variable))
+            self._bin_func(ctypes.byref(self._param_struct),
+                           ctypes.byref(self._context_struct),
+                           ctypes.byref(ct_vi), ctypes.byref(self._ct_vo))
+            return _convert_ctype_to_python(self._ct_vo)
 
         if len(self._execution_ids) > 1:
             # wrap_call casts the arguments so we only need contiguaous data
@@ -193,8 +204,14 @@ class MechExecution(FuncExecution):
         # a) the input is vector of input states
         # b) input states take vector of projection outputs
         # c) projection output is a vector (even 1 element vector)
-        new_var = np.asfarray([np.atleast_2d(x) for x in variable])
-        return super().execute(new_var)
+        # Input states of different sizes are passed as a structure
+        new_var = [np.atleast_2d(x) for x in variable]
+        value = super().execute(new_var)
+        # Copy compiled state that Python reads (e.g. to schedule) back to the Mechanism
+        if hasattr(self._component, '_assign_compiled_context') and len(self._execution_ids) == 1:
+            context = _convert_ctype_to_python(self._context_struct)
+            self._component._assign_compiled_context(context, self._execution_ids[0])
+        return value
 
 
 class CompExecution(CUDAExecution):
@@ -340,6 +357,42 @@ class CompExecution(CUDAExecution):
     def extract_node_params(self, node):
         return self.extract_node_struct(node, self._param_struct)
 
+    def update_learned_projections(self):
+        """Copy matrices updated by compiled learning from the parameter structure to Parameter values"""
+        learned_projections = self._composition._get_learned_projections()
+        if len(learned_projections) == 0:
+            return
+
+        for i, execution_id in enumerate(self._execution_ids):
+            param_struct = self._param_struct[i] if len(self._execution_ids) > 1 else self._param_struct
+            proj_struct = getattr(param_struct, param_struct._fields_[1][0])
+            for proj in learned_projections:
+                index = self._composition.projections.index(proj)
+                params = _convert_ctype_to_python(getattr(proj_struct, proj_struct._fields_[index][0]))
+                matrix = params[proj.function._get_param_ids().index(MATRIX)]
+                matrix = np.asfarray(matrix).reshape(np.shape(proj.function.defaults.matrix))
+
+                proj.parameters.matrix.set(matrix, execution_id, override=True)
+                proj.function.parameters.matrix.set(matrix, execution_id, override=True)
+                matrix_state = proj.parameter_states[MATRIX]
+                matrix_state.parameters.value.set(matrix, execution_id, override=True)
+                matrix_state.function.parameters.previous_value.set(matrix, execution_id, override=True)
+
+    def update_node_state(self, node):
+        """Copy compiled state that Python reads (e.g. to schedule) from the context structure back to node"""
+        if not hasattr(node, '_assign_compiled_context'):
+            return
+
+        states = self.extract_node_state(node)
+        if len(self._execution_ids) == 1:
+            states = [states]
+        for execution_id, state in zip(self._execution_ids, states):
+            node._assign_compiled_context(state, execution_id)
+
+    def update_node_states(self):
+        for node in self._composition.nodes:
+            self.update_node_state(node)
+
     def insert_node_output(self, node, data):
         my_field_name = self._data_struct._fields_[0][0]
         my_res_struct = getattr(self._data_struct, my_field_name)
@@ -448,7 +501,9 @@ class CompExecution(CUDAExecution):
                 for i in range(num_input_sets):
                     run_inps.append([])
                     for m in origins:
-                        run_inps[i] += [[v] for v in inp[m][i]]
+                        # Nodes with a single input (e.g. defaults) use it for every trial
+                        m_inp = inp[m][i] if len(inp[m]) > 1 else inp[m][0]
+                        run_inps[i] += [[v] for v in m_inp]
                 run_inputs.append(run_inps)
 
         else:
@@ -457,7 +512,8 @@ class CompExecution(CUDAExecution):
             for i in range(num_input_sets):
                 run_inputs.append([])
                 for m in origins:
-                    run_inputs[i] += [[v] for v in inputs[m][i]]
+                    m_inp = inputs[m][i] if len(inputs[m]) > 1 else inputs[m][0]
+                    run_inputs[i] += [[v] for v in m_inp]
 
         return c_input(*_tupleize(run_inputs))
 
@@ -15,7 +15,15 @@ from contextlib import contextmanager
 def for_loop(builder, start, stop, inc, id):
     # Initialize index variable
     assert start.type is stop.type
-    index_var = builder.alloca(stop.type)
+    # Allocate the index variable in the entry block, so that loops nested
+    # in other (possibly unbounded) loops don't grow the stack
+    entry_block = builder.function.entry_basic_block
+    if builder.block is entry_block:
+        index_var = builder.alloca(stop.type)
+    else:
+        entry_builder = ir.IRBuilder()
+        entry_builder.position_at_start(entry_block)
+        index_var = entry_builder.alloca(stop.type)
     builder.store(start, index_var)
 
     # basic blocks
@@ -109,6 +117,105 @@ def all_close(builder, arr1, arr2, rtol=1e-05, atol=1e-08):
 
     return builder.load(all_ptr)
 
+
+def nth_element(builder, array, n):
+    """Return the n-th smallest element of array.
+
+    Partially sorts array in place using Hoare's quickselect (like std::nth_element):
+    elements before index n are not greater, and elements after it are not smaller,
+    than the returned one.
+    """
+    zero = n.type(0)
+    lo_ptr = builder.alloca(n.type, name="nth_element_lo")
+    hi_ptr = builder.alloca(n.type, name="nth_element_hi")
+    i_ptr = builder.alloca(n.type, name="nth_element_i")
+    j_ptr = builder.alloca(n.type, name="nth_element_j")
+    builder.store(zero, lo_ptr)
+    builder.store(n.type(array.type.pointee.count - 1), hi_ptr)
+
+    select_block = builder.append_basic_block("nth_element_select")
+    partition_block = builder.append_basic_block("nth_element_partition")
+    scan_cond_block = builder.append_basic_block("nth_element_scan_cond")
+    scan_i_block = builder.append_basic_block("nth_element_scan_i")
+    scan_j_block = builder.append_basic_block("nth_element_scan_j")
+    swap_cond_block = builder.append_basic_block("nth_element_swap_cond")
+    swap_block = builder.append_basic_block("nth_element_swap")
+    narrow_block = builder.append_basic_block("nth_element_narrow")
+    narrow_lo_block = builder.append_basic_block("nth_element_narrow_lo")
+    out_block = builder.append_basic_block("nth_element_out")
+
+    def element(idx):
+        return builder.gep(array, [zero, idx])
+
+    # Keep selecting while the range [lo, hi] has more than one element
+    builder.branch(select_block)
+    builder.position_at_end(select_block)
+    lo = builder.load(lo_ptr)
+    hi = builder.load(hi_ptr)
+    builder.cbranch(builder.icmp_signed("<", lo, hi), partition_block, out_block)
+
+    builder.position_at_end(partition_block)
+    mid = builder.ashr(builder.add(lo, hi), n.type(1))
+    pivot = builder.load(element(mid))
+    builder.store(lo, i_ptr)
+    builder.store(hi, j_ptr)
+    builder.branch(scan_cond_block)
+
+    builder.position_at_end(scan_cond_block)
+    i = builder.load(i_ptr)
+    j = builder.load(j_ptr)
+    builder.cbranch(builder.icmp_signed("<=", i, j), scan_i_block, narrow_block)
+
+    # Skip elements that are already on the correct side of the pivot
+    builder.position_at_end(scan_i_block)
+    i = builder.load(i_ptr)
+    is_lower = builder.fcmp_ordered("<", builder.load(element(i)), pivot)
+    with builder.if_then(is_lower):
+        builder.store(builder.add(i, n.type(1)), i_ptr)
+        builder.branch(scan_i_block)
+    builder.branch(scan_j_block)
+
+    builder.position_at_end(scan_j_block)
+    j = builder.load(j_ptr)
+    is_higher = builder.fcmp_ordered(">", builder.load(element(j)), pivot)
+    with builder.if_then(is_higher):
+        builder.store(builder.sub(j, n.type(1)), j_ptr)
+        builder.branch(scan_j_block)
+    builder.branch(swap_cond_block)
+
+    builder.position_at_end(swap_cond_block)
+    i = builder.load(i_ptr)
+    j = builder.load(j_ptr)
+    builder.cbranch(builder.icmp_signed("<=", i, j), swap_block, scan_cond_block)
+
+    builder.position_at_end(swap_block)
+    i_val = builder.load(element(i))
+    j_val = builder.load(element(j))
+    builder.store(j_val, element(i))
+    builder.store(i_val, element(j))
+    builder.store(builder.add(i, n.type(1)), i_ptr)
+    builder.store(builder.sub(j, n.type(1)), j_ptr)
+    builder.branch(scan_cond_block)
+
+    # Continue in the part that contains n, or stop if n is between the parts
+    builder.position_at_end(narrow_block)
+    i = builder.load(i_ptr)
+    j = builder.load(j_ptr)
+    with builder.if_then(builder.icmp_signed("<=", n, j)):
+        builder.store(j, hi_ptr)
+        builder.branch(select_block)
+    builder.branch(narrow_lo_block)
+
+    builder.position_at_end(narrow_lo_block)
+    with builder.if_then(builder.icmp_signed(">=", n, i)):
+        builder.store(i, lo_ptr)
+        builder.branch(select_block)
+    builder.branch(out_block)
+
+    builder.position_at_end(out_block)
+    return builder.load(element(n))
+
+
 class ConditionGenerator:
     def __init__(self, ctx, composition):
         self.ctx = ctx
@@ -268,6 +268,7 @@ Class Reference
 ---------------
 
 """
+import numpy as np
 import typecheck as tc
 
 from psyneulink.core import llvm as pnlvm
@@ -686,6 +687,9 @@ class LCControlMechanism(ControlMechanism):
                                CONTROL_PROJECTIONS: None,
                                })
 
+    # Mechanism parameters used to compute the gain (in compiled execution, in this order)
+    _gain_param_ids = ('scaling_factor_gain', 'base_level_gain')
+
     @tc.typecheck
     def __init__(self,
                  system:tc.optional(System_Base)=None,
@@ -867,7 +871,10 @@ class LCControlMechanism(ControlMechanism):
             context=context
         )
 
-        gain_t = self.parameters.scaling_factor_gain.get(execution_id) * output_values[1] + self.parameters.base_level_gain.get(execution_id)
+        # Use the values of the ParameterStates, so that the gain parameters can be modulated
+        scaling_factor_gain = self.get_current_mechanism_param("scaling_factor_gain", execution_id)
+        base_level_gain = self.get_current_mechanism_param("base_level_gain", execution_id)
+        gain_t = scaling_factor_gain * output_values[1] + base_level_gain
 
         return gain_t, output_values[0], output_values[1], output_values[2]
 
@@ -877,54 +884,61 @@ class LCControlMechanism(ControlMechanism):
     #     if isinstance(self.modulated_mechanisms, str) and self.modulated_mechanisms is ALL:
     #         self._instantiate_output_states(context=ContextFlags.METHOD)
 
-    def _get_mech_params_type(self, ctx):
-        return ctx.convert_python_struct_to_llvm_ir((self.scaling_factor_gain, self.base_level_gain))
-
-    def _get_mech_params_init(self):
-        return (self.scaling_factor_gain, self.base_level_gain)
+    def _get_gain_params(self, execution_id=None):
+        gain_params = []
+        for param_id in self._gain_param_ids:
+            param = getattr(self.parameters, param_id).get(execution_id)
+            # Existence of parameter state changes the shape to array
+            if param_id in self._parameter_states:
+                param = np.atleast_1d(param)
+            gain_params.append(param)
+        return tuple(gain_params)
 
-    def _gen_llvm_function_postprocess(self, builder, ctx, mf_out):
-        # prepend gain type (matches output[1] type)
+    def _get_mech_params_type(self, ctx):
+        return ctx.convert_python_struct_to_llvm_ir(self._get_gain_params())
+
+    def _get_mech_params_init(self, execution_id=None):
+        return pnlvm._tupleize(self._get_gain_params(execution_id))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, context, arg_in, arg_out):
+        zero = ctx.int32_ty(0)
+        is_output, builder = self._gen_llvm_input_states(ctx, builder, params, context, arg_in)
+
+        mf_params_ptr = builder.gep(params, [zero, ctx.int32_ty(1)])
+        mf_params, builder = self._gen_llvm_param_states(self.function, mf_params_ptr, ctx, builder,
+                                                         params, context, arg_in)
+        mf_ctx = builder.gep(context, [zero, ctx.int32_ty(1)])
+        mf_out, builder = self._gen_llvm_invoke_function(ctx, builder, self.function, mf_params, mf_ctx, is_output)
+
+        # Gain parameters follow the parameters of the States and the function.
+        # They are passed through their ParameterStates, so they can be modulated as well
+        mech_params_ptr = builder.gep(params, [zero, ctx.int32_ty(4)])
+        mech_params, builder = self._gen_llvm_param_states(None, mech_params_ptr, ctx, builder,
+                                                           params, context, arg_in,
+                                                           param_ids=self._gain_param_ids)
+        scaling_factor, base_level = (pnlvm.helpers.load_extract_scalar_array_one(builder,
+                                          builder.gep(mech_params, [zero, ctx.int32_ty(i)]))
+                                      for i in range(len(self._gain_param_ids)))
+
+        # value is (gain, v, w, time) (see _execute); gain has the same type as w
         gain_ty = mf_out.type.pointee.elements[1]
-        elements = gain_ty, *mf_out.type.pointee.elements
-        elements_ty = pnlvm.ir.LiteralStructType(elements)
-
-        # allocate new output type
-        new_out = builder.alloca(elements_ty, 1)
-
-        # Load mechanism parameters
-        params, _, _, _ = builder.function.args
-        mech_params = builder.gep(params, [ctx.int32_ty(0), ctx.int32_ty(4)])
-        scaling_factor_ptr = builder.gep(mech_params, [ctx.int32_ty(0), ctx.int32_ty(0)])
-        base_factor_ptr = builder.gep(mech_params, [ctx.int32_ty(0), ctx.int32_ty(1)])
-        scaling_factor =  builder.load(scaling_factor_ptr)
-        base_factor = builder.load(base_factor_ptr)
-
-        # Apply to the entire vector
-        vi = builder.gep(mf_out, [ctx.int32_ty(0), ctx.int32_ty(1)])
-        vo = builder.gep(new_out, [ctx.int32_ty(0), ctx.int32_ty(0)])
-
-        index = None
-        with pnlvm.helpers.array_ptr_loop(builder, vi, "LC_gain") as (builder, index):
-            in_ptr = builder.gep(vi, [ctx.int32_ty(0), index])
-            val = builder.load(in_ptr);
-            val = builder.fmul(val, scaling_factor)
-            val = builder.fadd(val, base_factor)
-
-            out_ptr = builder.gep(vo, [ctx.int32_ty(0), index])
-            builder.store(val, out_ptr)
+        value = builder.alloca(pnlvm.ir.LiteralStructType([gain_ty, *mf_out.type.pointee.elements]))
 
-        # copy the main function return value
-        for i, _ in enumerate(mf_out.type.pointee.elements):
-            ptr = builder.gep(mf_out, [ctx.int32_ty(0), ctx.int32_ty(i)])
-            out_ptr = builder.gep(new_out, [ctx.int32_ty(0), ctx.int32_ty(i + 1)])
-            val = builder.load(ptr)
-            builder.store(val, out_ptr)
+        w = builder.gep(mf_out, [zero, ctx.int32_ty(1)])
+        gain = builder.gep(value, [zero, zero])
+        with pnlvm.helpers.array_ptr_loop(builder, w, "LC_gain") as (b, index):
+            val = b.load(b.gep(w, [zero, index]))
+            val = b.fmul(val, scaling_factor)
+            val = b.fadd(val, base_level)
+            b.store(val, b.gep(gain, [zero, index]))
 
-        return new_out, builder
+        # copy the main function return value
+        for i in range(len(mf_out.type.pointee.elements)):
+            val = builder.load(builder.gep(mf_out, [zero, ctx.int32_ty(i)]))
+            builder.store(val, builder.gep(value, [zero, ctx.int32_ty(i + 1)]))
 
-    def _gen_llvm_function_input_parse(self, builder, ctx, func, func_in):
-        return func_in, builder
+        builder = self._gen_llvm_output_states(ctx, builder, params, context, value, arg_out, variable=is_output)
+        return builder
 
     @tc.typecheck
     def _add_system(self, system, role:str):
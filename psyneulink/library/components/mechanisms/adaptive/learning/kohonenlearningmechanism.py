@@ -86,6 +86,7 @@ Class Reference
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.component import parameter_keywords
 from psyneulink.core.components.functions.function import ModulationParam, _is_modulation_param, is_function_type
 from psyneulink.core.components.functions.learningfunctions import Hebbian
@@ -444,6 +445,46 @@ class KohonenLearningMechanism(LearningMechanism):
             self.learned_projection.execute(execution_id=execution_id, context=ContextFlags.LEARNING)
             self.learned_projection.parameters.context.get(execution_id).execution_phase = ContextFlags.IDLE
 
+    def _get_context_matrices(self, execution_id=None):
+        """Return the (MappingProjection, matrix) pairs kept in the compiled context
+
+        The matrix of the learned_projection is not accessible from the Mechanism's compiled code, so a copy of it
+        is kept in the context, and is updated by a compiled Composition before the Mechanism executes.
+        """
+        matrix = self.matrix.parameters.value.get(execution_id)
+        if matrix is None:
+            matrix = self.matrix.defaults.value
+        return [(self.learned_projection, np.asfarray(np.atleast_2d(matrix)))]
+
+    def _gen_llvm_function_body(self, ctx, builder, params, context, arg_in, arg_out):
+        zero = ctx.int32_ty(0)
+        mech_context = builder.gep(context, [zero, zero])
+        matrix = builder.gep(context, [zero, ctx.int32_ty(1), zero])
+
+        is_output, builder = self._gen_llvm_input_states(ctx, builder, params, mech_context, arg_in)
+
+        mf_params_ptr = builder.gep(params, [zero, ctx.int32_ty(1)])
+        mf_params, builder = self._gen_llvm_param_states(self.function, mf_params_ptr, ctx, builder,
+                                                         params, mech_context, arg_in)
+        mf_ctx = builder.gep(mech_context, [zero, ctx.int32_ty(1)])
+
+        # Function variable is (input_pattern, activities, matrix) (see _parse_function_variable)
+        function = ctx.get_llvm_function(self.function)
+        f_in = builder.alloca(function.args[2].type.pointee)
+        for i in range(len(self.input_states)):
+            is_out = builder.gep(is_output, [zero, ctx.int32_ty(i)])
+            builder.store(builder.load(is_out), builder.gep(f_in, [zero, ctx.int32_ty(i)]))
+        builder.store(builder.load(matrix), builder.gep(f_in, [zero, ctx.int32_ty(len(self.input_states))]))
+
+        f_out = builder.alloca(function.args[3].type.pointee)
+        builder.call(function, [mf_params, mf_ctx, f_in, f_out])
+
+        # value is [learning_signal] (see _execute)
+        value = builder.bitcast(f_out, pnlvm.ir.ArrayType(f_out.type.pointee, 1).as_pointer())
+        builder = self._gen_llvm_output_states(ctx, builder, params, mech_context, value, arg_out, variable=is_output)
+
+        return builder
+
     @property
     def learned_projection(self):
         return self.primary_learned_projection
@@ -131,7 +131,9 @@ from collections import Iterable
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.combinationfunctions import LinearCombination
+from psyneulink.core.components.functions.userdefinedfunction import UserDefinedFunction
 from psyneulink.core.components.mechanisms.mechanism import Mechanism_Base
 from psyneulink.core.components.mechanisms.processing.objectivemechanism import ObjectiveMechanism
 from psyneulink.core.components.shellclasses import Mechanism
@@ -530,3 +532,26 @@ class ComparatorMechanism(ObjectiveMechanism):
             target_dict = recursive_update(target_dict, target_input_state_dict)
 
         return [sample_dict, target_dict]
+
+    def _gen_llvm_output_state(self, ctx, builder, state, params, context, os_input, os_output):
+        # The SSE and MSE standard OutputStates are implemented as Python lambdas, so compute them natively here
+        if state.name not in {SSE, MSE} or not isinstance(state.function, UserDefinedFunction):
+            return super()._gen_llvm_output_state(ctx, builder, state, params, context, os_input, os_output)
+
+        os_input = ctx.unwrap_2d_array(builder, os_input)
+        sum_ptr = builder.alloca(ctx.float_ty)
+        builder.store(ctx.float_ty(0), sum_ptr)
+        with pnlvm.helpers.array_ptr_loop(builder, os_input, "sse") as (b, i):
+            val = b.load(b.gep(os_input, [ctx.int32_ty(0), i]))
+            val = b.fmul(val, val)
+            b.store(b.fadd(b.load(sum_ptr), val), sum_ptr)
+
+        res = builder.load(sum_ptr)
+        if state.name == MSE:
+            res = builder.fdiv(res, ctx.float_ty(len(os_input.type.pointee)))
+
+        while isinstance(os_output.type.pointee, pnlvm.ir.ArrayType):
+            os_output = builder.gep(os_output, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        builder.store(res, os_output)
+
+        return builder
@@ -279,6 +279,20 @@ of the *minus phase*), the following computations and assignments are made:
   `minus_phase_activity <ContrastiveHebbianMechanism.minus_phase_activity>` is assigned as the `value
   <OutputState.value>` of the *ACTIVITY_DIFFERENCE_OUTPUT* `OutputState <ContrastiveHebbian_Output>`.
 
+.. _ContrastiveHebbian_Compiled_Execution:
+
+*Compiled Execution*
+~~~~~~~~~~~~~~~~~~~~
+
+When it is compiled, a ContrastiveHebbianMechanism executes in the same way as described above:  each execution
+carries out a single pass of the current phase, with `current_activity
+<ContrastiveHebbianMechanism.current_activity>`, `minus_phase_activity
+<ContrastiveHebbianMechanism.minus_phase_activity>`, `plus_phase_activity
+<ContrastiveHebbianMechanism.plus_phase_activity>`, `execution_phase <ContrastiveHebbianMechanism.execution_phase>`
+and `is_finished_ <ContrastiveHebbianMechanism.is_finished_>` kept in its compiled state.  That state is copied back to
+the Mechanism after each execution, so that a `WhenFinished` `Condition` can be used to schedule it.  Since compiled
+code cannot generate an error, `max_passes <ContrastiveHebbianMechanism.max_passes>` is not enforced.
+
 .. _ContrastiveHebbian_Learning_Execution:
 
 *Learning*
@@ -305,6 +319,7 @@ from collections import Iterable
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.function import is_function_type
 from psyneulink.core.components.functions.learningfunctions import ContrastiveHebbian, Hebbian
 from psyneulink.core.components.functions.objectivefunctions import Distance
@@ -313,7 +328,7 @@ from psyneulink.core.components.functions.transferfunctions import Linear, get_m
 from psyneulink.core.components.mechanisms.mechanism import Mechanism
 from psyneulink.core.components.states.outputstate import PRIMARY, StandardOutputStates
 from psyneulink.core.globals.context import ContextFlags
-from psyneulink.core.globals.keywords import CONTRASTIVE_HEBBIAN_MECHANISM, COUNT, FUNCTION, HARD_CLAMP, HOLLOW_MATRIX, MAX_ABS_DIFF, NAME, SIZE, SOFT_CLAMP, TARGET, VARIABLE
+from psyneulink.core.globals.keywords import CONTRASTIVE_HEBBIAN_MECHANISM, COUNT, FUNCTION, HARD_CLAMP, HOLLOW_MATRIX, MAX_ABS_DIFF, NAME, OWNER_VALUE, SIZE, SOFT_CLAMP, TARGET, VARIABLE
 from psyneulink.core.globals.parameters import Parameter
 from psyneulink.core.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.core.globals.utilities import is_numeric_or_none, parameter_spec
@@ -1379,7 +1394,7 @@ class ContrastiveHebbianMechanism(RecurrentTransferMechanism):
             # Otherwise, prepare for start of plus phase on next execution
             else:
                 # Store activity from last execution in plus phase
-                self.parameters.minus_phase_activity.set(self.parameters.current_activity.get(), execution_id)
+                self.parameters.minus_phase_activity.set(self.parameters.current_activity.get(execution_id), execution_id)
                 # Use initial_value attribute to initialize, for the minus phase,
                 #    both the integrator_function's previous_value
                 #    and the Mechanism's current activity (which is returned as its input)
@@ -1460,3 +1475,296 @@ class ContrastiveHebbianMechanism(RecurrentTransferMechanism):
     def is_finished(self, execution_context=None):
         # is a method, to be compatible with scheduling
         return self.parameters.is_finished_.get(execution_context)
+
+    def _get_input_struct_type(self, ctx):
+        # The recurrent projection is executed within the settle loop; the
+        # slot of the RECURRENT InputState only keeps the indices of the rest
+        return super(RecurrentTransferMechanism, self)._get_input_struct_type(ctx)
+
+    def _get_param_struct_type(self, ctx):
+        transfer_t = ctx.get_param_struct_type(super(RecurrentTransferMechanism, self))
+        projection_t = ctx.get_param_struct_type(self.recurrent_projection)
+        convergence_t = ctx.get_param_struct_type(self.convergence_function)
+        return pnlvm.ir.LiteralStructType([transfer_t, projection_t, convergence_t])
+
+    def _get_context_struct_type(self, ctx):
+        transfer_t = ctx.get_context_struct_type(super(RecurrentTransferMechanism, self))
+        projection_t = ctx.get_context_struct_type(self.recurrent_projection)
+        convergence_t = ctx.get_context_struct_type(self.convergence_function)
+        # current activity, minus phase activity, plus phase activity and previous value
+        activity_t = pnlvm.ir.ArrayType(pnlvm.ir.ArrayType(ctx.float_ty, self.recurrent_size), 4)
+        # is_finished_, execution_phase and phase_execution_count
+        return pnlvm.ir.LiteralStructType([transfer_t, projection_t, convergence_t, activity_t,
+                                           ctx.int32_ty, ctx.int32_ty, ctx.int32_ty])
+
+    def _get_param_initializer(self, execution_id):
+        transfer_params = super(RecurrentTransferMechanism, self)._get_param_initializer(execution_id)
+        projection_params = self.recurrent_projection._get_param_initializer(execution_id)
+        # convergence_function is not a dependent component, and is executed in the default context
+        convergence_params = self.convergence_function._get_param_initializer(None)
+        return (transfer_params, projection_params, convergence_params)
+
+    def _get_context_initializer(self, execution_id):
+        transfer_init = super(RecurrentTransferMechanism, self)._get_context_initializer(execution_id)
+        projection_init = self.recurrent_projection._get_context_initializer(execution_id)
+        convergence_init = self.convergence_function._get_context_initializer(None)
+
+        # Current activity is initialized to the value of CURRENT_ACTIVITY_OUTPUT,
+        # that is what the recurrent projection finds.
+        activity_init = []
+        for param in (self.output_states[CURRENT_ACTIVITY_OUTPUT].parameters.value,
+                      self.parameters.minus_phase_activity, self.parameters.plus_phase_activity,
+                      self.parameters.value):
+            val = param.get(execution_id)
+            if val is None:
+                val = np.zeros(self.recurrent_size)
+            activity_init.append(tuple(np.ravel(val)))
+        is_finished = int(bool(self.parameters.is_finished_.get(execution_id)))
+        # execution_phase is None before the first execution, which starts the minus phase
+        execution_phase = int(bool(self.parameters.execution_phase.get(execution_id)))
+        phase_execution_count = int(self.parameters.phase_execution_count.get(execution_id))
+        return (transfer_init, projection_init, convergence_init, tuple(activity_init),
+                is_finished, execution_phase, phase_execution_count)
+
+    def _assign_compiled_context(self, context, execution_id=None):
+        # Copy the state that Python (e.g., WhenFinished Condition) reads back from the compiled context
+        current, minus, plus, _ = (np.asfarray(a) for a in context[3])
+        self.parameters.current_activity.set(current, execution_id)
+        self.parameters.minus_phase_activity.set(minus, execution_id)
+        self.parameters.plus_phase_activity.set(plus, execution_id)
+        self.parameters.is_finished_.set(bool(context[4]), execution_id, override=True)
+        self.parameters.execution_phase.set(bool(context[5]), execution_id, override=True)
+        self.parameters.phase_execution_count.set(context[6], execution_id)
+
+    def _get_mech_params_type(self, ctx):
+        return pnlvm.ir.LiteralStructType([pnlvm.ir.ArrayType(ctx.float_ty, self.recurrent_size),
+                                           ctx.float_ty, ctx.float_ty])
+
+    def _get_mech_params_init(self, execution_id=None):
+        initial_value = np.broadcast_to(np.ravel(self.initial_value), (self.recurrent_size,))
+        return (tuple(initial_value), self.minus_phase_termination_criterion,
+                self.plus_phase_termination_criterion)
+
+    def _gen_llvm_delta_function(self, ctx):
+        # The variable of convergence_function is not shaped after the Mechanism,
+        # generate a version that compares two activity vectors
+        activity_t = pnlvm.ir.ArrayType(ctx.float_ty, self.recurrent_size)
+        args = [ctx.get_param_struct_type(self.convergence_function).as_pointer(),
+                ctx.get_context_struct_type(self.convergence_function).as_pointer(),
+                pnlvm.ir.ArrayType(activity_t, 2).as_pointer(),
+                ctx.float_ty.as_pointer()]
+        func_ty = pnlvm.ir.FunctionType(pnlvm.ir.VoidType(), args)
+        llvm_func = pnlvm.ir.Function(ctx.module, func_ty, name=ctx.get_unique_name(str(self) + "_delta"))
+        llvm_func.attributes.add('argmemonly')
+        llvm_func.attributes.add('alwaysinline')
+
+        builder = pnlvm.ir.IRBuilder(llvm_func.append_basic_block(name="entry"))
+        builder = self.convergence_function._gen_llvm_function_body(ctx, builder, *llvm_func.args)
+        builder.ret_void()
+
+        return llvm_func
+
+    def _gen_llvm_clamp(self, ctx, builder, variable, clamp_value, start):
+        with pnlvm.helpers.array_ptr_loop(builder, clamp_value, "clamp") as (b, i):
+            val = b.load(b.gep(clamp_value, [ctx.int32_ty(0), i]))
+            var_ptr = b.gep(variable, [ctx.int32_ty(0), b.add(i, i.type(start))])
+            if self.clamp == SOFT_CLAMP:
+                val = b.fadd(b.load(var_ptr), val)
+            b.store(val, var_ptr)
+
+    def _gen_llvm_phase_terminated(self, ctx, builder, condition, criterion, count, new_activity, previous,
+                                   delta_function, convergence_params, convergence_context, delta_in, delta_out,
+                                   phase):
+        # Same as the termination test in _execute
+        zero = ctx.int32_ty(0)
+        if condition == CONVERGENCE:
+            builder.store(builder.load(new_activity), builder.gep(delta_in, [zero, zero]))
+            builder.store(builder.load(previous), builder.gep(delta_in, [zero, ctx.int32_ty(1)]))
+            builder.call(delta_function, [convergence_params, convergence_context, delta_in, delta_out])
+            return builder.fcmp_ordered("<=", builder.load(delta_out), criterion)
+        elif condition == COUNT:
+            return builder.fcmp_ordered("==", builder.uitofp(count, ctx.float_ty), criterion)
+
+        raise ContrastiveHebbianError("Unrecognized {} specification ({}) in compilation of {} of {}".format(
+                                      repr('current_termination_condition'), condition,
+                                      repr('PLUS_PHASE') if phase is PLUS_PHASE else repr('MINUS_PHASE'),
+                                      self.name))
+
+    def _gen_llvm_function_body(self, ctx, builder, params, context, arg_in, arg_out):
+        zero = ctx.int32_ty(0)
+        transfer_params = builder.gep(params, [zero, zero])
+        transfer_context = builder.gep(context, [zero, zero])
+        projection_params = builder.gep(params, [zero, ctx.int32_ty(1)])
+        projection_context = builder.gep(context, [zero, ctx.int32_ty(1)])
+        convergence_params = builder.gep(params, [zero, ctx.int32_ty(2)])
+        convergence_context = builder.gep(context, [zero, ctx.int32_ty(2)])
+
+        activity = builder.gep(context, [zero, ctx.int32_ty(3)])
+        current, minus, plus, previous = (builder.gep(activity, [zero, ctx.int32_ty(i)]) for i in range(4))
+        is_finished, execution_phase, count_ptr = (builder.gep(context, [zero, ctx.int32_ty(i)]) for i in range(4, 7))
+
+        # Mechanism parameters follow the TransferMechanism part of the param struct
+        mech_params = builder.gep(transfer_params, [zero, ctx.int32_ty(4)])
+        initial_value = builder.gep(mech_params, [zero, zero])
+        minus_criterion, plus_criterion = (builder.load(builder.gep(mech_params, [zero, ctx.int32_ty(i)]))
+                                           for i in range(1, 3))
+
+        input_values = {}
+        for i, state in enumerate(self.input_states):
+            if state.name not in {INPUT, TARGET}:
+                continue
+            is_function = ctx.get_llvm_function(state)
+            is_params = builder.gep(transfer_params, [zero, zero, ctx.int32_ty(i)])
+            is_context = builder.gep(transfer_context, [zero, zero, ctx.int32_ty(i)])
+            is_in = builder.gep(arg_in, [zero, ctx.int32_ty(i)])
+            is_out = builder.alloca(is_function.args[3].type.pointee)
+            builder.call(is_function, [is_params, is_context, is_in, is_out])
+            input_values[state.name] = ctx.unwrap_2d_array(builder, is_out)
+
+        # The RECURRENT InputState receives the result of recurrent projection
+        recurrent_idx = self.input_states.index(self.input_states[RECURRENT])
+        recurrent_function = ctx.get_llvm_function(self.input_states[RECURRENT])
+        recurrent_params = builder.gep(transfer_params, [zero, zero, ctx.int32_ty(recurrent_idx)])
+        recurrent_context = builder.gep(transfer_context, [zero, zero, ctx.int32_ty(recurrent_idx)])
+        recurrent_in = builder.alloca(recurrent_function.args[2].type.pointee)
+        recurrent_out = builder.alloca(recurrent_function.args[3].type.pointee)
+        projection_function = ctx.get_llvm_function(self.recurrent_projection)
+        projection_out = builder.gep(recurrent_in, [zero, zero])
+
+        f_params = builder.gep(transfer_params, [zero, ctx.int32_ty(1)])
+        f_context = builder.gep(transfer_context, [zero, ctx.int32_ty(1)])
+        mf_function = ctx.get_llvm_function(self.function)
+        mf_param_ptr = builder.gep(f_params, [zero, zero])
+        mf_params, builder = self._gen_llvm_param_states(self.function, mf_param_ptr, ctx, builder,
+                                                         transfer_params, transfer_context, arg_in)
+        mf_context = builder.gep(f_context, [zero, zero])
+        mf_in = builder.alloca(mf_function.args[2].type.pointee)
+        mf_out = builder.alloca(mf_function.args[3].type.pointee)
+        variable = ctx.unwrap_2d_array(builder, mf_in)
+        new_activity = ctx.unwrap_2d_array(builder, mf_out)
+
+        if self.integrator_mode:
+            if_function = ctx.get_llvm_function(self.integrator_function)
+            if_param_ptr = builder.gep(f_params, [zero, ctx.int32_ty(1)])
+            if_params, builder = self._gen_llvm_param_states(self.integrator_function, if_param_ptr, ctx, builder,
+                                                             transfer_params, transfer_context, arg_in)
+            if_context = builder.gep(f_context, [zero, ctx.int32_ty(1)])
+            if_in = builder.alloca(if_function.args[2].type.pointee)
+            if_out = builder.alloca(if_function.args[3].type.pointee)
+            variable = ctx.unwrap_2d_array(builder, if_in)
+
+        delta_function = self._gen_llvm_delta_function(ctx)
+        delta_in = builder.alloca(delta_function.args[2].type.pointee)
+        delta_out = builder.alloca(ctx.float_ty)
+        terminated_ptr = builder.alloca(pnlvm.ir.IntType(1))
+
+        clip = self.get_current_mechanism_param("clip")
+
+        is_plus_phase = builder.icmp_signed("!=", builder.load(execution_phase), zero)
+        # _execute resets the count on every execution of the minus phase
+        count = builder.select(is_plus_phase, builder.load(count_ptr), zero)
+
+        builder.call(projection_function, [projection_params, projection_context, current, projection_out])
+        builder.call(recurrent_function, [recurrent_params, recurrent_context, recurrent_in, recurrent_out])
+        recurrent_value = ctx.unwrap_2d_array(builder, recurrent_out)
+
+        # Zero recurrent input, so that it does not contain residual activity of previous trial
+        was_finished = builder.icmp_signed("!=", builder.load(is_finished), zero)
+        with builder.if_then(was_finished):
+            builder.store(recurrent_value.type.pointee(None), recurrent_value)
+        builder.store(ctx.int32_ty(0), is_finished)
+        builder.store(builder.load(recurrent_value), variable)
+
+        # Same as combination_function
+        with builder.if_else(is_plus_phase) as (plus_phase, minus_phase):
+            with plus_phase:
+                self._gen_llvm_clamp(ctx, builder, variable, input_values[INPUT], 0)
+                if self.mode is not SIMPLE_HEBBIAN and self._target_included:
+                    self._gen_llvm_clamp(ctx, builder, variable, input_values[TARGET], self.target_start)
+            with minus_phase:
+                if self.mode is not SIMPLE_HEBBIAN:
+                    self._gen_llvm_clamp(ctx, builder, variable, input_values[INPUT], 0)
+
+        if self.integrator_mode:
+            builder.call(if_function, [if_params, if_context, if_in, if_out])
+            builder.store(builder.load(ctx.unwrap_2d_array(builder, if_out)),
+                          ctx.unwrap_2d_array(builder, mf_in))
+        builder.call(mf_function, [mf_params, mf_context, mf_in, mf_out])
+
+        if clip is not None:
+            with pnlvm.helpers.array_ptr_loop(builder, new_activity, "clip") as (b, i):
+                ptr = b.gep(new_activity, [zero, i])
+                b.store(pnlvm.helpers.fclamp(b, b.load(ptr), clip[0], clip[1]), ptr)
+
+        count = builder.add(count, ctx.int32_ty(1))
+        builder.store(count, count_ptr)
+
+        terminated_args = (count, new_activity, previous, delta_function,
+                           convergence_params, convergence_context, delta_in, delta_out)
+        with builder.if_else(is_plus_phase) as (plus_phase, minus_phase):
+            with plus_phase:
+                terminated = self._gen_llvm_phase_terminated(ctx, builder, self.plus_phase_termination_condition,
+                                                             plus_criterion, *terminated_args, PLUS_PHASE)
+                builder.store(terminated, terminated_ptr)
+            with minus_phase:
+                terminated = self._gen_llvm_phase_terminated(ctx, builder, self.minus_phase_termination_condition,
+                                                             minus_criterion, *terminated_args, MINUS_PHASE)
+                builder.store(terminated, terminated_ptr)
+
+        builder.store(builder.load(new_activity), current)
+        # Mechanism value is used as previous value by the next execution
+        builder.store(builder.load(new_activity), previous)
+
+        with builder.if_then(builder.load(terminated_ptr)):
+            with builder.if_else(is_plus_phase) as (plus_phase, minus_phase):
+                with plus_phase:
+                    builder.store(builder.load(current), plus)
+                    builder.store(ctx.int32_ty(1), is_finished)
+                with minus_phase:
+                    builder.store(builder.load(current), minus)
+                    if not self.continuous:
+                        builder.store(builder.load(initial_value), current)
+                        if self.integrator_mode:
+                            if_state = ctx.unwrap_2d_array(builder, ctx.get_state_ptr(self.integrator_function,
+                                                                                      builder, if_context,
+                                                                                      "previous_value"))
+                            builder.store(builder.load(initial_value), if_state)
+            # Switch execution_phase
+            builder.store(builder.zext(builder.not_(is_plus_phase), ctx.int32_ty), execution_phase)
+            builder.store(ctx.int32_ty(0), count_ptr)
+
+        sources = {OUTPUT_ACTIVITY: (current, self.target_start),
+                   CURRENT_ACTIVITY: (current, 0),
+                   MINUS_PHASE_ACTIVITY: (minus, 0),
+                   PLUS_PHASE_ACTIVITY: (plus, 0),
+                   OWNER_VALUE: (previous, 0)}
+        for i, state in enumerate(self.output_states):
+            os_params = builder.gep(transfer_params, [zero, ctx.int32_ty(2), ctx.int32_ty(i)])
+            os_context = builder.gep(transfer_context, [zero, ctx.int32_ty(2), ctx.int32_ty(i)])
+            os_output = builder.gep(arg_out, [zero, ctx.int32_ty(i)])
+
+            os_spec = state._variable_spec
+            if state.name == ACTIVITY_DIFFERENCE_OUTPUT:
+                # The standard function of ACTIVITY_DIFFERENCE_OUTPUT is a lambda
+                os_output = ctx.unwrap_2d_array(builder, os_output)
+                with pnlvm.helpers.array_ptr_loop(builder, os_output, "activity_difference") as (b, j):
+                    diff = b.fsub(b.load(b.gep(plus, [zero, j])), b.load(b.gep(minus, [zero, j])))
+                    b.store(diff, b.gep(os_output, [zero, j]))
+                continue
+            elif isinstance(os_spec, tuple) and os_spec == (OWNER_VALUE, 0):
+                os_spec = OWNER_VALUE
+            elif isinstance(os_spec, str) and os_spec in sources:
+                pass
+            else:
+                raise ContrastiveHebbianError("Unsupported {} specification ({}) of {} for compilation of {}".format(
+                                              repr(VARIABLE), os_spec, state.name, self.name))
+
+            source, start = sources[os_spec]
+            os_function = ctx.get_llvm_function(state)
+            os_input = builder.alloca(os_function.args[2].type.pointee)
+            os_value = ctx.unwrap_2d_array(builder, os_input)
+            source = builder.bitcast(builder.gep(source, [zero, ctx.int32_ty(start)]), os_value.type)
+            builder.store(builder.load(source), os_value)
+            builder.call(os_function, [os_params, os_context, os_input, os_output])
+
+        return builder
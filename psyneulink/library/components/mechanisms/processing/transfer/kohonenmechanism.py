@@ -438,7 +438,9 @@ class KohonenMechanism(TransferMechanism):
         # if output_states is None:
         #     output_states = [RESULT]
 
-        output_states = [RESULT, {NAME: INPUT_PATTERN, VARIABLE: OWNER_VARIABLE}]
+        # INPUT_PATTERN projects to the 1d ACTIVATION_OUTPUT InputState of the KohonenLearningMechanism,
+        # so use the first (and only) item of the Mechanism's variable
+        output_states = [RESULT, {NAME: INPUT_PATTERN, VARIABLE: (OWNER_VARIABLE, 0)}]
         if additional_output_states:
             if isinstance(additional_output_states, list):
                 output_states += additional_output_states
@@ -569,24 +571,33 @@ class KohonenMechanism(TransferMechanism):
                                                               LearningMechanism.className,
                                                               self.name))
 
-        # KDM 10/22/18: should below be aux_components?
+        # Add the LearningMechanism and its Projections to any Composition the KohonenMechanism is added to
+        # (via aux_components attr)
+        self.aux_components.append(learning_mechanism)
 
         # Instantiate Projection from learned_projection's sender to LearningMechanism
-        MappingProjection(sender=self.learned_projection.sender,
-                          receiver=learning_mechanism.input_states[ACTIVATION_INPUT],
-                          matrix=IDENTITY_MATRIX,
-                          name="Error Projection for {}".format(learning_mechanism.name))
+        input_proj = MappingProjection(sender=self.learned_projection.sender,
+                                       receiver=learning_mechanism.input_states[ACTIVATION_INPUT],
+                                       matrix=IDENTITY_MATRIX,
+                                       name="Error Projection for {}".format(learning_mechanism.name))
+        input_proj._activate_for_all_compositions()
+        self.aux_components.append(input_proj)
 
         # Instantiate Projection from learned_projection's receiver (Mechanism's input) to LearningMechanism
-        MappingProjection(sender=self.output_states[INPUT_PATTERN],
-                          receiver=learning_mechanism.input_states[ACTIVATION_OUTPUT],
-                          matrix=IDENTITY_MATRIX,
-                          name="Error Projection for {}".format(learning_mechanism.name))
+        output_proj = MappingProjection(sender=self.output_states[INPUT_PATTERN],
+                                        receiver=learning_mechanism.input_states[ACTIVATION_OUTPUT],
+                                        matrix=IDENTITY_MATRIX,
+                                        name="Error Projection for {}".format(learning_mechanism.name))
+        output_proj._activate_for_all_compositions()
+        self.aux_components.append(output_proj)
 
         # Instantiate Projection from LearningMechanism to learned_projection
-        LearningProjection(sender=learning_mechanism.output_states[LEARNING_SIGNAL],
-                           receiver=self.matrix,
-                           name="{} for {}".format(LearningProjection.className, self.learned_projection.name))
+        learning_proj = LearningProjection(sender=learning_mechanism.output_states[LEARNING_SIGNAL],
+                                           receiver=self.matrix,
+                                           name="{} for {}".format(LearningProjection.className,
+                                                                   self.learned_projection.name))
+        learning_proj._activate_for_all_compositions()
+        self.aux_components.append((learning_proj, True))
 
         return learning_mechanism
 
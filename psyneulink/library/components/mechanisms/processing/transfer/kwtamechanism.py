@@ -175,6 +175,7 @@ from collections import Iterable
 import numpy as np
 import typecheck as tc
 
+from psyneulink.core import llvm as pnlvm
 from psyneulink.core.components.functions.transferfunctions import Logistic
 from psyneulink.core.components.functions.statefulfunctions.integratorfunctions import AdaptiveIntegrator
 from psyneulink.core.globals.keywords import INITIALIZING, KWTA_MECHANISM, K_VALUE, RATIO, RESULT, THRESHOLD
@@ -660,24 +661,27 @@ class KWTAMechanism(RecurrentTransferMechanism):
             k = int_k_value
         # k = self.int_k
 
-        diffs = threshold - current_input[0]
-
-        sorted_diffs = sorted(diffs)
+        diffs = threshold - np.asarray(current_input[0], dtype=float)
 
+        # Only the k smallest diffs need to be separated from the rest, so
+        # partition around the k-th order statistic(s) instead of sorting
         if average_based:
-            top_k_mean = np.mean(sorted_diffs[0:k])
-            other_mean = np.mean(sorted_diffs[k:n])
+            if 0 < k < len(diffs):
+                diffs = np.partition(diffs, k)
+            top_k_mean = np.mean(diffs[0:k])
+            other_mean = np.mean(diffs[k:n])
             final_diff = other_mean * ratio + top_k_mean * (1 - ratio)
         else:
             if k == 0:
-                final_diff = sorted_diffs[k]
-            elif k == len(sorted_diffs):
-                final_diff = sorted_diffs[k - 1]
-            elif k > len(sorted_diffs):
+                final_diff = np.min(diffs)
+            elif k == len(diffs):
+                final_diff = np.max(diffs)
+            elif k > len(diffs):
                 raise KWTAError("k value ({}) is greater than the length of the first input ({}) for KWTAMechanism mechanism {}".
                                 format(k, current_input[0], self.name))
             else:
-                final_diff = sorted_diffs[k] * ratio + sorted_diffs[k-1] * (1 - ratio)
+                partitioned_diffs = np.partition(diffs, (k - 1, k))
+                final_diff = partitioned_diffs[k] * ratio + partitioned_diffs[k - 1] * (1 - ratio)
 
         if inhibition_only and final_diff > 0:
             final_diff = 0
@@ -691,6 +695,94 @@ class KWTAMechanism(RecurrentTransferMechanism):
             new_input.append(current_input[i])
         return np.atleast_2d(new_input)
 
+    def _get_mech_params_type(self, ctx):
+        return ctx.convert_python_struct_to_llvm_ir((self.k_value, self.threshold, self.ratio))
+
+    def _get_mech_params_init(self, execution_id=None):
+        return (self.k_value, self.threshold, self.ratio)
+
+    def _gen_llvm_function_input_parse(self, builder, ctx, func, func_in):
+        func_in, builder = super()._gen_llvm_function_input_parse(builder, ctx, func, func_in)
+
+        # kWTA scaling applies only to the input of the main function
+        if func.name != ctx.get_llvm_function(self.function).name:
+            return func_in, builder
+
+        # Load mechanism parameters; they follow the TransferMechanism part
+        # of the recurrent mechanism param struct
+        params = builder.function.args[0]
+        mech_params = builder.gep(params, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(4)])
+        k_value, threshold, ratio = (pnlvm.helpers.load_extract_scalar_array_one(builder,
+                                         builder.gep(mech_params, [ctx.int32_ty(0), ctx.int32_ty(i)]))
+                                     for i in range(3))
+
+        kwta_in = builder.alloca(func_in.type.pointee, 1)
+        builder.store(builder.load(func_in), kwta_in)
+        current_input = kwta_in
+        if isinstance(current_input.type.pointee.element, pnlvm.ir.ArrayType):
+            current_input = builder.gep(current_input, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        n = current_input.type.pointee.count
+
+        # Convert k_value to the number of winners, as _kwta_scale does
+        is_fraction = builder.and_(builder.fcmp_ordered(">", k_value, k_value.type(0)),
+                                   builder.fcmp_ordered("<", k_value, k_value.type(1)))
+        rint = ctx.get_builtin("rint", [ctx.float_ty])
+        fraction_k = builder.fptosi(builder.call(rint, [builder.fmul(k_value, k_value.type(n))]), ctx.int32_ty)
+        int_k = builder.fptosi(k_value, ctx.int32_ty)
+        is_negative = builder.icmp_signed("<", int_k, int_k.type(0))
+        int_k = builder.select(is_negative, builder.sub(int_k.type(n), int_k), int_k)
+        k = builder.select(is_fraction, fraction_k, int_k)
+        # There is no way to report a k larger than the input, so clamp it
+        k = builder.select(builder.icmp_signed(">", k, k.type(n)), k.type(n), k)
+
+        diffs = builder.alloca(current_input.type.pointee, 1)
+        with pnlvm.helpers.array_ptr_loop(builder, current_input, "kwta_diffs") as (b, i):
+            val = b.load(b.gep(current_input, [ctx.int32_ty(0), i]))
+            b.store(b.fsub(threshold, val), b.gep(diffs, [ctx.int32_ty(0), i]))
+
+        # Partition diffs so that the k smallest are in front
+        k_minus_one = builder.sub(k, k.type(1))
+        nth = builder.select(builder.icmp_signed(">", k, k.type(0)), k_minus_one, k.type(0))
+        lower = pnlvm.helpers.nth_element(builder, diffs, nth)
+
+        if self.get_current_mechanism_param("average_based"):
+            top_sum = builder.alloca(ctx.float_ty)
+            other_sum = builder.alloca(ctx.float_ty)
+            builder.store(ctx.float_ty(0), top_sum)
+            builder.store(ctx.float_ty(0), other_sum)
+            with pnlvm.helpers.array_ptr_loop(builder, diffs, "kwta_sum") as (b, i):
+                val = b.load(b.gep(diffs, [ctx.int32_ty(0), i]))
+                sum_ptr = b.select(b.icmp_signed("<", i, k), top_sum, other_sum)
+                b.store(b.fadd(b.load(sum_ptr), val), sum_ptr)
+            top_k_mean = builder.fdiv(builder.load(top_sum), builder.sitofp(k, ctx.float_ty))
+            other_mean = builder.fdiv(builder.load(other_sum), builder.sitofp(builder.sub(k.type(n), k), ctx.float_ty))
+            final_diff = builder.fadd(builder.fmul(other_mean, ratio),
+                                      builder.fmul(top_k_mean, builder.fsub(ratio.type(1), ratio)))
+        else:
+            # The (k+1)-th smallest diff is the minimum of the ones behind the first k
+            upper_ptr = builder.alloca(ctx.float_ty)
+            builder.store(lower, upper_ptr)
+            with pnlvm.helpers.for_loop(builder, k, k.type(n), k.type(1), "kwta_upper") as (b, i):
+                val = b.load(b.gep(diffs, [ctx.int32_ty(0), i]))
+                upper = b.load(upper_ptr)
+                is_first = b.icmp_signed("==", i, k)
+                is_lower = b.fcmp_ordered("<", val, upper)
+                b.store(b.select(b.or_(is_first, is_lower), val, upper), upper_ptr)
+            upper = builder.load(upper_ptr)
+            mixed = builder.fadd(builder.fmul(upper, ratio), builder.fmul(lower, builder.fsub(ratio.type(1), ratio)))
+            is_edge = builder.or_(builder.icmp_signed("==", k, k.type(0)), builder.icmp_signed("==", k, k.type(n)))
+            final_diff = builder.select(is_edge, lower, mixed)
+
+        if self.get_current_mechanism_param("inhibition_only"):
+            is_positive = builder.fcmp_ordered(">", final_diff, final_diff.type(0))
+            final_diff = builder.select(is_positive, final_diff.type(0), final_diff)
+
+        with pnlvm.helpers.array_ptr_loop(builder, current_input, "kwta_scale") as (b, i):
+            ptr = b.gep(current_input, [ctx.int32_ty(0), i])
+            b.store(b.fadd(b.load(ptr), final_diff), ptr)
+
+        return kwta_in, builder
+
     def _validate_params(self, request_set, target_set=None, context=None):
         """Validate shape and size of matrix.
         """
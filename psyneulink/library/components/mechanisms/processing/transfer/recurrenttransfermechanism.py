@@ -205,7 +205,7 @@ from psyneulink.core.globals.parameters import Parameter
 from psyneulink.core.globals.preferences.componentpreferenceset import is_pref_set
 from psyneulink.core.globals.registry import register_instance, remove_instance_from_registry
 from psyneulink.core.globals.socket import ConnectionInfo
-from psyneulink.core.globals.utilities import is_numeric_or_none, parameter_spec
+from psyneulink.core.globals.utilities import is_numeric_or_none, is_sparse_matrix, parameter_spec
 from psyneulink.core.scheduling.condition import Condition, TimeScale, WhenFinished
 from psyneulink.library.components.mechanisms.adaptive.learning.autoassociativelearningmechanism import AutoAssociativeLearningMechanism
 
@@ -343,6 +343,7 @@ class RecurrentTransferMechanism(TransferMechanism):
     convergence_function=Distance(metric=MAX_ABS_DIFF), \
     convergence_criterion=None,                         \
     max_passes=None,                                    \
+    execute_until_converged=False,                      \
     enable_learning=False,                              \
     learning_rate=None,                                 \
     learning_function=Hebbian,                          \
@@ -385,7 +386,7 @@ class RecurrentTransferMechanism(TransferMechanism):
 
     matrix : list, np.ndarray, np.matrix, matrix keyword, or AutoAssociativeProjection : default HOLLOW_MATRIX
         specifies the matrix to use for creating a `recurrent AutoAssociativeProjection <Recurrent_Transfer_Structure>`,
-        or an AutoAssociativeProjection to use.
+        or an AutoAssociativeProjection to use (sparse matrices are not supported).
 
         - If **auto** and **matrix** are both specified, the diagonal terms are determined by auto and the off-diagonal
           terms are determined by matrix.
@@ -516,6 +517,12 @@ class RecurrentTransferMechanism(TransferMechanism):
         the `convergence_criterion <RecurrentTransferMechanism.convergence_criterion>`, after which an error occurs;
         if `None` is specified, execution may continue indefinitely or until an interpreter exception is generated.
 
+    execute_until_converged : bool : default False
+        specifies whether, in compiled execution, the Mechanism executes repeatedly within a single call until its
+        `convergence_criterion <RecurrentTransferMechanism.convergence_criterion>` or `max_passes
+        <RecurrentTransferMechanism.max_passes>` is reached (see `execute_until_converged
+        <RecurrentTransferMechanism.execute_until_converged>`).
+
     enable_learning : boolean : default False
         specifies whether the Mechanism should be configured for learning;  if it is not (the default), then learning
         cannot be enabled until it is configured for learning by calling the Mechanism's `configure_learning
@@ -726,6 +733,15 @@ class RecurrentTransferMechanism(TransferMechanism):
         the `convergence_criterion <RecurrentTransferMechanism.convergence_criterion>`, after which an error occurs;
         if `None` is specified, execution may continue indefinitely or until an interpreter exception is generated.
 
+    execute_until_converged : bool
+        determines whether, in compiled execution, the Mechanism is executed repeatedly within a single call (i.e.,
+        without returning to the `Scheduler`), each time receiving its own previous output through its
+        `recurrent_projection <RecurrentTransferMechanism.recurrent_projection>`, until `delta
+        <RecurrentTransferMechanism.delta>` is less than or equal to `convergence_criterion
+        <RecurrentTransferMechanism.convergence_criterion>` or the number of executions reaches `max_passes
+        <RecurrentTransferMechanism.max_passes>` (see `execute_until_converged <TransferMechanism.execute_until_converged>`
+        for details).
+
     learning_enabled : bool : default False
         indicates whether learning has been enabled for the RecurrentTransferMechanism.  It is set to `True` if
         `learning is specified <Recurrent_Transfer_Learning>` at the time of construction (i.e., if the
@@ -930,6 +946,7 @@ class RecurrentTransferMechanism(TransferMechanism):
                  convergence_function:tc.any(is_function_type)=Distance(metric=MAX_ABS_DIFF),
                  convergence_criterion:float=0.01,
                  max_passes:tc.optional(int)=1000,
+                 execute_until_converged:bool=False,
                  enable_learning:bool=False,
                  learning_rate:tc.optional(tc.any(parameter_spec, bool))=None,
                  learning_function: tc.any(is_function_type) = Hebbian,
@@ -957,6 +974,11 @@ class RecurrentTransferMechanism(TransferMechanism):
         if isinstance(hetero, (list, np.matrix)):
             hetero = np.array(hetero)
 
+        # The recurrent matrix is combined with auto and hetero, and learned, as a dense matrix
+        if is_sparse_matrix(matrix):
+            raise RecurrentTransferError("A sparse matrix was specified for {}; sparse matrices are not supported "
+                                         "for the recurrent projection".format(name or self.__class__.__name__))
+
         self._learning_enabled = enable_learning
 
         # Assign args to params and functionParams dicts
@@ -1010,6 +1032,7 @@ class RecurrentTransferMechanism(TransferMechanism):
                          convergence_function=convergence_function,
                          convergence_criterion=convergence_criterion,
                          max_passes=max_passes,
+                         execute_until_converged=execute_until_converged,
                          output_states=output_states,
                          params=params,
                          name=name,
@@ -1601,7 +1624,12 @@ class RecurrentTransferMechanism(TransferMechanism):
         retval_init = (tuple(os.defaults.value) if not np.isscalar(os.defaults.value) else os.defaults.value for os in self.output_states)
         return tuple((transfer_init, projection_init, tuple(retval_init)))
 
-    def _gen_llvm_function_body(self, ctx, builder, params, context, arg_in, arg_out):
+    def _gen_llvm_transfer_structs(self, ctx, builder, params, context):
+        transfer_params = builder.gep(params, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        transfer_context = builder.gep(context, [ctx.int32_ty(0), ctx.int32_ty(0)])
+        return transfer_params, transfer_context
+
+    def _gen_llvm_execute_pass(self, ctx, builder, params, context, arg_in, arg_out):
         real_input_type = super()._get_input_struct_type(ctx)
         real_in = builder.alloca(real_input_type, 1)
         old_val = builder.gep(context, [ctx.int32_ty(0), ctx.int32_ty(2)])
@@ -1640,9 +1668,8 @@ class RecurrentTransferMechanism(TransferMechanism):
             ps_current_input = builder.gep(arg_in, [ctx.int32_ty(0), ctx.int32_ty(idx)])
             builder.store(builder.load(ps_current_input), ps_real_input)
 
-        transfer_context = builder.gep(context, [ctx.int32_ty(0), ctx.int32_ty(0)])
-        transfer_params = builder.gep(params, [ctx.int32_ty(0), ctx.int32_ty(0)])
-        builder = super()._gen_llvm_function_body(ctx, builder, transfer_params, transfer_context, real_in, arg_out)
+        transfer_params, transfer_context = self._gen_llvm_transfer_structs(ctx, builder, params, context)
+        builder = super()._gen_llvm_execute_pass(ctx, builder, transfer_params, transfer_context, real_in, arg_out)
 
         builder.store(builder.load(arg_out), old_val)
 
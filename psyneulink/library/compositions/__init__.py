@@ -1,23 +1,25 @@
 __all__ = []
 
-try:
-    import torch
-    del torch
+from psyneulink.core.globals.utilities import lazy_attributes, lazy_import
 
+# torch is imported lazily, only when an AutodiffComposition is first used;
+# pytorchmodelcreator (which subclasses torch.nn.Module) is imported by autodiffcomposition when needed,
+# or when PytorchModelCreator is first accessed (it is not in __all__, so that star imports don't import torch)
+_lazy_exports = {}
+if lazy_import('torch') is not None:
     from . import autodiffcomposition
-    from . import pytorchmodelcreator
-    from . import regressioncfa
     from . import regressioncfa
 
     from .autodiffcomposition import *
-    from .pytorchmodelcreator import *
     from .regressioncfa import *
 
     __all__ = list(autodiffcomposition.__all__)
-    __all__.extend(pytorchmodelcreator.__all__)
     __all__.extend(regressioncfa.__all__)
 
-except ImportError:
+    _lazy_exports['PytorchModelCreator'] = 'psyneulink.library.compositions.pytorchmodelcreator'
+    lazy_attributes(__name__, _lazy_exports)
+
+else:
     from . import regressioncfa
     from .regressioncfa import *
     __all__.extend(regressioncfa.__all__)
@@ -92,6 +92,23 @@ run, but if **randomize** is True then the order in which inputs are within an e
 **refresh_losses** specifies whether the `losses` attribute is refreshed for each call to `run()`. If False, the losses
 of each run are appended to the `losses` attribute. If True, the losses of each run overwrite `losses` instead.
 
+**sync_policy** specifies how often the weights and outputs of the PyTorch representation are copied back to the
+corresponding `MappingProjection` matrices and Mechanism values in PsyNeuLink during training. It can be 'per_step'
+(after every training example, which is the most expensive), 'per_epoch' (the default; after the last example of each
+epoch) or 'on_demand' (only when `synchronize_with_psyneulink <AutodiffComposition.synchronize_with_psyneulink>` or
+`get_parameters <AutodiffComposition.get_parameters>` is called). Copying is only needed by PsyNeuLink-side code that
+reads the projection matrices or Mechanism values during training, so the less frequent policies can substantially
+reduce the cost of each training step.
+
+**trace_forward** defaults to False. If True, the forward computation of the PyTorch representation is traced into a
+`TorchScript <https://pytorch.org/docs/stable/jit.html>`_ module the first time it is executed, so that later
+executions (both training and processing) run without interpreting the processing graph in Python. This is most useful
+for deep, narrow networks. If the model cannot be traced, a warning is issued and the untraced computation is used.
+
+**precision** specifies the floating point precision of the PyTorch representation, either 'float64' or 'float32'. If it
+is not specified, the precision used for compiled execution is used (see ``PNL_LLVM_PRECISION``), which is 'float64' by
+default. Single precision halves the memory used by weights and activations, and is usually considerably faster.
+
 **force_no_retain_graph** defaults to False. If True, the AutodiffComposition does not use the `retain_graph` option
 when computing PyTorch gradient. This can reduce memory usage. However, it breaks recurrent networks, so it should only
 be used when the network is not recurrent.
@@ -138,8 +155,14 @@ format is different. If `learning_enabled <AutodiffComposition.learning_enabled>
 dictionary with required keys "inputs" and "targets", and optional key "epochs". The value at "inputs" should be a
 dictionary relating origin mechanisms to their inputs. The value at "targets" should be a dictionary relating terminal
 mechanisms to their inputs. The value at "epochs" is an integer stating the number of epochs of training (i.e. how many
-times all inputs and targets are run). It defaults to 1. Here is an example of creating a simple AutodiffComposition
-and specifying inputs and targets:
+times all inputs and targets are run). It defaults to 1. The optional key "validation" can hold a held-out validation
+set, as a dictionary with keys "inputs" and "targets" in the same format as above. After each epoch of training the
+model is evaluated on the validation set (without learning, and for all validation inputs at once unless the model is
+recurrent), its average loss is appended to `validation_losses <AutodiffComposition.validation_losses>` on the same
+scale as the training `losses <AutodiffComposition.losses>`, and, if **patience** is specified, this validation loss
+rather than the training loss is used to decide when to stop training early.
+
+Here is an example of creating a simple AutodiffComposition and specifying inputs and targets:
 
     >>> import psyneulink as pnl
     >>> # set up PsyNeuLink Components
@@ -236,7 +259,9 @@ from psyneulink.core.compositions.composition import Composition
 from psyneulink.core.compositions.composition import CompositionError
 from psyneulink.core.globals.context import ContextFlags
 from psyneulink.core.globals.keywords import SOFT_CLAMP
+from psyneulink.core.globals.utilities import lazy_import
 from psyneulink.core.scheduling.scheduler import Scheduler
+from psyneulink.core import llvm as pnlvm
 
 import numpy as np
 import copy
@@ -245,14 +270,12 @@ from collections import Iterable
 from toposort import toposort
 
 import logging
-try:
-    import torch
-    from torch import nn
-    import torch.optim as optim
-    from psyneulink.library.compositions.pytorchmodelcreator import PytorchModelCreator
-    torch_available = True
-except ImportError:
-    torch_available = False
+# torch is only imported when it is first used (e.g., when an AutodiffComposition is created)
+torch = lazy_import('torch')
+torch_available = torch is not None
+
+# floating point types of the pytorch representation, by precision;  each is the name of the torch dtype
+TORCH_PRECISIONS = ('float64', 'float32')
 
 logger = logging.getLogger(__name__)
 
@@ -261,6 +284,12 @@ __all__ = [
     'AutodiffComposition', 'AutodiffCompositionError'
 ]
 
+# policies for copying weights and outputs from the pytorch representation back to psyneulink during training
+PER_STEP = 'per_step'
+PER_EPOCH = 'per_epoch'
+ON_DEMAND = 'on_demand'
+SYNC_POLICIES = (PER_STEP, PER_EPOCH, ON_DEMAND)
+
 
 class AutodiffCompositionError(CompositionError):
 
@@ -283,6 +312,10 @@ class AutodiffComposition(Composition):
     loss_spec=None,                 \
     randomize=False,                \
     refresh_losses=False,           \
+    sync_policy='per_epoch',        \
+    trace_forward=False,            \
+    precision=None,                 \
+    lazy_outputs=False,             \
     name="autodiff_composition")
 
     Subclass of `Composition` that trains models more quickly by integrating with PyTorch.
@@ -330,6 +363,23 @@ class AutodiffComposition(Composition):
         specifies whether the `losses` attribute is refreshed for each call to `run()`. If False, the losses of each run
         are appended to the `losses` attribute. If True, the losses of each run overwrite `losses` instead.
 
+    sync_policy : str : default 'per_epoch'
+        specifies when weights and outputs of the PyTorch representation are copied back to PsyNeuLink during
+        training. The current options are 'per_step', 'per_epoch' and 'on_demand' (see `sync_policy
+        <AutodiffComposition.sync_policy>`).
+
+    trace_forward : boolean : default False
+        specifies whether the forward computation of the PyTorch representation is traced into a TorchScript module
+        the first time it is executed.
+
+    precision : str : default None
+        specifies the floating point precision of the PyTorch representation ('float64' or 'float32'). If it is None,
+        the precision used for compiled execution is used.
+
+    lazy_outputs : boolean : default False
+        specifies whether outputs are collected on every training epoch when early stopping is enabled (see
+        `lazy_outputs <AutodiffComposition.lazy_outputs>`).
+
     Attributes
     ----------
 
@@ -339,6 +389,10 @@ class AutodiffComposition(Composition):
     losses : list of floats
         tracks the average loss for each training epoch
 
+    validation_losses : list of floats
+        tracks the average loss on the validation set (if one was given) after each training epoch, computed in the
+        same way as `losses <AutodiffComposition.losses>`
+
     patience : int or None : default None
         allows the model to stop training early, if training stops reducing loss. The model tracks how many
         consecutive epochs of training have failed to reduce the model's loss. When this number exceeds **patience**,
@@ -363,6 +417,20 @@ class AutodiffComposition(Composition):
     loss : PyTorch loss function
         the loss function used for training. Depends on the **loss_spec** argument from initialization.
 
+    lazy_outputs : boolean
+        if False, and **patience** is specified, the outputs of every training trial are saved on every epoch, so that
+        the outputs from the epoch in which training stops early can be returned. If True, outputs are not saved during
+        training; instead, once training has stopped, they are computed for all inputs (in their original order) by
+        executing the trained model without learning. This avoids the cost of copying outputs on every trial of every
+        epoch. Without early stopping, outputs are only saved on the last epoch regardless of this attribute.
+
+    sync_policy : str
+        determines when the weights and outputs of the PyTorch representation are copied back to the `MappingProjection`
+        matrices and Mechanism values in PsyNeuLink during training: after every training example ('per_step'), after
+        the last example of each epoch ('per_epoch'), or only when `synchronize_with_psyneulink
+        <AutodiffComposition.synchronize_with_psyneulink>` or `get_parameters <AutodiffComposition.get_parameters>` is
+        called ('on_demand').
+
     name : str : default LeabraMechanism-<index>
         the name of the Mechanism.
         Specified in the **name** argument of the constructor for the Projection;
@@ -403,6 +471,12 @@ class AutodiffComposition(Composition):
                     :default value: None
                     :type:
 
+                validation_losses
+                    see `validation_losses <AutodiffComposition.validation_losses>`
+
+                    :default value: None
+                    :type:
+
                 patience
                     see `patience <AutodiffComposition.patience>`
 
@@ -419,6 +493,7 @@ class AutodiffComposition(Composition):
         optimizer = None
         learning_rate = .001
         losses = None
+        validation_losses = None
         patience = None
         min_delta = 0
         pytorch_representation = None
@@ -438,6 +513,10 @@ class AutodiffComposition(Composition):
                  disable_cuda=False,
                  cuda_index=None,
                  force_no_retain_graph=False,
+                 sync_policy=PER_EPOCH,
+                 trace_forward=False,
+                 precision=None,
+                 lazy_outputs=False,
                  name="autodiff_composition"):
 
         self.learning_enabled = True
@@ -465,6 +544,20 @@ class AutodiffComposition(Composition):
         self.loss = None
         self.force_no_retain_graph = force_no_retain_graph
 
+        if sync_policy not in SYNC_POLICIES:
+            raise AutodiffCompositionError("Invalid sync_policy specified ({}). Sync policy must be one of {}."
+                                           .format(sync_policy, ', '.join(repr(p) for p in SYNC_POLICIES)))
+        self.sync_policy = sync_policy
+        self.lazy_outputs = lazy_outputs
+        self.trace_forward = trace_forward
+
+        if precision is None:
+            precision = pnlvm.float_precision
+        if precision not in TORCH_PRECISIONS:
+            raise AutodiffCompositionError("Invalid precision specified ({}). Precision must be one of {}."
+                                           .format(precision, ', '.join(repr(p) for p in TORCH_PRECISIONS)))
+        self.precision = precision
+
         # user indication of how to initialize pytorch parameters
         self.param_init_from_pnl = param_init_from_pnl
 
@@ -497,11 +590,15 @@ class AutodiffComposition(Composition):
         if self.execution_sets is None:
             self.execution_sets = list(self.scheduler.run())
         if self.parameters.pytorch_representation.get(execution_id) is None:
+            # PytorchModelCreator subclasses torch.nn.Module, so its module is only imported here
+            from psyneulink.library.compositions.pytorchmodelcreator import PytorchModelCreator
             model = PytorchModelCreator(self.graph_processing,
                                         self.param_init_from_pnl,
                                         self.execution_sets,
                                         self.device,
-                                        execution_id)
+                                        execution_id,
+                                        trace_forward=self.trace_forward,
+                                        dtype=getattr(torch, self.precision))
             self.parameters.pytorch_representation.set(model, execution_id)
 
         # Set up optimizer function
@@ -527,25 +624,25 @@ class AutodiffComposition(Composition):
                                            "optimizers (specified as 'sgd' or 'adam').")
         params = self.parameters.pytorch_representation.get(execution_id).parameters()
         if optimizer_type == 'sgd':
-            return optim.SGD(params, lr=learning_rate, weight_decay=weight_decay)
+            return torch.optim.SGD(params, lr=learning_rate, weight_decay=weight_decay)
         else:
-            return optim.Adam(params, lr=learning_rate, weight_decay=weight_decay)
+            return torch.optim.Adam(params, lr=learning_rate, weight_decay=weight_decay)
 
     def _get_loss(self, loss_spec):
         if not isinstance(self.loss_spec, str):
             return self.loss_spec
         elif loss_spec == 'mse':
-            return nn.MSELoss(reduction='sum')
+            return torch.nn.MSELoss(reduction='sum')
         elif loss_spec == 'crossentropy':
-            return nn.CrossEntropyLoss(reduction='sum')
+            return torch.nn.CrossEntropyLoss(reduction='sum')
         elif loss_spec == 'l1':
-            return nn.L1Loss(reduction='sum')
+            return torch.nn.L1Loss(reduction='sum')
         elif loss_spec == 'nll':
-            return nn.NLLLoss(reduction='sum')
+            return torch.nn.NLLLoss(reduction='sum')
         elif loss_spec == 'poissonnll':
-            return nn.PoissonNLLLoss(reduction='sum')
+            return torch.nn.PoissonNLLLoss(reduction='sum')
         elif loss_spec == 'kldiv':
-            return nn.KLDivLoss(reduction='sum')
+            return torch.nn.KLDivLoss(reduction='sum')
         else:
             raise AutodiffCompositionError("Loss type {} not recognized. Loss argument must be a string or function. "
                                            "Currently, the recognized loss types are Mean Squared Error, Cross Entropy,"
@@ -584,8 +681,57 @@ class AutodiffComposition(Composition):
 
         return outputs
 
+    # converts a dict mapping nodes to their per-trial values into a dict mapping nodes to a single contiguous
+    # tensor on the device, whose first dimension indexes trials. If the values for a node do not all have the same
+    # shape, they are converted to a list of per-trial tensors instead.
+    def _preload_tensors(self, stimuli):
+        tensor_stimuli = {}
+        for component, values in stimuli.items():
+            try:
+                values = np.asarray(values, dtype=self.precision)
+            except ValueError:
+                dtype = getattr(torch, self.precision)
+                tensor_stimuli[component] = [torch.tensor(v, device=self.device, dtype=dtype) for v in values]
+            else:
+                tensor_stimuli[component] = torch.from_numpy(np.ascontiguousarray(values)).to(self.device)
+        return tensor_stimuli
+
+    # returns the outputs of the model for every trial of a set of preloaded inputs, without tracking gradients, in
+    # the same format as the outputs returned by autodiff_training (a list with, for each trial, a list of the values
+    # of the nodes that project to the output CIM)
+    def _evaluate_outputs(self, tensor_inputs, num_inputs, execution_id=None):
+        batch_outputs = self._evaluate_batch(tensor_inputs, num_inputs, execution_id)
+        output_values = [batch_outputs[component].detach().numpy() for component in self._get_output_components()]
+        return [[value[t].copy() for value in output_values] for t in range(num_inputs)]
+
+    # performs forward computation without gradients for all trials of a set of preloaded inputs, and returns
+    # a dict mapping nodes in the last execution set to tensors whose first dimension indexes trials
+    def _evaluate_batch(self, tensor_inputs, num_inputs, execution_id=None):
+        pytorch_representation = self.parameters.pytorch_representation.get(execution_id)
+        return pytorch_representation.evaluate(tensor_inputs, num_inputs)
+
+    # returns the loss of the model on a set of preloaded inputs and targets, without gradients, on the same scale as
+    # the training losses: the loss summed over output nodes and divided by out_size on each trial, averaged over trials
+    def _evaluate_loss(self, tensor_inputs, tensor_targets, num_inputs, out_size, execution_id=None):
+        batch_outputs = self._evaluate_batch(tensor_inputs, num_inputs, execution_id)
+        trial_losses = np.zeros(num_inputs)
+        with torch.no_grad():
+            for t in range(num_inputs):
+                for component, outputs in batch_outputs.items():
+                    trial_losses[t] += self.loss(outputs[t], tensor_targets[component][t]).item()
+        return np.mean(trial_losses / out_size)
+
+    # returns the nodes that project to the output CIM, in the order of its input states
+    def _get_output_components(self):
+        output_components = []
+        for input_state in self.output_CIM.input_states:
+            assert(len(input_state.all_afferents) == 1)  # CW 12/05/18, this assert may eventually be outdated
+            output_components.append(input_state.all_afferents[0].sender.owner)
+        return output_components
+
     # performs learning/training on all input-target pairs it recieves for given number of epochs
-    def autodiff_training(self, inputs, targets, epochs, execution_id=None, do_logging=False):
+    def autodiff_training(self, inputs, targets, epochs, execution_id=None, do_logging=False,
+                          validation_inputs=None, validation_targets=None):
 
         # FIX CW 11/1/18: this value of num_inputs assumes all inputs have same length, and that the length of
         # the input for an origin component equals the number of desired trials. We could clean this up
@@ -603,12 +749,29 @@ class AutodiffComposition(Composition):
         if self.randomize:
             rand_train_order_reverse = np.zeros(num_inputs)
 
+        # convert inputs and targets to tensors on the device once, rather than on every trial of every epoch
+        tensor_inputs = self._preload_tensors(inputs)
+        tensor_targets = self._preload_tensors(targets)
+
+        validating = validation_inputs is not None
+        if validating:
+            num_validation_inputs = len(list(validation_inputs.values())[0])
+            tensor_validation_inputs = self._preload_tensors(validation_inputs)
+            tensor_validation_targets = self._preload_tensors(validation_targets)
+
         # get total number of output neurons from the dimensionality of targets on the first trial
         # (this is for computing average loss across neurons on each trial later)
         out_size = 0
         for target in targets.values():
             out_size += len(target)
 
+        output_components = self._get_output_components()
+
+        # outputs are only needed from the epoch in which training ends. Without early stopping that is the last
+        # epoch. With early stopping, outputs are collected on every epoch unless lazy_outputs is set, in which
+        # case they are computed after training has stopped
+        collect_every_epoch = patience is not None and not self.lazy_outputs
+
         # iterate over epochs
         for epoch in range(epochs):
 
@@ -623,6 +786,7 @@ class AutodiffComposition(Composition):
 
             # reset temporary list to keep track of most recent outputs
             outputs = []
+            collect_outputs = collect_every_epoch or (patience is None and epoch == epochs - 1)
 
             self.parameters.pytorch_representation.get(execution_id).detach_all()
             # self.parameters.pytorch_representation.get(execution_id).reset_all()
@@ -631,27 +795,26 @@ class AutodiffComposition(Composition):
             for t in range(num_inputs):
 
                 if self.randomize:
-                    input_index = rand_train_order[t]
+                    input_index = int(rand_train_order[t])
                 else:
                     input_index = t
                 curr_tensor_inputs = {}
                 curr_tensor_targets = {}
-                for component in inputs.keys():
-                    input = inputs[component][input_index]
-                    curr_tensor_inputs[component] = torch.tensor(input, device=self.device).double()
-                for component in targets.keys():
-                    target = targets[component][input_index]
-                    curr_tensor_targets[component] = torch.tensor(target, device=self.device).double()
+                for component in tensor_inputs.keys():
+                    curr_tensor_inputs[component] = tensor_inputs[component][input_index]
+                for component in tensor_targets.keys():
+                    curr_tensor_targets[component] = tensor_targets[component][input_index]
 
                 # do forward computation on current inputs
                 curr_tensor_outputs = self.parameters.pytorch_representation.get(execution_id).forward(
                     curr_tensor_inputs,
                     execution_id,
-                    do_logging
+                    do_logging,
+                    copy_outputs=self.sync_policy == PER_STEP
                 )
 
                 # compute total loss across output neurons for current trial
-                curr_loss = torch.zeros(1).double()
+                curr_loss = torch.zeros(1, device=self.device, dtype=getattr(torch, self.precision))
                 for component in curr_tensor_outputs.keys():
                     # possibly add custom loss option, which is a loss function that takes many args
                     # (outputs, targets, weights, and more) and returns a scalar
@@ -669,35 +832,44 @@ class AutodiffComposition(Composition):
                     curr_loss.backward(retain_graph=False)
                 else:
                     curr_loss.backward(retain_graph=True)
-                self.parameters.pytorch_representation.get(execution_id).copy_weights_to_psyneulink(execution_id)
                 optimizer.step()
+                if self.sync_policy == PER_STEP:
+                    self.parameters.pytorch_representation.get(execution_id).copy_weights_to_psyneulink(execution_id)
 
-                # save outputs of model if this is final epoch
-                curr_output_list = []
-                for input_state in self.output_CIM.input_states:
-                    assert(len(input_state.all_afferents) == 1)  # CW 12/05/18, this assert may eventually be outdated
-                    component = input_state.all_afferents[0].sender.owner
-                    curr_output_list.append(curr_tensor_outputs[component].detach().numpy().copy())
-                # for component in curr_tensor_outputs.keys():
-                #     curr_output_list.append(curr_tensor_outputs[component].detach().numpy().copy())
-                outputs.append(curr_output_list)
+                # save outputs of model if this is (or might be) the final epoch
+                if collect_outputs:
+                    curr_output_list = []
+                    for component in output_components:
+                        curr_output_list.append(curr_tensor_outputs[component].detach().numpy().copy())
+                    outputs.append(curr_output_list)
+
+            if self.sync_policy == PER_EPOCH:
+                self.synchronize_with_psyneulink(execution_id)
 
             # save average loss on the current epoch
             average_loss = np.mean(curr_losses)
             self.parameters.losses.get(execution_id).append(average_loss)
 
-            # update early stopper with most recent average loss
-            if self.parameters.patience.get(execution_id) is not None:
-                should_stop = early_stopper.step(average_loss)
+            # evaluate the model on the validation set, if one was given
+            if validating:
+                validation_loss = self._evaluate_loss(tensor_validation_inputs,
+                                                      tensor_validation_targets,
+                                                      num_validation_inputs,
+                                                      out_size,
+                                                      execution_id)
+                self.parameters.validation_losses.get(execution_id).append(validation_loss)
+
+            # update early stopper with most recent average loss (on the validation set, if one was given)
+            if patience is not None:
+                should_stop = early_stopper.step(validation_loss if validating else average_loss)
                 if should_stop:
                     logger.warning('Stopped training early after {} epochs'.format(epoch))
-                    if self.randomize:
-                        outputs_list = [None] * len(outputs)
-                        for i in range(len(outputs)):
-                            outputs_list[i] = outputs[int(rand_train_order_reverse[i])]
-                        return outputs_list
-                    else:
-                        return outputs
+                    break
+
+        if not outputs:
+            # outputs were not collected during the final epoch, so compute them with the trained model (they are
+            # already in the original order of the inputs)
+            return self._evaluate_outputs(tensor_inputs, num_inputs, execution_id)
 
         if self.randomize:  # save outputs in a list in correct order, return them
             outputs_list = [None] * len(outputs)
@@ -736,13 +908,30 @@ class AutodiffComposition(Composition):
 
             self._build_pytorch_representation(execution_id)
 
+            # training bypasses Composition.execute, so the early stopping parameters must be copied to this
+            # execution_id here (otherwise, values given at construction would never be used for training)
+            for param in (self.parameters.patience, self.parameters.min_delta):
+                param._initialize_from_context(execution_id, base_execution_id, override=False)
+
             autodiff_inputs = inputs["inputs"]
             autodiff_targets = inputs["targets"]
             autodiff_epochs = 1
             if "epochs" in inputs:
                 autodiff_epochs = inputs["epochs"]
 
-            output = self.autodiff_training(autodiff_inputs, autodiff_targets, autodiff_epochs, execution_id, do_logging)
+            validation_inputs = None
+            validation_targets = None
+            if "validation" in inputs:
+                validation_inputs = inputs["validation"]["inputs"]
+                validation_targets = inputs["validation"]["targets"]
+
+            output = self.autodiff_training(autodiff_inputs,
+                                            autodiff_targets,
+                                            autodiff_epochs,
+                                            execution_id,
+                                            do_logging,
+                                            validation_inputs=validation_inputs,
+                                            validation_targets=validation_targets)
             ctx = self.output_CIM.parameters.context.get(execution_id)
             # new_ctx = copy.deepcopy(ctx)
             # new_ctx.execution_phase = ContextFlags.PROCESSING
@@ -801,6 +990,8 @@ class AutodiffComposition(Composition):
 
             if self.refresh_losses or (self.parameters.losses.get(execution_id) is None):
                 self.parameters.losses.set([], execution_id)
+            if self.refresh_losses or (self.parameters.validation_losses.get(execution_id) is None):
+                self.parameters.validation_losses.set([], execution_id)
             adjusted_stimuli = self._adjust_stimulus_dict(inputs)
             if num_trials is None:
                 num_trials = len(adjusted_stimuli)
@@ -899,6 +1090,21 @@ class AutodiffComposition(Composition):
                 raise AutodiffCompositionError("Targets specified for {0}, but {0} has no trainable parameters."
                                                .format(self.name))
 
+    # copies the current weights and outputs of the pytorch representation back to psyneulink
+    def synchronize_with_psyneulink(self, execution_id=NotImplemented):
+        if execution_id is NotImplemented:
+            execution_id = self.default_execution_id
+
+        pytorch_representation = self.parameters.pytorch_representation.get(execution_id)
+
+        if pytorch_representation is None:
+            raise AutodiffCompositionError("{0} has not been run yet so parameters have not been created "
+                                           "in Pytorch."
+                                           .format(self.name))
+
+        pytorch_representation.copy_weights_to_psyneulink(execution_id)
+        pytorch_representation.copy_outputs_to_psyneulink(pytorch_representation.get_current_outputs(), execution_id)
+
     # gives user weights and biases of the model (from the pytorch representation)
     def get_parameters(self, execution_id=NotImplemented):
         if execution_id is NotImplemented:
@@ -911,6 +1117,9 @@ class AutodiffComposition(Composition):
                                            "in Pytorch."
                                            .format(self.name))
 
+        if self.sync_policy == ON_DEMAND:
+            self.synchronize_with_psyneulink(execution_id)
+
         weights = pytorch_representation.get_weights_for_projections()
         biases = pytorch_representation.get_biases_for_mechanisms()
 
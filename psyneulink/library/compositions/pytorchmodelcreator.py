@@ -8,8 +8,11 @@ try:
 except ImportError:
     torch_available = False
 
+import logging
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 __all__ = ['PytorchModelCreator']
 # Class that is called to create pytorch representations of autodiff compositions based on their processing graphs.
 # Called to do so when the composition is run for the first time.
@@ -23,7 +26,8 @@ __all__ = ['PytorchModelCreator']
 class PytorchModelCreator(torch.nn.Module):
 
     # sets up parameters of model & the information required for forward computation
-    def __init__(self, processing_graph, param_init_from_pnl, execution_sets, device, execution_id=None):
+    def __init__(self, processing_graph, param_init_from_pnl, execution_sets, device, execution_id=None,
+                 trace_forward=False, dtype=None):
 
         if not torch_available:
             raise Exception('Pytorch python module (torch) is not installed. Please install it with '
@@ -37,6 +41,7 @@ class PytorchModelCreator(torch.nn.Module):
         self.mechanisms_to_pytorch_biases = {}  # dict mapping PNL mechanisms to Pytorch biases
         self.params = nn.ParameterList()  # list that Pytorch optimizers will use to keep track of parameters
         self.device = device
+        self.dtype = dtype if dtype is not None else torch.float64  # floating point type of all tensors
 
         for i in range(len(self.execution_sets)):
             for component in self.execution_sets[i]:
@@ -48,12 +53,12 @@ class PytorchModelCreator(torch.nn.Module):
 
                 if param_init_from_pnl:
                     if component.parameters.value.get(execution_id) is None:
-                        value = torch.tensor(component.parameters.value.get(None)[0])
+                        value = torch.tensor(component.parameters.value.get(None)[0], dtype=self.dtype)
                     else:
-                        value = torch.tensor(component.parameters.value.get(execution_id)[0])
+                        value = torch.tensor(component.parameters.value.get(execution_id)[0], dtype=self.dtype)
                 else:
                     input_length = len(component.input_states[0].parameters.value.get(None))
-                    value = torch.zeros(input_length, device=self.device).double()
+                    value = torch.zeros(input_length, device=self.device, dtype=self.dtype)
 
                 # if `node` is not an origin node (origin nodes don't have biases or afferent connections)
                 if i != 0:
@@ -61,7 +66,7 @@ class PytorchModelCreator(torch.nn.Module):
                     # if not copying parameters from psyneulink, set up pytorch biases for node
                     if not param_init_from_pnl:
                         input_length = len(component.input_states[0].parameters.value.get(None))
-                        biases = nn.Parameter(torch.zeros(input_length, device=self.device).double())
+                        biases = nn.Parameter(torch.zeros(input_length, device=self.device, dtype=self.dtype))
                         self.params.append(biases)
                         self.mechanisms_to_pytorch_biases[component] = biases
 
@@ -81,9 +86,11 @@ class PytorchModelCreator(torch.nn.Module):
                         # set up pytorch weights that correspond to projection. If copying params from psyneulink,
                         # copy weight values from projection. Otherwise, use random values.
                         if param_init_from_pnl:
-                            weights = nn.Parameter(torch.tensor(proj_matrix.copy(), device=self.device).double())
+                            weights = nn.Parameter(torch.tensor(proj_matrix.copy(), device=self.device,
+                                                                dtype=self.dtype))
                         else:
-                            weights = nn.Parameter(torch.rand(np.shape(proj_matrix), device=self.device).double())
+                            weights = nn.Parameter(torch.rand(np.shape(proj_matrix), device=self.device,
+                                                              dtype=self.dtype))
                         afferents[input_node] = weights
                         self.params.append(weights)
                         self.projections_to_pytorch_weights[mapping_proj] = weights
@@ -97,58 +104,90 @@ class PytorchModelCreator(torch.nn.Module):
         # every time the weights are updated
         self.copy_weights_to_psyneulink(execution_id)
 
+        # flatten the execution sets into a fixed sequence of steps, so that forward does not have to interpret
+        # the processing graph on every call
+        self.forward_graph = ForwardGraph(self.execution_sets, self.component_to_forward_info, self.device, self.dtype)
+        self.trace_forward = trace_forward
+        self.traced_forward_graph = None
+
     # performs forward computation for the model
-    def forward(self, inputs, execution_id=None, do_logging=True):
+    def forward(self, inputs, execution_id=None, do_logging=True, copy_outputs=True):
 
         outputs = {}  # dict for storing values of terminal (output) nodes
 
-        for i in range(len(self.execution_sets)):
-            current_exec_set = self.execution_sets[i]
-            frozen_values = {}
-            for component in current_exec_set:
-                frozen_values[component] = self.component_to_forward_info[component][0]
-            for component in current_exec_set:
-
-                # get forward computation info for current component
-                biases = self.component_to_forward_info[component][1]
-                function = self.component_to_forward_info[component][2]
-                afferents = self.component_to_forward_info[component][3]
-
-                # forward computation if we have origin node
-                if i == 0:
-                    value = function(inputs[component])
+        graph_inputs = [inputs[component] for component in self.forward_graph.origin_components]
+        graph_inputs.extend(self.component_to_forward_info[component][0]
+                            for component in self.forward_graph.feedback_components)
 
-                # forward computation if we do not have origin node
-                else:
-                    value = torch.zeros(len(component.input_states[0].defaults.value), device=self.device).double()
-                    for input_node, weights in afferents.items():
-                        if input_node.component in current_exec_set:
-                            input_value = frozen_values[input_node.component]
-                        else:
-                            input_value = self.component_to_forward_info[input_node.component][0]
-                        value += torch.matmul(input_value, weights)
-                    if biases is not None:
-                        value = value + biases
-                    value = function(value)
-
-                # store the current value of the node
-                self.component_to_forward_info[component][0] = value
-                if do_logging:
-                    detached_value = value.detach().numpy()
-                    component.parameters.value._log_value(detached_value, execution_id, ContextFlags.COMMAND_LINE)
-
-                # save value in output list if we're at a node in the last execution set
-                if i == len(self.execution_sets) - 1:
-                    outputs[component] = value
-
-        self.copy_outputs_to_psyneulink(outputs, execution_id)
+        if self.trace_forward and self.traced_forward_graph is None:
+            self.traced_forward_graph = self._trace_forward_graph(graph_inputs)
+
+        if self.traced_forward_graph is not None:
+            values = self.traced_forward_graph(*graph_inputs)
+        else:
+            values = self.forward_graph(*graph_inputs)
+
+        last_exec_set = self.execution_sets[-1]
+        for component, value in zip(self.forward_graph.components, values):
+
+            # store the current value of the node
+            self.component_to_forward_info[component][0] = value
+            if do_logging:
+                detached_value = value.detach().numpy()
+                component.parameters.value._log_value(detached_value, execution_id, ContextFlags.COMMAND_LINE)
+
+            # save value in output list if we're at a node in the last execution set
+            if component in last_exec_set:
+                outputs[component] = value
+
+        if copy_outputs:
+            self.copy_outputs_to_psyneulink(outputs, execution_id)
         if do_logging:
             self.log_weights(execution_id)
         return outputs
 
+    # performs forward computation for every trial of inputs whose first dimension indexes trials, without tracking
+    # gradients, updating the stored values of nodes or copying anything to psyneulink. Returns a dict mapping nodes
+    # in the last execution set to their values for every trial
+    def evaluate(self, inputs, num_trials):
+        origin_components = self.forward_graph.origin_components
+        feedback_components = self.forward_graph.feedback_components
+
+        with torch.no_grad():
+            if not feedback_components and all(torch.is_tensor(inputs[component]) for component in origin_components):
+                values = self.forward_graph(*[inputs[component] for component in origin_components])
+            else:
+                # evaluate one trial at a time: inputs of different shapes on different trials can't be batched, and
+                # the feedback values on each trial are the values computed on the previous trial, starting from the
+                # stored values
+                feedback_values = [self.component_to_forward_info[component][0] for component in feedback_components]
+                trial_values = []
+                for t in range(num_trials):
+                    graph_inputs = [inputs[component][t] for component in origin_components]
+                    trial_values.append(self.forward_graph(*(graph_inputs + feedback_values)))
+                    component_values = dict(zip(self.forward_graph.components, trial_values[-1]))
+                    feedback_values = [component_values[component] for component in feedback_components]
+                values = [torch.stack(component_values) for component_values in zip(*trial_values)]
+
+        last_exec_set = self.execution_sets[-1]
+        return {component: value for component, value in zip(self.forward_graph.components, values)
+                if component in last_exec_set}
+
+    # traces the forward graph once into a TorchScript module, so that subsequent forward and backward passes run
+    # without Python-level graph interpretation. Falls back to the untraced graph if tracing fails.
+    def _trace_forward_graph(self, example_inputs):
+        try:
+            return torch.jit.trace(self.forward_graph, tuple(example_inputs), check_trace=False)
+        except Exception as e:
+            logger.warning('Could not trace the forward computation of {} into TorchScript ({}); using the untraced '
+                           'forward computation instead.'.format(self, e))
+            self.trace_forward = False
+            return None
+
     def detach_all(self):
         for component, info in self.component_to_forward_info.items():
-            info[0].detach_()
+            # values returned by a traced forward graph may be views, which cannot be detached in place
+            info[0] = info[0].detach()
             if info[1] is not None:
                 info[1].detach_()
 
@@ -160,6 +199,10 @@ class PytorchModelCreator(torch.nn.Module):
         for projection, weights in self.projections_to_pytorch_weights.items():
             projection.parameters.matrix.set(weights.detach().numpy(), execution_id)
 
+    # returns dict mapping nodes in the last execution set to their most recently computed values
+    def get_current_outputs(self):
+        return {component: self.component_to_forward_info[component][0] for component in self.execution_sets[-1]}
+
     def copy_outputs_to_psyneulink(self, outputs, execution_id=None):
         for component, value in outputs.items():
             detached_value = value.detach().numpy()
@@ -194,8 +237,9 @@ class PytorchModelCreator(torch.nn.Module):
             gain = get_fct_param_value('gain')
             bias = get_fct_param_value('bias')
             leak = get_fct_param_value('leak')
-            return lambda x: (torch.max(input=(x - bias), other=torch.tensor([0], device=self.device).double()) * gain +
-                              torch.min(input=(x - bias), other=torch.tensor([0], device=self.device).double()) * leak)
+            zero = torch.tensor([0], device=self.device, dtype=self.dtype)
+            return lambda x: (torch.max(input=(x - bias), other=zero) * gain +
+                              torch.min(input=(x - bias), other=zero) * leak)
 
     # returns dict mapping psyneulink projections to corresponding pytorch weights. Pytorch weights are copied
     # over from tensors inside Pytorch's Parameter data type to numpy arrays (and thus copied to a different
@@ -213,4 +257,83 @@ class PytorchModelCreator(torch.nn.Module):
         biases_in_numpy = {}
         for mechanism, biases in self.mechanisms_to_pytorch_biases.items():
             biases_in_numpy[mechanism] = biases.detach().numpy().copy()
-        return biases_in_numpy
\ No newline at end of file
+        return biases_in_numpy
+
+class ForwardGraph(torch.nn.Module):
+    """Fixed sequence of node computations equivalent to walking the execution sets of a PytorchModelCreator.
+
+    forward takes the inputs to the origin nodes, followed by the previous values of any nodes that are read before
+    they are computed (feedback components), and returns the new values of all nodes in execution order.
+    """
+
+    def __init__(self, execution_sets, component_to_forward_info, device, dtype):
+        super(ForwardGraph, self).__init__()
+
+        self.components = []  # nodes in execution order
+        self.origin_components = []  # nodes whose values are computed from external inputs
+        self.feedback_components = []  # nodes whose previous values are read before they are computed
+        self.steps = []  # per node: function, index of bias (or None), list of (source, index of weights)
+        self.device = device
+        self.dtype = dtype
+
+        # the pytorch parameters used in forward, registered here so that a traced version of this module
+        # shares (and computes gradients for) the same tensors as the PytorchModelCreator
+        self.params = nn.ParameterList()
+        param_indices = {}
+
+        def param_index(param):
+            if id(param) not in param_indices:
+                param_indices[id(param)] = len(self.params)
+                self.params.append(param)
+            return param_indices[id(param)]
+
+        computed = set()
+        for i, exec_set in enumerate(execution_sets):
+            for component in exec_set:
+                value, biases, function, afferents = component_to_forward_info[component]
+
+                if i == 0:
+                    self.origin_components.append(component)
+                    self.steps.append((function, None, None, None))
+                else:
+                    sources = []
+                    for input_node, weights in afferents.items():
+                        input_component = input_node.component
+                        # nodes in the same execution set see each other's values from before this set executed
+                        if input_component in computed:
+                            source = ('value', self.components.index(input_component))
+                        else:
+                            if input_component not in self.feedback_components:
+                                self.feedback_components.append(input_component)
+                            source = ('feedback', self.feedback_components.index(input_component))
+                        sources.append((source, param_index(weights)))
+                    bias_index = param_index(biases) if biases is not None else None
+                    size = len(component.input_states[0].defaults.value)
+                    self.steps.append((function, bias_index, sources, size))
+
+                self.components.append(component)
+            computed.update(exec_set)
+
+    def forward(self, *inputs):
+        num_origins = len(self.origin_components)
+        origin_inputs = inputs[:num_origins]
+        feedback_values = inputs[num_origins:]
+
+        values = []
+        for function, bias_index, sources, size in self.steps:
+            if sources is None:
+                value = function(origin_inputs[len(values)])
+            else:
+                value = None
+                for (kind, index), weights_index in sources:
+                    input_value = values[index] if kind == 'value' else feedback_values[index]
+                    weighted_input = torch.matmul(input_value, self.params[weights_index])
+                    value = weighted_input if value is None else value + weighted_input
+                if value is None:
+                    value = torch.zeros(size, device=self.device, dtype=self.dtype)
+                if bias_index is not None:
+                    value = value + self.params[bias_index]
+                value = function(value)
+            values.append(value)
+
+        return tuple(values)
@@ -55,3 +55,23 @@ class TestComponent:
         assert T2.input_state.current_execution_count == 3
         assert T2.parameter_states[pnl.SLOPE].current_execution_count == 3
         assert T2.output_state.current_execution_count == 3
+
+    def test_cached_pref_settings_follow_assignments(self):
+        T = pnl.TransferMechanism()
+        T.reportOutputPref = pnl.PreferenceEntry(False, pnl.PreferenceLevel.SUBTYPE)
+        class_prefs = pnl.TransferMechanism.classPreferences
+        original = class_prefs._report_output_pref.setting
+        assert T.reportOutputPref == original
+
+        try:
+            # assignment at the class level is seen by the instance's cached setting
+            class_prefs.reportOutputPref = not original
+            assert T.reportOutputPref == (not original)
+        finally:
+            class_prefs.reportOutputPref = original
+        assert T.reportOutputPref == original
+
+        T.reportOutputPref = pnl.PreferenceEntry(True, pnl.PreferenceLevel.INSTANCE)
+        assert T.reportOutputPref is True
+        T.reportOutputPref = False
+        assert T.reportOutputPref is False
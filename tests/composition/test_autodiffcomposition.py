@@ -387,6 +387,405 @@ class TestMiscTrainingFunctionality:
         assert not np.allclose(pt_weights_hid, hid_map.parameters.matrix.get(None))
         assert not np.allclose(pt_weights_out, out_map.parameters.matrix.get(None))
 
+    # test whether all sync policies leave psyneulink with the same weights and outputs at the end of training
+    @pytest.mark.parametrize("sync_policy", ['per_step', 'per_epoch', 'on_demand'])
+    def test_sync_policy(self, sync_policy):
+
+        xor_in = TransferMechanism(name='xor_in',
+                                   default_variable=np.zeros(2))
+
+        xor_hid = TransferMechanism(name='xor_hid',
+                                    default_variable=np.zeros(10),
+                                    function=Logistic())
+
+        xor_out = TransferMechanism(name='xor_out',
+                                    default_variable=np.zeros(1),
+                                    function=Logistic())
+
+        hid_map = MappingProjection(matrix=np.random.rand(2,10))
+        out_map = MappingProjection(matrix=np.random.rand(10,1))
+
+        xor = AutodiffComposition(param_init_from_pnl=True,
+                                  learning_rate=1.0,
+                                  sync_policy=sync_policy)
+
+        xor.add_node(xor_in)
+        xor.add_node(xor_hid)
+        xor.add_node(xor_out)
+
+        xor.add_projection(sender=xor_in, projection=hid_map, receiver=xor_hid)
+        xor.add_projection(sender=xor_hid, projection=out_map, receiver=xor_out)
+
+        xor_inputs = np.array(
+            [[0, 0],
+             [0, 1],
+             [1, 0],
+             [1, 1]])
+
+        xor_targets = np.array(
+            [[0],
+             [1],
+             [1],
+             [0]])
+
+        results = xor.run(inputs={"inputs": {xor_in:xor_inputs},
+                                  "targets": {xor_out:xor_targets},
+                                  "epochs": 10})
+
+        if sync_policy == 'on_demand':
+            xor.synchronize_with_psyneulink()
+
+        pytorch_representation = xor.parameters.pytorch_representation.get(xor)
+        assert np.allclose(hid_map.parameters.matrix.get(xor), pytorch_representation.params[0].detach().numpy())
+        assert np.allclose(out_map.parameters.matrix.get(xor), pytorch_representation.params[1].detach().numpy())
+        assert np.allclose(xor_out.parameters.value.get(xor), results[-1][-1])
+
+    # test whether training with a traced forward computation gives the same results as without
+    def test_trace_forward(self):
+
+        def train(trace_forward):
+            xor_in = TransferMechanism(name='xor_in',
+                                       default_variable=np.zeros(2))
+
+            xor_hid = TransferMechanism(name='xor_hid',
+                                        default_variable=np.zeros(10),
+                                        function=Logistic())
+
+            xor_out = TransferMechanism(name='xor_out',
+                                        default_variable=np.zeros(1),
+                                        function=Logistic())
+
+            hid_map = MappingProjection(matrix=np.full((2,10), 0.5))
+            out_map = MappingProjection(matrix=np.full((10,1), 0.5))
+
+            xor = AutodiffComposition(param_init_from_pnl=True,
+                                      learning_rate=1.0,
+                                      trace_forward=trace_forward)
+
+            xor.add_node(xor_in)
+            xor.add_node(xor_hid)
+            xor.add_node(xor_out)
+
+            xor.add_projection(sender=xor_in, projection=hid_map, receiver=xor_hid)
+            xor.add_projection(sender=xor_hid, projection=out_map, receiver=xor_out)
+
+            results = xor.run(inputs={"inputs": {xor_in: np.array([[0, 0], [0, 1], [1, 0], [1, 1]])},
+                                      "targets": {xor_out: np.array([[0], [1], [1], [0]])},
+                                      "epochs": 10})
+            if trace_forward:
+                assert xor.parameters.pytorch_representation.get(xor).traced_forward_graph is not None
+            return results, xor.get_parameters()[0][out_map]
+
+        results, weights = train(trace_forward=False)
+        traced_results, traced_weights = train(trace_forward=True)
+
+        assert np.allclose(results, traced_results)
+        assert np.allclose(weights, traced_weights)
+
+    # test whether training in single precision gives approximately the same results as in double precision
+    def test_float32_precision(self):
+
+        def train(precision):
+            xor_in = TransferMechanism(name='xor_in',
+                                       default_variable=np.zeros(2))
+
+            xor_hid = TransferMechanism(name='xor_hid',
+                                        default_variable=np.zeros(10),
+                                        function=Logistic())
+
+            xor_out = TransferMechanism(name='xor_out',
+                                        default_variable=np.zeros(1),
+                                        function=Logistic())
+
+            hid_map = MappingProjection(matrix=np.full((2,10), 0.5))
+            out_map = MappingProjection(matrix=np.full((10,1), 0.5))
+
+            xor = AutodiffComposition(param_init_from_pnl=True,
+                                      learning_rate=1.0,
+                                      precision=precision)
+
+            xor.add_node(xor_in)
+            xor.add_node(xor_hid)
+            xor.add_node(xor_out)
+
+            xor.add_projection(sender=xor_in, projection=hid_map, receiver=xor_hid)
+            xor.add_projection(sender=xor_hid, projection=out_map, receiver=xor_out)
+
+            results = xor.run(inputs={"inputs": {xor_in: np.array([[0, 0], [0, 1], [1, 0], [1, 1]])},
+                                      "targets": {xor_out: np.array([[0], [1], [1], [0]])},
+                                      "epochs": 10})
+            return results, xor.get_parameters()[0][out_map]
+
+        results, weights = train('float64')
+        results_32, weights_32 = train('float32')
+
+        assert weights.dtype == np.float64
+        assert weights_32.dtype == np.float32
+        assert np.allclose(results, results_32, atol=1e-5)
+        assert np.allclose(weights, weights_32, atol=1e-5)
+
+    def test_invalid_precision(self):
+        with pytest.raises(pnl.AutodiffCompositionError) as error_text:
+            AutodiffComposition(precision='float16')
+        assert "Invalid precision specified" in str(error_text.value)
+
+    def test_invalid_sync_policy(self):
+        with pytest.raises(pnl.AutodiffCompositionError) as error_text:
+            AutodiffComposition(sync_policy='per_trial')
+        assert "Invalid sync_policy specified" in str(error_text.value)
+
+    # test whether a validation set is evaluated after every epoch and used for early stopping
+    def test_validation_set(self):
+        xor_in = TransferMechanism(name='xor_in',
+                                   default_variable=np.zeros(2))
+
+        xor_hid = TransferMechanism(name='xor_hid',
+                                    default_variable=np.zeros(10),
+                                    function=Logistic())
+
+        xor_out = TransferMechanism(name='xor_out',
+                                    default_variable=np.zeros(1),
+                                    function=Logistic())
+
+        hid_map = MappingProjection(matrix=np.full((2,10), 0.5))
+        out_map = MappingProjection(matrix=np.full((10,1), 0.5))
+
+        xor = AutodiffComposition(param_init_from_pnl=True,
+                                  learning_rate=1.0,
+                                  patience=2,
+                                  min_delta=10)
+
+        xor.add_node(xor_in)
+        xor.add_node(xor_hid)
+        xor.add_node(xor_out)
+
+        xor.add_projection(sender=xor_in, projection=hid_map, receiver=xor_hid)
+        xor.add_projection(sender=xor_hid, projection=out_map, receiver=xor_out)
+
+        xor_inputs = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        xor_targets = np.array([[0], [1], [1], [0]])
+
+        results = xor.run(inputs={"inputs": {xor_in: xor_inputs},
+                                  "targets": {xor_out: xor_targets},
+                                  "epochs": 10,
+                                  "validation": {"inputs": {xor_in: xor_inputs[:2]},
+                                                 "targets": {xor_out: xor_targets[:2]}}})
+
+        # with min_delta larger than any possible improvement, training stops once patience runs out
+        validation_losses = xor.parameters.validation_losses.get(xor)
+        assert len(validation_losses) == 3
+        assert len(xor.parameters.losses.get(xor)) == 3
+        assert len(results[-1]) == 4
+
+        # the validation loss after the last epoch is the loss of the trained model on the validation inputs, computed
+        # like the training losses (divided by the same out_size, here the number of training targets)
+        pytorch_representation = xor.parameters.pytorch_representation.get(xor)
+        validation_outputs = pytorch_representation.evaluate({xor_in: torch.tensor(xor_inputs[:2], dtype=torch.float64)},
+                                                             2)
+        trial_losses = [xor.loss(validation_outputs[xor_out][t], torch.tensor(xor_targets[t], dtype=torch.float64)).item()
+                        for t in range(2)]
+        assert np.allclose(validation_losses[-1], np.mean(trial_losses) / 4)
+
+    # test that validation losses are on the same scale as training losses
+    def test_validation_loss_matches_training_loss(self):
+        xor_in = TransferMechanism(name='xor_in',
+                                   default_variable=np.zeros(2))
+
+        xor_hid = TransferMechanism(name='xor_hid',
+                                    default_variable=np.zeros(10),
+                                    function=Logistic())
+
+        xor_out = TransferMechanism(name='xor_out',
+                                    default_variable=np.zeros(1),
+                                    function=Logistic())
+
+        hid_map = MappingProjection(matrix=np.random.rand(2, 10))
+        out_map = MappingProjection(matrix=np.random.rand(10, 1))
+
+        # without learning, the model evaluated on the training set has the training loss
+        xor = AutodiffComposition(param_init_from_pnl=True,
+                                  learning_rate=0.0)
+
+        xor.add_node(xor_in)
+        xor.add_node(xor_hid)
+        xor.add_node(xor_out)
+
+        xor.add_projection(sender=xor_in, projection=hid_map, receiver=xor_hid)
+        xor.add_projection(sender=xor_hid, projection=out_map, receiver=xor_out)
+
+        xor_inputs = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        xor_targets = np.array([[0], [1], [1], [0]])
+
+        xor.run(inputs={"inputs": {xor_in: xor_inputs},
+                        "targets": {xor_out: xor_targets},
+                        "epochs": 3,
+                        "validation": {"inputs": {xor_in: xor_inputs},
+                                       "targets": {xor_out: xor_targets}}})
+
+        assert np.allclose(xor.parameters.validation_losses.get(xor), xor.parameters.losses.get(xor))
+
+    # test that evaluating a recurrent model runs the trials in sequence, each from the state left by the previous one
+    def test_evaluate_recurrent(self):
+        rec_in = TransferMechanism(name='rec_in',
+                                   default_variable=np.zeros(2))
+
+        rec_hid = TransferMechanism(name='rec_hid',
+                                    default_variable=np.zeros(3),
+                                    function=Logistic())
+
+        rec_out = TransferMechanism(name='rec_out',
+                                    default_variable=np.zeros(1),
+                                    function=Logistic())
+
+        rec = AutodiffComposition(param_init_from_pnl=True,
+                                  learning_rate=0.5)
+
+        rec.add_node(rec_in)
+        rec.add_node(rec_hid)
+        rec.add_node(rec_out)
+
+        rec.add_projection(sender=rec_in, projection=MappingProjection(matrix=np.full((2, 3), 0.5)), receiver=rec_hid)
+        rec.add_projection(sender=rec_hid, projection=MappingProjection(matrix=np.full((3, 1), 0.5)), receiver=rec_out)
+        rec.add_projection(sender=rec_out, projection=MappingProjection(matrix=np.full((1, 3), -2.0)), receiver=rec_hid,
+                           feedback=True)
+
+        rec_inputs = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        rec_targets = np.array([[0], [1], [1], [0]])
+
+        rec.run(inputs={"inputs": {rec_in: rec_inputs},
+                        "targets": {rec_out: rec_targets},
+                        "epochs": 2})
+
+        pytorch_representation = rec.parameters.pytorch_representation.get(rec)
+        assert pytorch_representation.forward_graph.feedback_components == [rec_out]
+        stored_value = pytorch_representation.component_to_forward_info[rec_out][0].clone()
+
+        outputs = pytorch_representation.evaluate({rec_in: torch.tensor(rec_inputs, dtype=torch.float64)}, 4)
+        # evaluation does not change the stored values
+        assert torch.equal(pytorch_representation.component_to_forward_info[rec_out][0], stored_value)
+
+        expected_outputs = [pytorch_representation.forward({rec_in: torch.tensor(trial_input, dtype=torch.float64)},
+                                                           do_logging=False, copy_outputs=False)[rec_out]
+                            for trial_input in rec_inputs]
+        assert np.allclose(outputs[rec_out].numpy(), torch.stack(expected_outputs).detach().numpy())
+
+    # test whether outputs computed after early stopping with lazy_outputs match the outputs collected during training
+    def test_lazy_outputs(self):
+
+        def train(lazy_outputs):
+            xor_in = TransferMechanism(name='xor_in',
+                                       default_variable=np.zeros(2))
+
+            xor_hid = TransferMechanism(name='xor_hid',
+                                        default_variable=np.zeros(10),
+                                        function=Logistic())
+
+            xor_out = TransferMechanism(name='xor_out',
+                                        default_variable=np.zeros(1),
+                                        function=Logistic())
+
+            hid_map = MappingProjection(matrix=np.full((2,10), 0.5))
+            out_map = MappingProjection(matrix=np.full((10,1), 0.5))
+
+            xor = AutodiffComposition(param_init_from_pnl=True,
+                                      learning_rate=0.0,
+                                      patience=1,
+                                      min_delta=10,
+                                      lazy_outputs=lazy_outputs)
+
+            xor.add_node(xor_in)
+            xor.add_node(xor_hid)
+            xor.add_node(xor_out)
+
+            xor.add_projection(sender=xor_in, projection=hid_map, receiver=xor_hid)
+            xor.add_projection(sender=xor_hid, projection=out_map, receiver=xor_out)
+
+            results = xor.run(inputs={"inputs": {xor_in: np.array([[0, 0], [0, 1], [1, 0], [1, 1]])},
+                                      "targets": {xor_out: np.array([[0], [1], [1], [0]])},
+                                      "epochs": 10})
+            return results
+
+        # with a learning rate of 0 the weights don't change, so outputs computed after training must match the
+        # outputs collected during the final epoch
+        results = train(lazy_outputs=False)
+        lazy_results = train(lazy_outputs=True)
+
+        assert len(lazy_results[-1]) == 4
+        assert np.allclose(results, lazy_results)
+
+    # test that preloaded tensors hold the same values as tensors converted on each trial, for inputs whose
+    # per-trial shapes are the same (one tensor) or differ (a list of tensors)
+    def test_preload_tensors(self):
+        ac = AutodiffComposition()
+        A = TransferMechanism(name='A', default_variable=np.zeros(2))
+        B = TransferMechanism(name='B', default_variable=np.zeros(2))
+
+        stimuli = {A: [[0, 1], [1, 0], [1, 1]],
+                   B: [[0.5], [1.0, 2.0], [3.0]]}
+        tensor_stimuli = ac._preload_tensors(stimuli)
+
+        assert torch.is_tensor(tensor_stimuli[A])
+        assert tensor_stimuli[A].dtype == torch.float64
+        assert tensor_stimuli[A].shape == (3, 2)
+        assert not torch.is_tensor(tensor_stimuli[B])
+        for component, values in stimuli.items():
+            for t, value in enumerate(values):
+                trial_tensor = torch.tensor(value, device=ac.device).double()
+                assert tensor_stimuli[component][t].dtype == trial_tensor.dtype
+                assert torch.equal(tensor_stimuli[component][t], trial_tensor)
+
+    # test that training on preloaded tensors gives the same results as converting inputs and targets on every trial
+    @pytest.mark.parametrize("randomize", [False, True])
+    def test_preload_tensors_training(self, monkeypatch, randomize):
+
+        def train():
+            np.random.seed(0)
+            xor_in = TransferMechanism(name='xor_in',
+                                       default_variable=np.zeros(2))
+
+            xor_hid = TransferMechanism(name='xor_hid',
+                                        default_variable=np.zeros(10),
+                                        function=Logistic())
+
+            xor_out = TransferMechanism(name='xor_out',
+                                        default_variable=np.zeros(1),
+                                        function=Logistic())
+
+            hid_map = MappingProjection(matrix=np.full((2,10), 0.5))
+            out_map = MappingProjection(matrix=np.full((10,1), 0.5))
+
+            xor = AutodiffComposition(param_init_from_pnl=True,
+                                      learning_rate=1.0,
+                                      randomize=randomize)
+
+            xor.add_node(xor_in)
+            xor.add_node(xor_hid)
+            xor.add_node(xor_out)
+
+            xor.add_projection(sender=xor_in, projection=hid_map, receiver=xor_hid)
+            xor.add_projection(sender=xor_hid, projection=out_map, receiver=xor_out)
+
+            results = xor.run(inputs={"inputs": {xor_in: np.array([[0, 0], [0, 1], [1, 0], [1, 1]])},
+                                      "targets": {xor_out: np.array([[0], [1], [1], [0]])},
+                                      "epochs": 10})
+            weights = xor.get_parameters()[0]
+            return results, [weights[hid_map], weights[out_map]], xor.parameters.losses.get(xor)
+
+        results, weights, losses = train()
+
+        # convert each value to a tensor separately, as when inputs were converted on every trial
+        def per_trial_tensors(self, stimuli):
+            return {component: [torch.tensor(value, device=self.device).double() for value in values]
+                    for component, values in stimuli.items()}
+        monkeypatch.setattr(AutodiffComposition, '_preload_tensors', per_trial_tensors)
+
+        per_trial_results, per_trial_weights, per_trial_losses = train()
+
+        assert np.allclose(results, per_trial_results)
+        for w, per_trial_w in zip(weights, per_trial_weights):
+            assert np.allclose(w, per_trial_w)
+        assert np.allclose(losses, per_trial_losses)
+
     # test whether the autodiff composition's get_parameters method works as desired
     def test_get_params(self):
 
@@ -1499,6 +1499,81 @@ class TestGraph:
                 comp.graph_processing.comp_to_vertex[B],
             ])
 
+        def test_incremental_update(self):
+            comp = Composition()
+            A = TransferMechanism(name='composition-pytests-A')
+            B = TransferMechanism(name='composition-pytests-B')
+            C = TransferMechanism(name='composition-pytests-C')
+            comp.add_node(A)
+            # access the processing graph so that subsequent additions update it in place
+            assert len(comp.graph_processing.vertices) == 1
+
+            comp.add_node(B)
+            comp.add_node(C)
+            comp.add_projection(MappingProjection(), A, B)
+            comp.add_projection(MappingProjection(), B, C)
+            comp.add_projection(MappingProjection(), C, B, feedback=True)
+            assert not comp.needs_update_graph_processing
+
+            incremental = comp.graph_processing
+            comp._update_processing_graph()
+            rebuilt = comp.graph_processing
+
+            assert [v.component for v in incremental.vertices] == [v.component for v in rebuilt.vertices]
+            for m in [A, B, C]:
+                assert ({v.component for v in incremental.get_parents_from_component(m)}
+                        == {v.component for v in rebuilt.get_parents_from_component(m)})
+                assert ({v.component for v in incremental.get_children_from_component(m)}
+                        == {v.component for v in rebuilt.get_children_from_component(m)})
+                assert (incremental.comp_to_vertex[m].backward_sources
+                        == rebuilt.comp_to_vertex[m].backward_sources)
+            assert incremental.comp_to_vertex[B].backward_sources == {C}
+
+        def test_incremental_update_run(self):
+            comp = Composition()
+            A = TransferMechanism(name='composition-pytests-A')
+            B = TransferMechanism(name='composition-pytests-B', function=Linear(slope=2.0))
+            comp.add_node(A)
+            assert len(comp.graph_processing.vertices) == 1
+
+            comp.add_linear_processing_pathway([A, B])
+            assert [v.component for v in comp.graph.vertices if not isinstance(v.component, MappingProjection)] == [A, B]
+            assert [v.component for v in comp.graph_processing.vertices] == [A, B]
+
+            output = comp.run(inputs={A: [[3.0]]})
+            assert np.allclose(output, [[6.0]])
+
+        def test_remove_and_disconnect_vertices(self):
+            comp = Composition()
+            A = TransferMechanism(name='composition-pytests-A')
+            B = TransferMechanism(name='composition-pytests-B')
+            C = TransferMechanism(name='composition-pytests-C')
+            comp.add_linear_processing_pathway([A, B, C])
+
+            graph = comp.graph.copy()
+            projection_vertices = [v for v in graph.vertices if isinstance(v.component, MappingProjection)]
+            assert len(projection_vertices) == 2
+
+            graph.remove_vertices(projection_vertices)
+            assert [v.component for v in graph.vertices] == [A, B, C]
+            assert set(graph.comp_to_vertex) == {A, B, C}
+            with pytest.raises(CompositionError):
+                graph.remove_vertices(projection_vertices)
+
+            # the original graph is unaffected by changes to its copy
+            assert len(comp.graph.vertices) == 5
+            A_to_B = comp.graph.get_children_from_component(A)[0]
+            comp.graph.disconnect_vertices(comp.graph.comp_to_vertex[A], A_to_B)
+            assert comp.graph.get_children_from_component(A) == []
+            assert A_to_B.parents == []
+            assert A_to_B.children == [comp.graph.comp_to_vertex[B]]
+
+            comp._update_processing_graph()
+            assert [v.component for v in comp.graph_processing.vertices] == [A, B, C]
+            assert comp.graph_processing.get_children_from_component(A) == []
+            assert comp.graph_processing.get_parents_from_component(B) == []
+            assert comp.graph_processing.get_children_from_component(B) == [comp.graph_processing.comp_to_vertex[C]]
+
 
 class TestRun:
 
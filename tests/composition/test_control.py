@@ -188,6 +188,47 @@ class TestControlMechanisms:
     #     assert np.allclose(result, [[[4.], [4.]],
     #                                 [[4.], [4.]]])
 
+    def _lc_composition(self):
+        A = pnl.TransferMechanism(function=pnl.Logistic(gain=1.0), name='A')
+        B = pnl.TransferMechanism(function=pnl.Logistic(gain=1.0), name='B')
+        objective_mechanism = pnl.ObjectiveMechanism(function=pnl.Linear,
+                                                     monitor=[B],
+                                                     name='LC ObjectiveMechanism')
+        LC = pnl.LCControlMechanism(modulated_mechanisms=[A, B],
+                                    base_level_gain=1.0,
+                                    scaling_factor_gain=0.5,
+                                    objective_mechanism=objective_mechanism)
+
+        # The ControlProjections to A would otherwise make LC the ORIGIN (and so the INPUT) Node;
+        # LC is an OUTPUT Node so that its gain is included in the results of each trial
+        comp = pnl.Composition()
+        comp.add_node(A, required_roles=pnl.NodeRole.INPUT)
+        comp.add_linear_processing_pathway([A, B])
+        comp.add_node(objective_mechanism)
+        comp.add_node(LC, required_roles=pnl.NodeRole.OUTPUT)
+        comp.add_required_node_role(B, pnl.NodeRole.OUTPUT)
+        return comp, A, B, LC
+
+    @pytest.mark.control
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", [pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_lc_control_mechanism_compiled(self, mode):
+        # The gain computed by the LCControlMechanism modulates the gain of A and B on the next trial
+        comp, A, B, LC = self._lc_composition()
+        comp.run(inputs={A: [[1.0], [0.5], [1.0], [0.5], [1.0]]})
+        expected = comp.results
+        expected_gains = [trial_results[comp.get_nodes_by_role(pnl.NodeRole.OUTPUT).index(LC)]
+                          for trial_results in expected]
+        assert not np.allclose(expected_gains[0], expected_gains[-1])
+
+        comp, A, B, LC = self._lc_composition()
+        comp.run(inputs={A: [[1.0], [0.5], [1.0], [0.5], [1.0]]}, bin_execute=mode)
+        assert len(comp.results) == len(expected)
+        for trial_results, expected_trial_results in zip(comp.results, expected):
+            assert np.allclose(trial_results, expected_trial_results)
+
 
 class TestModelBasedOptimizationControlMechanisms:
 
@@ -971,7 +1012,7 @@ class TestSampleIterator:
         spec = SampleSpec(function=fun)
         sample_iterator = SampleIterator(specification=spec)
 
-        expected = [5.978737984105739, 7.240893199201458, 6.867557990149967, 4.022722120123589, 5.950088417525589]
+        expected = [5.620200121606902, 3.4359565850611617, 4.4847029144020505, 2.4464727305984764, 5.302845918582278]
 
         for i in range(5):
             assert np.allclose(next(sample_iterator), expected[i])
@@ -982,7 +1023,7 @@ class TestSampleIterator:
                           num=4)
         sample_iterator = SampleIterator(specification=spec)
 
-        expected = [5.978737984105739, 7.240893199201458, 6.867557990149967, 4.022722120123589, 5.950088417525589]
+        expected = [5.620200121606902, 3.4359565850611617, 4.4847029144020505, 2.4464727305984764, 5.302845918582278]
 
         for i in range(4):
             assert np.allclose(next(sample_iterator), expected[i])
@@ -34,3 +34,36 @@ class TestGraph:
 
             assert g1.vertices[i] != g2.vertices[i]
             assert g1.vertices[i].component == g2.vertices[i].component
+
+    def test_edges_keep_insertion_order(self):
+
+        g = Graph()
+        parent = Vertex(TestGraph.DummyComponent())
+        children = [Vertex(TestGraph.DummyComponent()) for i in range(4)]
+        for vertex in [parent] + children:
+            g.add_vertex(vertex)
+
+        for child in children:
+            g.connect_vertices(parent, child)
+        # connecting an existing edge again neither duplicates nor reorders it
+        g.connect_vertices(parent, children[0])
+        assert parent.children == children
+
+        g.disconnect_vertices(parent, children[1])
+        assert parent.children == [children[0], children[2], children[3]]
+        assert children[1].parents == []
+
+        g.connect_vertices(parent, children[1])
+        assert parent.children == [children[0], children[2], children[3], children[1]]
+
+    def test_remove_vertices(self):
+
+        g = Graph()
+        vertices = [Vertex(TestGraph.DummyComponent()) for i in range(5)]
+        for vertex in vertices:
+            g.add_vertex(vertex)
+
+        g.remove_vertices([vertices[3], vertices[1]])
+
+        assert g.vertices == [vertices[0], vertices[2], vertices[4]]
+        assert list(g.comp_to_vertex.values()) == [vertices[0], vertices[2], vertices[4]]
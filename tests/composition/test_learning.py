@@ -1,5 +1,6 @@
 import psyneulink as pnl
 import numpy as np
+import pytest
 
 class TestHebbian:
 
@@ -188,6 +189,38 @@ class TestReinforcement:
                                                         [0.118109771], [1.32123733], [0.978989672], [0.118109771],
                                                         [1.32123733]])
 
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", ['Python',
+                                      pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_rl_compiled(self, mode):
+        input_layer = pnl.TransferMechanism(size=3, name='Input Layer')
+        action_selection = pnl.TransferMechanism(size=3,
+                                                 function=pnl.SoftMax(output=pnl.MAX_VAL),
+                                                 name='Action Selection')
+
+        comp = pnl.Composition(name='comp')
+        learning_components = comp.add_reinforcement_learning_pathway(pathway=[input_layer, action_selection],
+                                                                      learning_rate=0.1)
+        learned_projection = learning_components[pnl.LEARNED_PROJECTION]
+        target_mechanism = learning_components[pnl.TARGET_MECHANISM]
+
+        inputs_dict = {input_layer: [[3., 1., 1.], [1., 3., 1.], [1., 1., 3.]],
+                       target_mechanism: [[1.], [1.], [0.]]}
+        result = comp.run(inputs=inputs_dict, num_trials=10, bin_execute=mode)
+
+        expected_matrix = [[1.0596460523999065, 0., 0.],
+                           [0., 1.0601188452819301, 0.],
+                           [0., 0., 0.7791584650545842]]
+        assert np.allclose(result, [[0.01741757, 0., 0.], [0.01741757, 0., 0.]])
+        assert np.allclose(learned_projection.parameters.matrix.get(comp), expected_matrix)
+
+        # Pause learning -- the matrix is not modified
+        comp.learning_enabled = False
+        comp.run(inputs={input_layer: [[1., 1., 3.]]}, bin_execute=mode)
+        assert np.allclose(learned_projection.parameters.matrix.get(comp), expected_matrix)
+
     def test_td_learning_enabled_false(self):
 
         # create processing mechanisms
@@ -271,3 +304,136 @@ class TestReinforcement:
 
         assert np.allclose(trial_50_expected, delta_vals[49][0])
 
+
+
+class TestKohonen:
+
+    def _kohonen_composition(self):
+        # KohonenLearningMechanism requires its input and output to be the same length
+        input_layer = pnl.TransferMechanism(size=3, name='Input Layer')
+        kohonen = pnl.KohonenMechanism(size=3, name='Kohonen')
+        learned_projection = pnl.MappingProjection(sender=input_layer,
+                                                   receiver=kohonen,
+                                                   matrix=[[0.1, 0.2, 0.3],
+                                                           [0.4, 0.5, 0.6],
+                                                           [0.7, 0.8, 0.9]])
+
+        # The LearningMechanism and its Projections are added with the KohonenMechanism
+        comp = pnl.Composition(name='comp')
+        comp.add_linear_processing_pathway([input_layer, learned_projection, kohonen])
+        assert kohonen.learning_mechanism in comp.nodes
+        # Otherwise the (terminal) LearningMechanism would be the OUTPUT Node
+        comp.add_required_node_role(kohonen, pnl.NodeRole.OUTPUT)
+        comp.learning_enabled = True
+
+        inputs_dict = {input_layer: [[1., 0., 0.], [0., 1., 0.], [0.5, 0., 0.5]]}
+        return comp, learned_projection, inputs_dict
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", [pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_kohonen_compiled(self, mode):
+        comp, learned_projection, inputs_dict = self._kohonen_composition()
+        expected_result = comp.run(inputs=inputs_dict, num_trials=6)
+        expected_matrix = learned_projection.parameters.matrix.get(comp)
+        assert not np.allclose(expected_matrix, [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]])
+
+        comp, learned_projection, inputs_dict = self._kohonen_composition()
+        result = comp.run(inputs=inputs_dict, num_trials=6, bin_execute=mode)
+        assert np.allclose(result, expected_result)
+        assert np.allclose(learned_projection.parameters.matrix.get(comp), expected_matrix)
+
+
+class TestBackPropagation:
+
+    def _backprop_composition(self):
+        input_layer = pnl.TransferMechanism(size=3, name='Input Layer')
+        output_layer = pnl.TransferMechanism(size=3, function=pnl.Logistic, name='Output Layer')
+        learned_projection = pnl.MappingProjection(sender=input_layer,
+                                                   receiver=output_layer,
+                                                   matrix=[[0.1, 0.2, 0.3],
+                                                           [0.4, 0.5, 0.6],
+                                                           [0.7, 0.8, 0.9]])
+
+        comp = pnl.Composition(name='comp')
+        learning_components = comp.add_back_propagation_pathway([input_layer, learned_projection, output_layer],
+                                                                learning_rate=0.5)
+        # Otherwise the (terminal) LearningMechanism would be the OUTPUT Node
+        comp.add_required_node_role(output_layer, pnl.NodeRole.OUTPUT)
+        comp.learning_enabled = True
+
+        target = learning_components[pnl.TARGET_MECHANISM]
+        inputs_dict = {input_layer: [[1.0, 2.0, -1.0]],
+                       target: [[0.0, 1.0, 0.5]]}
+        return comp, learned_projection, inputs_dict
+
+    def test_backprop(self):
+        comp, learned_projection, inputs_dict = self._backprop_composition()
+        result = comp.run(inputs=inputs_dict, num_trials=3)
+
+        assert np.allclose(result, [[0.36801345, 0.71347992, 0.60197213]])
+        assert np.allclose(learned_projection.parameters.matrix.get(comp),
+                           [[-0.0234581, 0.28539094, 0.26894818],
+                            [0.15308379, 0.67078189, 0.53789637],
+                            [0.8234581, 0.71460906, 0.93105182]])
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", [pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_backprop_compiled(self, mode):
+        comp, learned_projection, inputs_dict = self._backprop_composition()
+        expected_result = comp.run(inputs=inputs_dict, num_trials=3)
+        expected_matrix = learned_projection.parameters.matrix.get(comp)
+        assert not np.allclose(expected_matrix, [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]])
+
+        comp, learned_projection, inputs_dict = self._backprop_composition()
+        result = comp.run(inputs=inputs_dict, num_trials=3, bin_execute=mode)
+        assert np.allclose(result, expected_result)
+        assert np.allclose(learned_projection.parameters.matrix.get(comp), expected_matrix)
+
+    def _two_pathway_composition(self):
+        input_layer = pnl.TransferMechanism(size=2, name='Input Layer')
+        hidden_layer = pnl.TransferMechanism(size=3, function=pnl.Logistic, name='Hidden Layer')
+        output_layer = pnl.TransferMechanism(size=2, function=pnl.Logistic, name='Output Layer')
+        input_weights = pnl.MappingProjection(sender=input_layer,
+                                              receiver=hidden_layer,
+                                              matrix=[[0.1, 0.2, 0.3],
+                                                      [0.4, 0.5, 0.6]])
+        output_weights = pnl.MappingProjection(sender=hidden_layer,
+                                               receiver=output_layer,
+                                               matrix=[[0.1, -0.2],
+                                                       [0.3, 0.4],
+                                                       [-0.5, 0.6]])
+
+        comp = pnl.Composition(name='comp')
+        input_learning = comp.add_back_propagation_pathway([input_layer, input_weights, hidden_layer],
+                                                           learning_rate=0.5)
+        output_learning = comp.add_back_propagation_pathway([hidden_layer, output_weights, output_layer],
+                                                            learning_rate=0.5)
+        comp.add_required_node_role(output_layer, pnl.NodeRole.OUTPUT)
+        comp.learning_enabled = True
+
+        inputs_dict = {input_layer: [[1.0, -1.0], [0.5, 2.0]],
+                       input_learning[pnl.TARGET_MECHANISM]: [[0.0, 1.0, 0.5], [1.0, 0.0, 0.5]],
+                       output_learning[pnl.TARGET_MECHANISM]: [[1.0, 0.0], [0.0, 1.0]]}
+        return comp, (input_weights, output_weights), inputs_dict
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", [pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_two_pathways_compiled(self, mode):
+        # Comparators and LearningMechanisms of both pathways, with non-square matrices and changing targets
+        comp, learned_projections, inputs_dict = self._two_pathway_composition()
+        expected_result = comp.run(inputs=inputs_dict, num_trials=4)
+        expected_matrices = [p.parameters.matrix.get(comp) for p in learned_projections]
+        assert not np.allclose(expected_matrices[0], [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+        assert not np.allclose(expected_matrices[1], [[0.1, -0.2], [0.3, 0.4], [-0.5, 0.6]])
+
+        comp, learned_projections, inputs_dict = self._two_pathway_composition()
+        result = comp.run(inputs=inputs_dict, num_trials=4, bin_execute=mode)
+        assert np.allclose(result, expected_result)
+        for projection, expected_matrix in zip(learned_projections, expected_matrices):
+            assert np.allclose(projection.parameters.matrix.get(comp), expected_matrix)
@@ -147,22 +147,20 @@ class TestAccumulator():
         assert np.allclose([[40., 80., 120.]], val)
 
     def test_accumulator_standalone_noise_function(self):
-        np.random.seed(22)
-        A = AccumulatorIntegrator(rate = 1.0, noise=NormalDist(standard_deviation=0.1))
+        A = AccumulatorIntegrator(rate = 1.0, noise=NormalDist(standard_deviation=0.1, seed=22))
         A()
         A()
         A()
         val = A()
-        assert np.allclose([[-0.06509346]], val)
+        assert np.allclose([[-0.04373433]], val)
 
     def test_accumulator_standalone_noise_function_in_array(self):
-        A = AccumulatorIntegrator(noise=[10, NormalDist(standard_deviation=0.1), 20])
-        np.random.seed(22)
+        A = AccumulatorIntegrator(noise=[10, NormalDist(standard_deviation=0.1, seed=22), 20])
         A()
         A()
         A()
         val = A()
-        expected_val = [[40.0, 0.16006288334688934, 80.0]]
+        expected_val = [[40.0, -0.06976530123314047, 80.0]]
         for i in range(len(val)):
             for j in range(len(val[i])):
                 assert np.allclose(expected_val[i][j], val[i][j])
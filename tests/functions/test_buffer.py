@@ -64,24 +64,22 @@ class TestBuffer():
         assert np.allclose(deque(np.atleast_1d([ 24., 45., 66.], [ 17., 28., 39.], [10, 11, 12])), val)
 
     def test_buffer_standalone_noise_function(self):
-        np.random.seed(22)
-        B = Buffer(history=3, rate = 1.0, noise=NormalDist(standard_deviation=0.1))
+        B = Buffer(history=3, rate = 1.0, noise=NormalDist(standard_deviation=0.1, seed=22))
         B.execute([1,2,3])
         B.execute([4,5,6])
         B.execute([7,8,9])
         val = B.execute([10,11,12])
-        assert np.allclose(deque(np.atleast_1d([[ 3.8925223, 5.03957263, 6.00262384],
-                                                [ 7.00288551, 7.97692328, 9.05877522],
+        assert np.allclose(deque(np.atleast_1d([[ 4.00749828, 5.07210764, 6.08960786],
+                                                [ 7.01574496, 8.05112029, 9.02234418],
                                                 [10, 11, 12]])), val)
 
     def test_buffer_standalone_noise_function_in_array(self):
-        B = Buffer(history=3, noise=[10, NormalDist(standard_deviation=0.1), 20])
-        np.random.seed(22)
+        B = Buffer(history=3, noise=[10, NormalDist(standard_deviation=0.1, seed=22), 20])
         B.execute([1,2,3])
         B.execute([4,5,6])
         B.execute([7,8,9])
         val = B.execute([10,11,12])
-        expected_val = [[24, 5.0800314416734444, 46], [17, 8.040015720836722, 29], [10, 11, 12]]
+        expected_val = [[24, 4.96511734938343, 46], [17, 7.982558674691715, 29], [10, 11, 12]]
         for i in range(len(val)):
             for j in range(len(val[i])):
                 assert np.allclose(expected_val[i][j], val[i][j])
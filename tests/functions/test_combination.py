@@ -230,3 +230,80 @@ def test_linear_combination_function_in_mechanism_ptx(operation, input, input_st
         expected = np.product(input, axis=0) * scale + offset
 
     assert np.allclose(res, expected)
+
+# ------------------------------------
+
+def reduce_helper(variable, operation=pnl.SUM, weights=1.0, exponents=1.0, scale=1.0, offset=0.0):
+    tmp = (np.atleast_2d(variable) ** exponents) * weights
+    op = np.sum if operation == pnl.SUM else np.product
+    return op(tmp, axis=1) * scale + offset
+
+def combine_means_helper(variable, operation=pnl.SUM, weights=1.0, exponents=1.0, scale=1.0, offset=0.0):
+    tmp = (np.mean(variable, axis=1) ** np.ravel(exponents)) * np.ravel(weights)
+    op = np.sum if operation == pnl.SUM else np.product
+    return [op(tmp) * scale + offset]
+
+def prediction_error_helper(variable, gamma=1.0):
+    sample, reward = variable
+    return np.concatenate(([0], reward[1:] + gamma * sample[1:] - sample[:-1]))
+
+Functions = pnl.core.components.functions.combinationfunctions
+test_data = [
+    (Functions.Reduce, test_var[0], {}, reduce_helper),
+    (Functions.Reduce, test_var[0], {'weights':RAND1_V, 'exponents':RAND2_V, 'scale':RAND1_S, 'offset':RAND2_S}, reduce_helper),
+    (Functions.Reduce, test_var2, {'operation':pnl.PRODUCT, 'weights':RAND1_V, 'scale':RAND1_S}, reduce_helper),
+    (Functions.Reduce, test_var2, {'scale':[RAND1_S, RAND2_S], 'offset':[RAND2_S, RAND3_S]}, reduce_helper),
+    (Functions.CombineMeans, test_var2, {}, combine_means_helper),
+    (Functions.CombineMeans, test_var2, {'weights':[RAND1_S, RAND2_S], 'exponents':[2.0, RAND3_S], 'scale':RAND1_S, 'offset':RAND2_S}, combine_means_helper),
+    (Functions.CombineMeans, test_var2, {'operation':pnl.PRODUCT, 'weights':[RAND1_S, RAND2_S]}, combine_means_helper),
+    (Functions.PredictionErrorDeltaFunction, test_var2, {}, prediction_error_helper),
+    (Functions.PredictionErrorDeltaFunction, test_var2, {'gamma':RAND1_S}, prediction_error_helper),
+]
+
+# use list, naming function produces ugly names
+names = [
+    "REDUCE",
+    "REDUCE WEIGHTS EXPONENTS SCALE OFFSET",
+    "REDUCE 2D PRODUCT",
+    "REDUCE 2D ARRAY SCALE OFFSET",
+    "COMBINE_MEANS",
+    "COMBINE_MEANS WEIGHTS EXPONENTS SCALE OFFSET",
+    "COMBINE_MEANS PRODUCT",
+    "PREDICTION_ERROR_DELTA",
+    "PREDICTION_ERROR_DELTA GAMMA",
+]
+
+@pytest.mark.function
+@pytest.mark.combination_function
+@pytest.mark.parametrize("func, variable, params, expected", test_data, ids=names)
+@pytest.mark.benchmark
+def test_combination_function(func, variable, params, expected, benchmark):
+    f = func(default_variable=variable, **params)
+    benchmark.group = "CombinationFunction " + func.componentName
+    res = benchmark(f.function, variable)
+    assert np.allclose(np.asfarray(res.tolist()), expected(variable, **params))
+
+@pytest.mark.llvm
+@pytest.mark.function
+@pytest.mark.combination_function
+@pytest.mark.parametrize("func, variable, params, expected", test_data, ids=names)
+@pytest.mark.benchmark
+def test_combination_function_llvm(func, variable, params, expected, benchmark):
+    f = func(default_variable=variable, **params)
+    benchmark.group = "CombinationFunction " + func.componentName
+    e = pnlvm.execution.FuncExecution(f)
+    res = benchmark(e.execute, variable)
+    assert np.allclose(res, expected(variable, **params))
+
+@pytest.mark.llvm
+@pytest.mark.cuda
+@pytest.mark.function
+@pytest.mark.combination_function
+@pytest.mark.parametrize("func, variable, params, expected", test_data, ids=names)
+@pytest.mark.benchmark
+def test_combination_function_ptx(func, variable, params, expected, benchmark):
+    f = func(default_variable=variable, **params)
+    benchmark.group = "CombinationFunction " + func.componentName
+    e = pnlvm.execution.FuncExecution(f)
+    res = benchmark(e.cuda_execute, variable)
+    assert np.allclose(res, expected(variable, **params))
@@ -0,0 +1,101 @@
+import numpy as np
+import psyneulink.core.llvm as pnlvm
+import psyneulink.core.components.functions.distributionfunctions as Functions
+import psyneulink.core.components.functions.function as Function
+import pytest
+from scipy.special import erfinv
+
+RAND1 = np.random.rand()
+RAND2 = np.random.rand()
+SEED = 0
+SAMPLES = 10
+
+def seeded_helper(sample):
+    state = np.random.RandomState(np.asarray([SEED]))
+    return [sample(state) for _ in range(SAMPLES)]
+
+test_data = [
+    (Functions.NormalDist, {'mean':RAND1, 'standard_deviation':RAND2}, lambda s: s.normal(RAND1, RAND2)),
+    (Functions.UniformToNormalDist, {'mean':RAND1, 'standard_deviation':RAND2},
+     lambda s: np.sqrt(2) * erfinv(2 * s.rand(1)[0] - 1) * RAND2 + RAND1),
+    (Functions.ExponentialDist, {'beta':RAND1}, lambda s: s.exponential(RAND1)),
+    (Functions.UniformDist, {'low':RAND1, 'high':RAND1 + RAND2}, lambda s: s.uniform(RAND1, RAND1 + RAND2)),
+    (Functions.GammaDist, {'scale':RAND1, 'dist_shape':RAND2}, lambda s: s.gamma(RAND2, RAND1)),
+    (Functions.GammaDist, {'scale':RAND1, 'dist_shape':1.0}, lambda s: s.gamma(1.0, RAND1)),
+    (Functions.GammaDist, {'scale':RAND1, 'dist_shape':1 + 3 * RAND2}, lambda s: s.gamma(1 + 3 * RAND2, RAND1)),
+    (Functions.WaldDist, {'scale':RAND1, 'mean':RAND2}, lambda s: s.wald(RAND2, RAND1)),
+]
+
+# use list, naming function produces ugly names
+names = [
+    "NORMAL",
+    "UNIFORM TO NORMAL",
+    "EXPONENTIAL",
+    "UNIFORM",
+    "GAMMA SMALL SHAPE",
+    "GAMMA SHAPE ONE",
+    "GAMMA LARGE SHAPE",
+    "WALD",
+]
+
+@pytest.mark.function
+@pytest.mark.distribution_function
+@pytest.mark.parametrize("func, params, sample", test_data, ids=names)
+@pytest.mark.benchmark
+def test_basic(func, params, sample, benchmark):
+    f = func(seed=SEED, **params)
+    benchmark.group = "DistributionFunction " + func.componentName;
+    res = [f.function() for _ in range(SAMPLES)]
+    benchmark(f.function)
+    assert np.allclose(res, seeded_helper(sample))
+
+
+@pytest.mark.llvm
+@pytest.mark.function
+@pytest.mark.distribution_function
+@pytest.mark.parametrize("func, params, sample", test_data, ids=names)
+@pytest.mark.benchmark
+def test_llvm(func, params, sample, benchmark):
+    f = func(seed=SEED, **params)
+    benchmark.group = "DistributionFunction " + func.componentName;
+    m = pnlvm.execution.FuncExecution(f)
+    res = [m.execute(f.defaults.variable) for _ in range(SAMPLES)]
+    benchmark(m.execute, f.defaults.variable)
+    assert np.allclose(res, seeded_helper(sample))
+
+@pytest.mark.llvm
+@pytest.mark.cuda
+@pytest.mark.function
+@pytest.mark.distribution_function
+@pytest.mark.parametrize("func, params, sample", test_data, ids=names)
+@pytest.mark.benchmark
+def test_ptx_cuda(func, params, sample, benchmark):
+    f = func(seed=SEED, **params)
+    benchmark.group = "DistributionFunction " + func.componentName;
+    m = pnlvm.execution.FuncExecution(f)
+    res = [m.cuda_execute(f.defaults.variable) for _ in range(SAMPLES)]
+    benchmark(m.cuda_execute, f.defaults.variable)
+    assert np.allclose(res, seeded_helper(sample))
+
+
+@pytest.mark.function
+@pytest.mark.distribution_function
+@pytest.mark.parametrize("func, params, sample", test_data, ids=names)
+def test_seed(func, params, sample):
+    # The same seed gives the same samples; the global numpy generator is not used
+    f1 = func(seed=SEED, **params)
+    f2 = func(seed=SEED, **params)
+    res1 = [f1.function() for _ in range(SAMPLES)]
+    np.random.seed(SEED + 1)
+    res2 = [f2.function() for _ in range(SAMPLES)]
+    assert np.allclose(res1, res2)
+
+
+@pytest.mark.llvm
+@pytest.mark.function
+@pytest.mark.distribution_function
+def test_drift_diffusion_analytical_llvm():
+    f = Functions.DriftDiffusionAnalytical()
+    with pytest.raises(Function.FunctionError) as error_text:
+        pnlvm.execution.FuncExecution(f)
+    assert "can't be compiled" in str(error_text.value)
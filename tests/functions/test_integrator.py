@@ -20,11 +20,54 @@ def AdaptiveIntFun(init, value, iterations, rate, noise, offset, **kwargs):
         val = (1 - rate) * val + rate * value + noise + offset
     return val
 
+def SimpleIntFun(init, value, iterations, rate, noise, offset, **kwargs):
+    val = np.full_like(value, init)
+    for i in range(iterations):
+        val = val + rate * value + noise + offset
+    return val
+
+def AccumulatorFun(init, value, iterations, rate, noise, increment, **kwargs):
+    val = np.full_like(value, init)
+    for i in range(iterations):
+        val = val * rate + noise + increment
+    return val
+
+def DualAdaptiveFun(init, value, iterations, short_term_rate, long_term_rate, offset, **kwargs):
+    short = long = np.zeros_like(value)
+    for i in range(iterations):
+        # Matches the argument order of DualAdaptiveIntegrator.function
+        short = (1 - short) * short_term_rate + short * value
+        long = (1 - long) * long_term_rate + long * value
+    short_logistic = 1 / (1 + np.exp(-short))
+    long_logistic = 1 / (1 + np.exp(-long))
+    return (1 - short_logistic) * long_logistic + offset
+
+def LeakyCompetingFun(init, value, iterations, rate, noise, offset, time_step_size, **kwargs):
+    val = np.full_like(value, init)
+    for i in range(iterations):
+        val = val + (rate * val + value) * time_step_size + noise * np.sqrt(time_step_size) + offset
+    return val
+
+def InteractiveActivationFun(init, value, iterations, rate, decay, rest, noise, **kwargs):
+    val = np.full_like(value, init)
+    for i in range(iterations):
+        dist = np.where(value > 0, 1.0 - val, np.where(value < 0, val + 1.0, 0))
+        val = val + rate * (value + noise) * dist - decay * (val - rest)
+    return val
+
 test_data = [
     (Functions.AdaptiveIntegrator, test_var, {'rate':RAND0_1, 'noise':RAND2, 'offset':RAND3}, AdaptiveIntFun),
     (Functions.AdaptiveIntegrator, test_var, {'rate':RAND0_1, 'noise':test_noise_arr, 'offset':RAND3}, AdaptiveIntFun),
     (Functions.AdaptiveIntegrator, test_var, {'initializer':test_initializer, 'rate':RAND0_1, 'noise':RAND2, 'offset':RAND3}, AdaptiveIntFun),
     (Functions.AdaptiveIntegrator, test_var, {'initializer':test_initializer, 'rate':RAND0_1, 'noise':test_noise_arr, 'offset':RAND3}, AdaptiveIntFun),
+    (Functions.SimpleIntegrator, test_var, {'rate':RAND0_1, 'noise':RAND2, 'offset':RAND3}, SimpleIntFun),
+    (Functions.SimpleIntegrator, test_var, {'initializer':test_initializer, 'rate':RAND0_1, 'noise':test_noise_arr, 'offset':RAND3}, SimpleIntFun),
+    (Functions.AccumulatorIntegrator, test_var, {'rate':RAND0_1, 'noise':RAND2, 'increment':RAND3}, AccumulatorFun),
+    (Functions.AccumulatorIntegrator, test_var, {'initializer':test_initializer, 'rate':RAND0_1, 'noise':test_noise_arr, 'increment':RAND3}, AccumulatorFun),
+    (Functions.DualAdaptiveIntegrator, test_var, {'short_term_rate':RAND0_1, 'long_term_rate':RAND2, 'offset':RAND3}, DualAdaptiveFun),
+    (Functions.InteractiveActivationIntegrator, test_var - 0.5, {'rate':RAND0_1, 'decay':RAND2, 'rest':RAND3, 'noise':RAND2}, InteractiveActivationFun),
+    (Functions.LeakyCompetingIntegrator, test_var, {'rate':-RAND0_1, 'noise':RAND2, 'offset':RAND3, 'time_step_size':RAND0_1}, LeakyCompetingFun),
+    (Functions.LeakyCompetingIntegrator, test_var, {'initializer':test_initializer, 'rate':-RAND0_1, 'noise':test_noise_arr, 'offset':RAND3, 'time_step_size':RAND0_1}, LeakyCompetingFun),
 ]
 
 # use list, naming function produces ugly names
@@ -33,6 +76,14 @@ names = [
     "AdaptiveIntegrator Noise Array",
     "AdaptiveIntegrator Initializer",
     "AdaptiveIntegrator Initializer Noise Array",
+    "SimpleIntegrator",
+    "SimpleIntegrator Initializer Noise Array",
+    "AccumulatorIntegrator",
+    "AccumulatorIntegrator Initializer Noise Array",
+    "DualAdaptiveIntegrator",
+    "InteractiveActivationIntegrator",
+    "LeakyCompetingIntegrator",
+    "LeakyCompetingIntegrator Initializer Noise Array",
 ]
 
 GROUP_PREFIX="IntegratorFunction "
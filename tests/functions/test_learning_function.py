@@ -0,0 +1,163 @@
+import numpy as np
+import psyneulink.core.llvm as pnlvm
+import psyneulink.core.components.functions.learningfunctions as Functions
+import psyneulink.core.components.functions.transferfunctions as TransferFunctions
+import psyneulink.core.globals.keywords as kw
+import pytest
+
+SIZE=5
+test_input = np.random.rand(SIZE)
+test_output = np.random.rand(SIZE)
+test_error = np.random.rand(SIZE)
+test_error_matrix = np.random.rand(SIZE, SIZE)
+
+test_input_l = np.random.rand(2 * SIZE)
+test_error_s = np.random.rand(SIZE // 2)
+test_error_matrix_s = np.random.rand(SIZE, SIZE // 2)
+
+test_activity = np.random.rand(SIZE)
+test_weights = np.random.rand(SIZE, SIZE)
+test_rate_1d = np.random.rand(SIZE)
+test_rate_2d = np.random.rand(SIZE, SIZE)
+test_choice = np.where(np.arange(SIZE) == SIZE // 2, np.random.rand(SIZE), 0)
+test_reward = np.random.rand(1)
+test_td_error = np.random.rand(SIZE)
+
+RAND1 = np.random.rand()
+RAND2 = np.random.rand()
+RAND3 = np.random.rand()
+
+def backprop_helper(activation_input, activation_output, error_signal, error_matrix, learning_rate, derivative):
+    dE_dW = np.dot(error_matrix, error_signal) * derivative(activation_output)
+    return [learning_rate * np.outer(activation_input, dE_dW), dE_dW]
+
+def hebbian_helper(variable, learning_rate):
+    if np.ndim(learning_rate) == 1:
+        variable = variable * learning_rate
+    weight_change_matrix = np.outer(variable, variable) * (1 - np.identity(len(variable)))
+    if np.ndim(learning_rate) != 1:
+        weight_change_matrix = weight_change_matrix * learning_rate
+    return weight_change_matrix
+
+def kohonen_helper(variable, learning_rate, distance):
+    input_pattern, activities, matrix = variable
+    index_of_max = np.argmax(activities)
+    scale = [1 - distance(abs(j - index_of_max)) for j in range(len(activities))]
+    return (matrix - input_pattern[:, np.newaxis]) * scale * learning_rate
+
+def reinforcement_helper(output, error, learning_rate):
+    error_array = np.where(output, learning_rate * error, 0)
+    return [error_array, error_array]
+
+gaussian_distance = lambda x: np.exp(-x * x / 2) / np.sqrt(2 * np.pi)
+
+logistic_derivative = lambda x: x * (1 - x)
+scaled_logistic_derivative = lambda x: RAND2 * RAND3 * x * (1 - x)
+
+test_data = [
+    (Functions.BackPropagation, [test_input, test_output, test_error], {'error_matrix':test_error_matrix}, {}, None,
+     backprop_helper(test_input, test_output, test_error, test_error_matrix, 1.0, logistic_derivative)),
+    (Functions.BackPropagation, [test_input, test_output, test_error], {'error_matrix':test_error_matrix}, {'learning_rate':RAND1}, None,
+     backprop_helper(test_input, test_output, test_error, test_error_matrix, RAND1, logistic_derivative)),
+    (Functions.BackPropagation, [test_input, test_output, test_error], {'error_matrix':test_error_matrix},
+     {'activation_derivative_fct':TransferFunctions.Logistic(gain=RAND2, scale=RAND3).derivative}, None,
+     backprop_helper(test_input, test_output, test_error, test_error_matrix, 1.0, scaled_logistic_derivative)),
+    (Functions.BackPropagation, [test_input, test_output, test_error], {'error_matrix':test_error_matrix},
+     {'activation_derivative_fct':TransferFunctions.Linear(slope=RAND2).derivative}, None,
+     backprop_helper(test_input, test_output, test_error, test_error_matrix, 1.0, lambda x: RAND2)),
+    (Functions.BackPropagation, [test_input_l, test_output, test_error_s], {'error_matrix':test_error_matrix_s}, {'learning_rate':RAND1},
+     "CUDA execution needs all items of the variable to have the same shape",
+     backprop_helper(test_input_l, test_output, test_error_s, test_error_matrix_s, RAND1, logistic_derivative)),
+    (Functions.Hebbian, test_activity, {}, {}, None, hebbian_helper(test_activity, 0.05)),
+    (Functions.Hebbian, test_activity, {}, {'learning_rate':RAND1}, None, hebbian_helper(test_activity, RAND1)),
+    (Functions.Hebbian, test_activity, {}, {'learning_rate':test_rate_1d}, None,
+     hebbian_helper(test_activity, test_rate_1d)),
+    (Functions.Hebbian, test_activity, {}, {'learning_rate':test_rate_2d}, None,
+     hebbian_helper(test_activity, test_rate_2d)),
+    (Functions.ContrastiveHebbian, test_activity, {}, {'learning_rate':RAND1}, None,
+     hebbian_helper(test_activity, RAND1)),
+    (Functions.Kohonen, [test_input, test_activity, test_weights], {}, {'learning_rate':RAND1},
+     "CUDA execution needs all items of the variable to have the same shape",
+     kohonen_helper([test_input, test_activity, test_weights], RAND1, gaussian_distance)),
+    (Functions.Kohonen, [test_input, test_activity, test_weights], {},
+     {'learning_rate':RAND1, 'distance_function':kw.LINEAR},
+     "CUDA execution needs all items of the variable to have the same shape",
+     kohonen_helper([test_input, test_activity, test_weights], RAND1, lambda x: x)),
+    (Functions.Kohonen, [test_input, test_activity, test_weights], {},
+     {'learning_rate':RAND1, 'distance_function':kw.EXPONENTIAL},
+     "CUDA execution needs all items of the variable to have the same shape",
+     kohonen_helper([test_input, test_activity, test_weights], RAND1, np.exp)),
+    (Functions.Reinforcement, [test_input, test_choice, test_reward], {}, {},
+     "CUDA execution needs all items of the variable to have the same shape",
+     reinforcement_helper(test_choice, test_reward, 0.05)),
+    (Functions.Reinforcement, [test_input_l, test_choice, test_reward], {}, {'learning_rate':RAND1},
+     "CUDA execution needs all items of the variable to have the same shape",
+     reinforcement_helper(test_choice, test_reward, RAND1)),
+    (Functions.TDLearning, [test_input, test_activity, test_td_error], {}, {'learning_rate':RAND1}, None,
+     reinforcement_helper(test_activity, test_td_error, RAND1)),
+]
+
+# use list, naming function produces ugly names
+names = [
+    "BACKPROPAGATION",
+    "BACKPROPAGATION LEARNING_RATE",
+    "BACKPROPAGATION LOGISTIC DERIVATIVE",
+    "BACKPROPAGATION LINEAR DERIVATIVE",
+    "BACKPROPAGATION DIFFERENT SIZES",
+    "HEBBIAN",
+    "HEBBIAN LEARNING_RATE",
+    "HEBBIAN LEARNING_RATE 1D",
+    "HEBBIAN LEARNING_RATE 2D",
+    "CONTRASTIVE_HEBBIAN",
+    "KOHONEN GAUSSIAN",
+    "KOHONEN LINEAR",
+    "KOHONEN EXPONENTIAL",
+    "REINFORCEMENT",
+    "REINFORCEMENT LEARNING_RATE",
+    "TDLEARNING",
+]
+
+@pytest.mark.function
+@pytest.mark.learning_function
+@pytest.mark.parametrize("func, variable, call_args, params, cuda_fail, expected", test_data, ids=names)
+@pytest.mark.benchmark
+def test_basic(func, variable, call_args, params, cuda_fail, expected, benchmark):
+    f = func(default_variable=variable, **params)
+    benchmark.group = "LearningFunction " + func.componentName;
+    res = f.function(variable, **call_args)
+    benchmark(f.function, variable, **call_args)
+    assert all(np.allclose(r, e) for r, e in zip(res, expected))
+
+
+@pytest.mark.llvm
+@pytest.mark.function
+@pytest.mark.learning_function
+@pytest.mark.parametrize("func, variable, call_args, params, cuda_fail, expected", test_data, ids=names)
+@pytest.mark.benchmark
+def test_llvm(func, variable, call_args, params, cuda_fail, expected, benchmark):
+    f = func(default_variable=variable, **params)
+    # arguments of function (e.g. error_matrix) are stored as parameters for compiled execution
+    f.function(variable, **call_args)
+    benchmark.group = "LearningFunction " + func.componentName;
+    m = pnlvm.execution.FuncExecution(f)
+    res = m.execute(variable)
+    benchmark(m.execute, variable)
+    assert all(np.allclose(r, e) for r, e in zip(res, expected))
+
+@pytest.mark.llvm
+@pytest.mark.cuda
+@pytest.mark.function
+@pytest.mark.learning_function
+@pytest.mark.parametrize("func, variable, call_args, params, cuda_fail, expected", test_data, ids=names)
+@pytest.mark.benchmark
+def test_ptx_cuda(func, variable, call_args, params, cuda_fail, expected, benchmark):
+    if cuda_fail is not None:
+        pytest.xfail(cuda_fail)
+
+    f = func(default_variable=variable, **params)
+    f.function(variable, **call_args)
+    benchmark.group = "LearningFunction " + func.componentName;
+    m = pnlvm.execution.FuncExecution(f)
+    res = m.cuda_execute(variable)
+    benchmark(m.cuda_execute, variable)
+    assert all(np.allclose(r, e) for r, e in zip(res, expected))
@@ -1,4 +1,5 @@
 import numpy as np
+import psyneulink as pnl
 import psyneulink.core.llvm as pnlvm
 import psyneulink.core.components.functions.transferfunctions as Functions
 import psyneulink.core.globals.keywords as kw
@@ -113,3 +114,63 @@ def test_ptx_cuda(func, variable, params, fail, expected, benchmark):
     res = m.cuda_execute(variable)
     benchmark(m.cuda_execute, variable)
     assert np.allclose(res, expected)
+
+
+def _sparse_matrix(sparse, rows, cols):
+    return sparse.random(rows, cols, density=0.3, format='csr', random_state=0)
+
+sparse_shapes = [(SIZE, SIZE), (SIZE, 3 * SIZE), (SIZE, SIZE // 4)]
+sparse_names = ["SQUARE", "WIDE", "TALL"]
+
+@pytest.mark.function
+@pytest.mark.transfer_function
+@pytest.mark.parametrize("shape", sparse_shapes, ids=sparse_names)
+def test_linear_matrix_sparse(shape):
+    sparse = pytest.importorskip("scipy.sparse")
+    matrix = _sparse_matrix(sparse, *shape)
+
+    f = Functions.LinearMatrix(default_variable=test_var, matrix=matrix)
+    assert sparse.isspmatrix_csr(f.matrix)
+    res = f.function(test_var)
+    assert np.allclose(res, np.dot(test_var, matrix.toarray()))
+
+@pytest.mark.llvm
+@pytest.mark.function
+@pytest.mark.transfer_function
+@pytest.mark.parametrize("shape", sparse_shapes, ids=sparse_names)
+def test_linear_matrix_sparse_llvm(shape):
+    sparse = pytest.importorskip("scipy.sparse")
+    matrix = _sparse_matrix(sparse, *shape)
+
+    f = Functions.LinearMatrix(default_variable=test_var, matrix=matrix)
+    m = pnlvm.execution.FuncExecution(f)
+    res = m.execute(test_var)
+    assert np.allclose(res, np.dot(test_var, matrix.toarray()))
+
+@pytest.mark.llvm
+@pytest.mark.function
+@pytest.mark.transfer_function
+def test_linear_matrix_sparse_empty_llvm():
+    sparse = pytest.importorskip("scipy.sparse")
+    matrix = sparse.csr_matrix((SIZE, SIZE))
+
+    f = Functions.LinearMatrix(default_variable=test_var, matrix=matrix)
+    m = pnlvm.execution.FuncExecution(f)
+    res = m.execute(test_var)
+    assert np.allclose(res, np.zeros(SIZE))
+
+@pytest.mark.function
+@pytest.mark.transfer_function
+def test_linear_matrix_sparse_projection_unsupported():
+    sparse = pytest.importorskip("scipy.sparse")
+    matrix = _sparse_matrix(sparse, SIZE, SIZE)
+
+    A = pnl.TransferMechanism(size=SIZE)
+    B = pnl.TransferMechanism(size=SIZE)
+    with pytest.raises(pnl.MappingError) as error:
+        pnl.MappingProjection(sender=A, receiver=B, matrix=matrix)
+    assert "sparse matrices are only supported" in str(error.value)
+
+    with pytest.raises(pnl.RecurrentTransferError) as error:
+        pnl.RecurrentTransferMechanism(size=SIZE, matrix=matrix)
+    assert "sparse matrices are not supported" in str(error.value)
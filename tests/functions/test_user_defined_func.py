@@ -1,12 +1,16 @@
 import numpy as np
 import pytest
 
+import psyneulink.core.llvm as pnlvm
+
+from psyneulink.core.components.functions.function import FunctionError
 from psyneulink.core.components.functions.transferfunctions import Linear, Logistic
 from psyneulink.core.components.functions.userdefinedfunction import UserDefinedFunction
 from psyneulink.core.components.mechanisms.processing import ProcessingMechanism
 from psyneulink.core.components.mechanisms.processing import TransferMechanism
 from psyneulink.core.components.process import Process
 from psyneulink.core.components.system import System
+from psyneulink.core.compositions.composition import Composition
 
 class TestUserDefFunc:
 
@@ -113,3 +117,109 @@ class TestUserDefFunc:
     def test_autogenerated_udf_parameters_states_have_source(self, mech_with_autogenerated_udf):
         for p in mech_with_autogenerated_udf.parameter_states:
             assert p.source is mech_with_autogenerated_udf.function
+
+
+def udf_arithmetic(variable, p=2.0, q=[1.0, 2.0]):
+    return variable * p + q
+
+
+def udf_loop(variable):
+    acc = 0
+    for i in range(len(variable[0])):
+        acc += variable[0][i] ** 2
+    return acc
+
+
+def udf_dot(variable, w=[[1.0, 2.0], [3.0, 4.0]]):
+    return np.dot(variable[0], w)
+
+
+def udf_branch(variable):
+    result = variable * 0
+    for i in range(len(variable[0])):
+        if variable[0][i] > 0:
+            result[0][i] = np.exp(variable[0][i])
+        else:
+            result[0][i] = np.tanh(variable[0][i])
+    return result
+
+
+def udf_ufuncs(variable):
+    return np.maximum(variable, 0.5) + (variable > 1) - np.sum(variable) / len(variable[0]) + max(variable[0])
+
+
+def udf_iterate(variable):
+    total = 0.0
+    for x in variable[0]:
+        total = total + abs(x) % 2
+    return [total, np.min(variable), -variable[0][-1]]
+
+
+class TestUserDefFuncCompiled:
+
+    @pytest.mark.function
+    @pytest.mark.llvm
+    @pytest.mark.parametrize("func, variable", [
+        (udf_arithmetic, [[1.0, -2.0]]),
+        (udf_loop, [[1.0, 2.0, 3.0]]),
+        (udf_dot, [[1.0, 2.0]]),
+        (udf_branch, [[-1.0, 2.0]]),
+        (udf_ufuncs, [[-1.0, 2.0, 1.5]]),
+        (udf_iterate, [[-1.5, 2.5, 3.0]]),
+        (lambda x: x * 2 + 1, [[1.0, 2.0]]),
+    ], ids=["arithmetic", "loop", "dot", "branch", "ufuncs", "iterate", "lambda"])
+    def test_udf_llvm(self, func, variable):
+        U = UserDefinedFunction(custom_function=func, default_variable=variable, compile_function=True)
+        e = pnlvm.execution.FuncExecution(U)
+        res = e.execute(variable)
+        assert np.allclose(res, U.function(np.asfarray(variable)))
+
+    @pytest.mark.function
+    @pytest.mark.llvm
+    def test_udf_llvm_unsupported(self):
+        L = Logistic()
+
+        def myFunction(variable):
+            return L(variable[0][1:])
+
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]], compile_function=True)
+        with pytest.raises(FunctionError) as error:
+            pnlvm.execution.FuncExecution(U)
+        assert "unsupported slice" in str(error.value)
+
+    @pytest.mark.function
+    @pytest.mark.llvm
+    def test_udf_llvm_not_enabled(self):
+        U = UserDefinedFunction(custom_function=udf_arithmetic, default_variable=[[0, 0]])
+        with pytest.raises(FunctionError) as error:
+            pnlvm.execution.FuncExecution(U)
+        assert "compile_function=True" in str(error.value)
+
+    @pytest.mark.composition
+    @pytest.mark.parametrize("mode", ['Python',
+                                      pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_udf_composition(self, mode):
+        U = UserDefinedFunction(custom_function=udf_branch, default_variable=[[0, 0]], compile_function=True)
+        myMech = ProcessingMechanism(function=U, size=2, name='myMech')
+        T = TransferMechanism(size=2, function=Linear(slope=2))
+        c = Composition()
+        c.add_linear_processing_pathway([myMech, T])
+        val = c.run(inputs={myMech: [[-1, 2]]}, bin_execute=mode)
+        assert np.allclose(val, [[2 * np.tanh(-1), 2 * np.exp(2)]])
+
+    @pytest.mark.composition
+    @pytest.mark.llvm
+    def test_udf_composition_fallback(self):
+        L = Logistic()
+
+        def myFunction(variable):
+            return L(variable)
+
+        U = UserDefinedFunction(custom_function=myFunction, default_variable=[[0, 0]], compile_function=True)
+        myMech = ProcessingMechanism(function=U, size=2, name='myMech')
+        c = Composition()
+        c.add_node(myMech)
+        val = c.run(inputs={myMech: [[-1, 2]]}, bin_execute=True)
+        assert np.allclose(val, L([-1, 2]))
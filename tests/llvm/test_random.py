@@ -2,8 +2,11 @@
 
 import ctypes
 import numpy as np
+import os
 import pytest
 import random
+import subprocess
+import sys
 
 from psyneulink.core import llvm as pnlvm
 
@@ -137,3 +140,51 @@ def test_random_normal(benchmark, mode):
         benchmark(gen_fun.cuda_call, gpu_state, gpu_out)
 
     assert np.allclose(res, 0.4644982638709743)
+
+
+# The precision is selected at import time, so these run in a separate interpreter
+_FLOAT32_CODE = """
+import ctypes
+import numpy as np
+from psyneulink.core import llvm as pnlvm
+from psyneulink.core.components.functions.distributionfunctions import NormalDist
+
+assert pnlvm.builder_context.float_precision == 'float32'
+
+init_fun = pnlvm.LLVMBinaryFunction.get('__pnl_builtin_mt_rand_init')
+state = init_fun.byref_arg_types[0]()
+init_fun(state, {seed})
+
+gen_fun = pnlvm.LLVMBinaryFunction.get('__pnl_builtin_mt_rand_double')
+out = gen_fun.byref_arg_types[1]()
+assert isinstance(out, ctypes.c_float)
+res = []
+for _ in range(1000):
+    gen_fun(state, out)
+    res.append(out.value)
+assert all(0.0 <= r < 1.0 for r in res)
+assert np.allclose(res, np.random.RandomState(np.asarray([{seed}])).random_sample(1000), rtol=1e-6, atol=1e-7)
+
+f = NormalDist(seed={seed})
+e = pnlvm.execution.FuncExecution(f)
+res = [e.execute(f.defaults.variable) for _ in range(10)]
+assert np.allclose(res, [f.function() for _ in range(10)], rtol=1e-5, atol=1e-6)
+"""
+
+
+@pytest.mark.llvm
+def test_random_float32_precision():
+    env = dict(os.environ, PNL_LLVM_PRECISION='float32')
+    subprocess.check_call([sys.executable, '-c', _FLOAT32_CODE.format(seed=SEED)], env=env)
+
+
+@pytest.mark.llvm
+def test_unknown_precision_warning():
+    env = dict(os.environ, PNL_LLVM_PRECISION='float16')
+    code = ("import warnings\n"
+            "with warnings.catch_warnings(record=True) as w:\n"
+            "    warnings.simplefilter('always')\n"
+            "    from psyneulink.core import llvm as pnlvm\n"
+            "assert any(\"Unknown LLVM precision 'float16'\" in str(x.message) for x in w)\n"
+            "assert pnlvm.builder_context.float_precision == 'float64'\n")
+    subprocess.check_call([sys.executable, '-c', code], env=env)
@@ -4,6 +4,7 @@ import pytest
 
 import psyneulink.core.components.functions.learningfunctions
 import psyneulink.core.components.functions.transferfunctions
+import psyneulink.core.llvm as pnlvm
 
 
 class TestContrastiveHebbian:
@@ -219,3 +220,130 @@ class TestContrastiveHebbian:
                                              [[2.84093837]],
                                              [[3.0510183]],
                                              [[3.35234623]]])
+
+
+class TestContrastiveHebbianCompiled:
+
+    @pytest.mark.mechanism
+    @pytest.mark.contrastive_hebbian_mechanism
+    @pytest.mark.parametrize('mode', ['Python',
+                                      pytest.param('LLVM', marks=pytest.mark.llvm)])
+    @pytest.mark.parametrize('params, expected', [
+        ({}, [[0.72951978, 0.62154091], [0.72951978, 0.62154091, 0.79002558], [0.00154433, 0.00091929, 0.00392781]]),
+        ({'continuous': False},
+         [[0.72797545, 0.62062162], [0.72797545, 0.62062162, 0.78345871], [0., 0., -0.00263906]]),
+        ({'clamp': pnl.SOFT_CLAMP},
+         [[0.93833383, 0.90547245], [0.93833383, 0.90547245, 0.85934838], [0.00212201, 0.00281469, 0.00353954]]),
+        ({'minus_phase_termination_condition': pnl.COUNT, 'minus_phase_termination_criterion': 1.0,
+          'plus_phase_termination_condition': pnl.COUNT, 'plus_phase_termination_criterion': 10.0},
+         [[0.73096257, 0.62240196], [0.73096257, 0.62240196, 0.79431376], [0.10850323, 0.06022545, 0.17185443]]),
+        ({'integrator_mode': False, 'clip': [0.2, 0.6]}, [[0.6, 0.6], [0.6, 0.6, 0.6], [0., 0., 0.]]),
+    ], ids=['convergence', 'not_continuous', 'soft_clamp', 'count', 'clip'])
+    def test_contrastive_hebbian_settle(self, mode, params, expected):
+        args = dict(input_size=2, hidden_size=1, target_size=2, separated=False,
+                    integrator_mode=True, function=pnl.Logistic)
+        args.update(params)
+        m = pnl.ContrastiveHebbianMechanism(**args)
+        if mode == 'Python':
+            c = pnl.Composition()
+            c.add_node(m)
+            c.run(inputs={m: [[1, 0.5]]},
+                  termination_processing={pnl.TimeScale.TRIAL: pnl.WhenFinished(m),
+                                          pnl.TimeScale.RUN: pnl.Never()})
+            val = [s.parameters.value.get(c) for s in m.output_states]
+        elif mode == 'LLVM':
+            # Each compiled execution is a single pass of the current phase
+            ex = pnlvm.execution.MechExecution(m)
+            val = ex.execute([[1, 0.5], [0, 0, 0]])
+            while not m.is_finished():
+                val = ex.execute([[1, 0.5], [0, 0, 0]])
+
+        for v, e in zip(val, expected):
+            assert np.allclose(v, e)
+
+    @pytest.mark.mechanism
+    @pytest.mark.contrastive_hebbian_mechanism
+    @pytest.mark.parametrize('mode', ['Python',
+                                      pytest.param('LLVM', marks=pytest.mark.llvm)])
+    def test_contrastive_hebbian_separated_target(self, mode):
+        m = pnl.ContrastiveHebbianMechanism(input_size=2, hidden_size=1, target_size=2, separated=True,
+                                            integrator_mode=True, function=pnl.Logistic)
+        if mode == 'Python':
+            # INPUT and TARGET are internal InputStates, feed them from other Mechanisms
+            i = pnl.TransferMechanism(size=2)
+            t = pnl.TransferMechanism(size=2)
+            c = pnl.Composition()
+            for node in (i, t, m):
+                c.add_node(node)
+            c.add_projection(pnl.MappingProjection(sender=i, receiver=m.input_states[pnl.INPUT]), i, m)
+            c.add_projection(pnl.MappingProjection(sender=t, receiver=m.input_states[pnl.TARGET]), t, m)
+            c.run(inputs={i: [[1, 0.5]], t: [[0, 1]]},
+                  termination_processing={pnl.TimeScale.TRIAL: pnl.WhenFinished(m),
+                                          pnl.TimeScale.RUN: pnl.Never()})
+            val = [s.parameters.value.get(c) for s in m.output_states]
+        elif mode == 'LLVM':
+            ex = pnlvm.execution.MechExecution(m)
+            val = ex.execute([[1, 0.5], [0, 0, 0, 0, 0], [0, 1]])
+            while not m.is_finished():
+                val = ex.execute([[1, 0.5], [0, 0, 0, 0, 0], [0, 1]])
+
+        expected = [[0.50609947, 0.73430718],
+                    [0.73103458, 0.62244499, 0.93382693, 0.50609947, 0.73430718],
+                    [0.00305913, 0.00182337, -0.02400811, -0.45173556, -0.22352786]]
+        for v, e in zip(val, expected):
+            assert np.allclose(v, e)
+
+    @pytest.mark.composition
+    @pytest.mark.contrastive_hebbian_mechanism
+    @pytest.mark.parametrize('mode', [pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    @pytest.mark.parametrize('params', [{},
+                                        {'continuous': False},
+                                        {'minus_phase_termination_condition': pnl.COUNT,
+                                         'minus_phase_termination_criterion': 1.0,
+                                         'plus_phase_termination_condition': pnl.COUNT,
+                                         'plus_phase_termination_criterion': 3.0}],
+                             ids=['convergence', 'not_continuous', 'count'])
+    def test_contrastive_hebbian_composition(self, mode, params):
+        # Compiled execution runs one pass of the current phase per execution,
+        # the same as Python, so every trial gives the same results
+        results = {}
+        for m_mode in ('Python', mode):
+            m = pnl.ContrastiveHebbianMechanism(input_size=2, hidden_size=1, target_size=2, separated=False,
+                                                integrator_mode=True, function=pnl.Logistic, **params)
+            c = pnl.Composition()
+            c.add_node(m)
+            phases = []
+            c.run(inputs={m: [[1, 0.5]]}, num_trials=12, bin_execute=m_mode,
+                  call_after_trial=lambda: phases.append(m.parameters.execution_phase.get(c)))
+            results[m_mode] = (c.results, phases, m.is_finished(c))
+
+        python_results, python_phases, python_finished = results['Python']
+        results, phases, finished = results[mode]
+        assert len(results) == len(python_results)
+        for res, python_res in zip(results, python_results):
+            for r, p in zip(res, python_res):
+                assert np.allclose(r, p)
+        # Trials of LLVMRun are not visible to Python
+        if mode != 'LLVMRun':
+            assert phases == python_phases
+        assert finished == python_finished
+
+    @pytest.mark.composition
+    @pytest.mark.contrastive_hebbian_mechanism
+    @pytest.mark.parametrize('mode', ['Python',
+                                      pytest.param('LLVM', marks=pytest.mark.llvm)])
+    def test_contrastive_hebbian_when_finished(self, mode):
+        # is_finished is copied back from the compiled state, so WhenFinished can schedule the trials
+        m = pnl.ContrastiveHebbianMechanism(input_size=2, hidden_size=1, target_size=2, separated=False,
+                                            integrator_mode=True, function=pnl.Logistic)
+        c = pnl.Composition()
+        c.add_node(m)
+        c.run(inputs={m: [[1, 0.5]]}, num_trials=2, bin_execute=mode,
+              termination_processing={pnl.TimeScale.TRIAL: pnl.WhenFinished(m),
+                                      pnl.TimeScale.RUN: pnl.Never()})
+        assert m.is_finished(c)
+        assert np.allclose(c.results[0][1], [0.72951978, 0.62154091, 0.79002558])
+        assert np.allclose(c.results[0][2], [0.00154433, 0.00091929, 0.00392781])
+        assert np.allclose(c.results[1][1], [0.72951978, 0.62154091, 0.79002558])
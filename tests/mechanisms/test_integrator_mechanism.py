@@ -1079,8 +1079,8 @@ class TestIntegratorNoise:
 
         val2 = float(I.execute(0))
 
-        np.testing.assert_allclose(val, 9.02272212012359)
-        np.testing.assert_allclose(val2, 5.950088417525589)
+        np.testing.assert_allclose(val, 7.446472730598476)
+        np.testing.assert_allclose(val2, 5.302845918582278)
 
     @pytest.mark.mechanism
     @pytest.mark.integrator_mechanism
@@ -1095,7 +1095,7 @@ class TestIntegratorNoise:
 
         val = I.execute([10, 10, 10, 10])[0]
 
-        np.testing.assert_allclose(val, [10.44386323, 10.33367433, 11.49407907, 9.79484174])
+        np.testing.assert_allclose(val, [9.18237729, 8.60774914, 10.66053518, 11.10887925])
 
     @pytest.mark.mechanism
     @pytest.mark.integrator_mechanism
@@ -1109,7 +1109,7 @@ class TestIntegratorNoise:
 
         val = float(I.execute(10))
 
-        np.testing.assert_allclose(val, -0.977277879876411)
+        np.testing.assert_allclose(val, -2.5535272694015236)
 
     @pytest.mark.mechanism
     @pytest.mark.integrator_mechanism
@@ -1123,7 +1123,7 @@ class TestIntegratorNoise:
         )
 
         val = I.execute([10, 10, 10, 10])[0]
-        np.testing.assert_allclose(val, [0.44386323, 0.33367433, 1.49407907, -0.20515826])
+        np.testing.assert_allclose(val, [-0.81762271, -1.39225086, 0.66053518, 1.10887925])
 
     @pytest.mark.mechanism
     @pytest.mark.integrator_mechanism
@@ -1137,7 +1137,7 @@ class TestIntegratorNoise:
 
         val = float(I.execute(10))
 
-        np.testing.assert_allclose(val, 9.02272212012359)
+        np.testing.assert_allclose(val, 7.446472730598476)
 
     @pytest.mark.mechanism
     @pytest.mark.integrator_mechanism
@@ -1152,7 +1152,7 @@ class TestIntegratorNoise:
 
         val = I.execute([10, 10, 10, 10])[0]
 
-        np.testing.assert_allclose(val, [10.44386323, 10.33367433, 11.49407907, 9.79484174])
+        np.testing.assert_allclose(val, [9.18237729, 8.60774914, 10.66053518, 11.10887925])
 
     @pytest.mark.mechanism
     @pytest.mark.integrator_mechanism
@@ -2,11 +2,14 @@ import pytest
 
 import numpy as np
 
+import psyneulink.core.llvm as pnlvm
+
 from psyneulink.core.components.component import ComponentError
 from psyneulink.core.components.functions.transferfunctions import Linear, Logistic
 from psyneulink.core.components.mechanisms.mechanism import MechanismError
 from psyneulink.core.components.process import Process
 from psyneulink.core.components.system import System
+from psyneulink.core.compositions.composition import Composition
 from psyneulink.core.globals.keywords import MATRIX_KEYWORD_VALUES, RANDOM_CONNECTIVITY_MATRIX
 from psyneulink.core.globals.preferences.componentpreferenceset import REPORT_OUTPUT_PREF, VERBOSE_PREF
 from psyneulink.core.globals.utilities import UtilitiesError
@@ -516,6 +519,48 @@ class TestKWTAAverageBased:
         s.run(inputs=kwta_input)
         assert np.allclose(K.parameters.value.get(s), [[-1.4, -0.3999999999999999, 0.6000000000000001, 1.6]])
 
+class TestKWTACompiled:
+
+    @pytest.mark.mechanism
+    @pytest.mark.kwta
+    @pytest.mark.parametrize('mode', ['Python',
+                                      pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('PTX', marks=[pytest.mark.llvm, pytest.mark.cuda])])
+    @pytest.mark.parametrize('k_value, ratio, average_based, expected', [
+        (2, 0.5, False, [[1.5, -1.5, 0.5, -0.5]]),
+        (0.25, 0.2, False, [[0.2, -2.8, -0.8, -1.8]]),
+        (4, 0.5, False, [[3, 0, 2, 1]]),
+        (1, 0.8, True, [[1.6, -1.4, 0.6, -0.4]]),
+    ], ids=['k_2', 'k_fraction', 'k_all', 'average'])
+    def test_kwta_scaling(self, mode, k_value, ratio, average_based, expected):
+        K = KWTAMechanism(size=4, k_value=k_value, threshold=0, ratio=ratio,
+                          average_based=average_based, function=Linear)
+        if mode == 'Python':
+            EX = K.execute
+        elif mode == 'LLVM':
+            EX = pnlvm.execution.MechExecution(K).execute
+        elif mode == 'PTX':
+            EX = pnlvm.execution.MechExecution(K).cuda_execute
+
+        val = EX([[4, 1, 3, 2]])
+        assert np.allclose(val, expected)
+
+    @pytest.mark.composition
+    @pytest.mark.kwta
+    @pytest.mark.parametrize('mode', ['Python',
+                                      pytest.param('LLVM', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMExec', marks=pytest.mark.llvm),
+                                      pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_kwta_size_10_k_3_threshold_1_composition(self, mode):
+        K = KWTAMechanism(name='K', size=10, k_value=3, threshold=1)
+        c = Composition()
+        c.add_node(K)
+        c.run(inputs={K: [[-1, -.5, 0, 0, 0, 1, 1, 2, 3, 3]]}, num_trials=20, bin_execute=mode)
+        assert np.allclose(c.results[-1], [[0.012938850123312412, 0.022127587008877226, 0.039010157367582114,
+                                            0.039010157367582114, 0.039010157367582114, 0.19055156271846602,
+                                            0.19055156271846602, 0.969124504436019, 0.9895271824560731,
+                                            0.9895271824560731]])
+
 # class TestClip:
 #     def test_clip_float(self):
 #         K = KWTA(clip=[-2.0, 2.0],
@@ -13,10 +13,12 @@ from psyneulink.core.components.mechanisms.mechanism import MechanismError
 from psyneulink.core.components.mechanisms.processing.transfermechanism import TransferError, TransferMechanism
 from psyneulink.core.components.process import Process
 from psyneulink.core.components.system import System
+from psyneulink.core.compositions.composition import Composition
 from psyneulink.core.globals.keywords import MATRIX_KEYWORD_VALUES, RANDOM_CONNECTIVITY_MATRIX
 from psyneulink.core.globals.preferences.componentpreferenceset import REPORT_OUTPUT_PREF, VERBOSE_PREF
 from psyneulink.core.globals.utilities import UtilitiesError
-from psyneulink.core.scheduling.condition import Never
+from psyneulink.core.scheduling.condition import Never, While
+from psyneulink.core.scheduling.time import TimeScale
 from psyneulink.library.components.mechanisms.processing.transfer.recurrenttransfermechanism import RECURRENT_OUTPUT, RecurrentTransferError, RecurrentTransferMechanism
 from psyneulink.library.components.projections.pathway.autoassociativeprojection import AutoAssociativeProjection
 
@@ -1128,3 +1130,31 @@ class TestCustomCombinationFunction:
         )
         result = R2.execute([1,2])
         np.testing.assert_allclose(result, [[0,0]])
+
+class TestExecuteUntilConverged:
+
+    @pytest.mark.composition
+    @pytest.mark.recurrent_transfer_mechanism
+    @pytest.mark.llvm
+    @pytest.mark.parametrize('mode', ['LLVM', 'LLVMExec', 'LLVMRun'])
+    def test_recurrent_mech_execute_until_converged(self, mode):
+        results = []
+        for bin_execute in (False, mode):
+            R = RecurrentTransferMechanism(size=2,
+                                           function=Logistic,
+                                           hetero=-0.5,
+                                           integrator_mode=True,
+                                           convergence_criterion=0.001,
+                                           execute_until_converged=True)
+            c = Composition()
+            c.add_node(R)
+            if bin_execute:
+                # Compiled execution converges in the only pass of the trial
+                c.run(inputs={R: [[1.0, 0.5]]}, bin_execute=bin_execute)
+            else:
+                converged = While(lambda execution_context: bool(R.is_converged(execution_id=execution_context)))
+                c.run(inputs={R: [[1.0, 0.5]]}, termination_processing={TimeScale.RUN: Never(),
+                                                                     TimeScale.TRIAL: converged})
+            results.append(c.results[-1])
+
+        assert np.allclose(results[0], results[1])
@@ -1,8 +1,11 @@
 import collections
+import os
 import numpy as np
 import pytest
+import subprocess
+import sys
 
-from psyneulink.core.globals.utilities import convert_all_elements_to_np_array, prune_unused_args
+from psyneulink.core.globals.utilities import convert_all_elements_to_np_array, lazy_import, prune_unused_args
 
 
 @pytest.mark.parametrize(
@@ -67,3 +70,45 @@ def test_prune_unused_args(func, args, kwargs, expected_pruned_args, expected_pr
 
     assert pruned_args == expected_pruned_args
     assert pruned_kwargs == expected_pruned_kwargs
+
+
+def test_lazy_import():
+    assert lazy_import('collections') is collections
+    assert lazy_import('psyneulink_no_such_module') is None
+
+
+def test_package_import_defers_heavy_dependencies():
+    # Run in a separate interpreter, the modules are already imported in this one
+    code = ('import sys, psyneulink, psyneulink.core.llvm as pnlvm; '
+            'torch = sys.modules.get("torch"); '
+            'assert torch is None or type(torch) is not type(sys), "torch executed"; '
+            'assert "PIL.Image" not in sys.modules, "PIL imported"; '
+            'assert "graphviz" not in sys.modules, "graphviz imported"; '
+            'assert not pnlvm._builtins_initialized, "LLVM builtins generated"')
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def test_lazy_attributes_export_pytorch_model_creator():
+    pytest.importorskip('torch')
+    # Run in a separate interpreter, so that the first access is the one that imports torch
+    code = ('import sys, psyneulink as pnl; '
+            'torch = sys.modules.get("torch"); '
+            'assert torch is None or type(torch) is not type(sys), "torch executed"; '
+            'assert "PytorchModelCreator" in dir(pnl); '
+            'from psyneulink.library.compositions.pytorchmodelcreator import PytorchModelCreator; '
+            'assert pnl.PytorchModelCreator is PytorchModelCreator; '
+            'assert pnl.library.compositions.PytorchModelCreator is PytorchModelCreator')
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+@pytest.mark.parametrize('typecheck, decorated', [('1', True), ('0', False)])
+def test_typecheck_switch(typecheck, decorated):
+    # Decorators are applied at import time, so this needs a separate interpreter
+    code = ('import typecheck, psyneulink as pnl; '
+            'from psyneulink.core.components.projections.pathway import mappingprojection; '
+            'assert pnl.typecheck_enabled is {0}; '
+            'undecorated = pnl.MappingProjection.__init__.__code__.co_filename == mappingprojection.__file__; '
+            'assert undecorated is not {0}; '
+            'assert typecheck.typecheck(lambda x: x) is not None').format(decorated)
+    env = dict(os.environ, PNL_TYPECHECK=typecheck)
+    subprocess.check_call([sys.executable, '-c', code], env=env)
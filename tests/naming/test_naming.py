@@ -228,3 +228,55 @@ class TestNaming:
         assert C1.name == 'Composition-0'
         assert C2.name == 'Composition-1'
         assert C3.name == 'Composition-2'
+
+    def test_default_name_after_assigned_default_style_name(self):
+        T1 = pnl.TransferMechanism()
+        T2 = pnl.TransferMechanism(name='TransferMechanism-1')
+        T3 = pnl.TransferMechanism()
+        T4 = pnl.TransferMechanism()
+
+        assert T1.name == 'TransferMechanism-0'
+        assert T2.name == 'TransferMechanism-1'
+        assert T3.name == 'TransferMechanism-2'
+        assert T4.name == 'TransferMechanism-3'
+
+    def test_unregistered_anonymous_instances(self):
+        pnl.register_anonymous_instances(False)
+        try:
+            T1 = pnl.TransferMechanism()
+            T2 = pnl.TransferMechanism()
+            T3 = pnl.TransferMechanism(name='MY NAME')
+            T4 = pnl.TransferMechanism(name='MY NAME')
+        finally:
+            pnl.register_anonymous_instances(True)
+
+        assert T1.name == 'TransferMechanism-0'
+        assert T2.name == 'TransferMechanism-1'
+        assert T3.name == 'MY NAME'
+        assert T4.name == 'MY NAME-1'
+
+        instance_dict = pnl.MechanismRegistry['TransferMechanism'].instanceDict
+        assert 'TransferMechanism-1' not in instance_dict
+        assert 'MY NAME-1' in instance_dict
+
+    def test_unregistered_anonymous_states_objective_mechanism(self):
+        T = pnl.TransferMechanism(name='T')
+        pnl.register_anonymous_instances(False)
+        try:
+            O = pnl.ObjectiveMechanism(monitor=[T])
+        finally:
+            pnl.register_anonymous_instances(True)
+
+        assert O.input_states[0].name == 'Value of T [RESULTS]'
+        assert 'Value of T [RESULTS]' in O._stateRegistry[pnl.INPUT_STATE].instanceDict
+
+    def test_unregistered_anonymous_states_remove_states(self):
+        pnl.register_anonymous_instances(False)
+        try:
+            T = pnl.TransferMechanism(input_states=[pnl.InputState(), pnl.InputState()])
+        finally:
+            pnl.register_anonymous_instances(True)
+
+        T.remove_states(T.input_states[1])
+        assert len(T.input_states) == 1
+        assert T._stateRegistry[pnl.INPUT_STATE].instanceCount == 1